@@ -0,0 +1,80 @@
+"""
+Database Migration: Move interview answers into the interview_answers table
+
+Answers used to be a JSON list in interview_sessions.answers, rewritten in full
+on every submission. They are now stored one row each in interview_answers.
+This migration:
+1. creates the interview_answers table (and its session/ordinal index)
+2. copies the JSON answers of every session that has no answer rows yet
+
+The JSON column is left as it is. Run this script once after deploying the
+answers table; running it again only copies sessions it has not seen.
+Use --dry-run to only report what would change.
+"""
+
+import sys
+import json
+from sqlalchemy import text, inspect
+from app.database import engine
+from app.models import AnswerRecord
+from app.interview_flow.answer_store import parse_legacy_answers
+
+def run_migration(dry_run: bool = False):
+    """Create interview_answers and backfill it from interview_sessions.answers"""
+    try:
+        print(f"Starting migration: interview_answers table{' (dry run)' if dry_run else ''}...")
+
+        if not dry_run:
+            AnswerRecord.__table__.create(bind=engine, checkfirst=True)
+            print("✓ interview_answers table ready")
+
+        with engine.connect() as conn:
+            migrated = set()
+            if inspect(engine).has_table("interview_answers"):
+                migrated = {row[0] for row in conn.execute(text("SELECT DISTINCT session_id FROM interview_answers"))}
+
+            sessions = conn.execute(text("SELECT id, answers FROM interview_sessions WHERE answers IS NOT NULL")).fetchall()
+            copied_sessions = 0
+            copied_answers = 0
+            for session_id, answers_raw in sessions:
+                if session_id in migrated:
+                    continue
+                if isinstance(answers_raw, str):
+                    answers_raw = json.loads(answers_raw)
+                answers = parse_legacy_answers(answers_raw)
+                if not answers:
+                    continue
+
+                if not dry_run:
+                    conn.execute(
+                        AnswerRecord.__table__.insert(),
+                        [
+                            {
+                                "session_id": session_id,
+                                "ordinal": ordinal,
+                                "question_id": answer.question_id,
+                                "answer_text": answer.answer_text,
+                                "time_spent": answer.time_spent,
+                                "submitted_at": answer.submitted_at,
+                                "is_timeout": answer.is_timeout,
+                                "ai_score": answer.ai_score,
+                                "ai_explanation": answer.ai_explanation
+                            }
+                            for ordinal, answer in enumerate(answers)
+                        ]
+                    )
+                copied_sessions += 1
+                copied_answers += len(answers)
+
+            if not dry_run:
+                conn.commit()
+
+        print(f"✓ {copied_answers} answers of {copied_sessions} sessions copied ({len(migrated)} sessions already migrated)")
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration(dry_run="--dry-run" in sys.argv)
@@ -9,6 +9,107 @@ load_dotenv(dotenv_path=env_path)
 class Settings:
     SPACY_MODEL: str = "en_core_web_sm"
     TRANSFORMER_MODEL: str = "all-MiniLM-L6-v2"
+    # Skill vocabulary (canonical name -> aliases); empty means the bundled data file
+    SKILL_VOCABULARY_PATH: str = os.getenv("SKILL_VOCABULARY_PATH", "")
+    # Skill ontology (abstract term -> concrete skills); empty means the bundled data file
+    ONTOLOGY_PATH: str = os.getenv("ONTOLOGY_PATH", "")
+    ONTOLOGY_CACHE_DIR: str = os.getenv("ONTOLOGY_CACHE_DIR", str(Path(__file__).parent.parent / "cache" / "ontology"))
+    ONTOLOGY_RELOAD_INTERVAL: float = float(os.getenv("ONTOLOGY_RELOAD_INTERVAL", "5"))  # Seconds between file checks
+    # Ontology concepts whose skills are inferred per phrase (1 = best match only)
+    SKILL_MAPPER_TOP_K: int = int(os.getenv("SKILL_MAPPER_TOP_K", "1"))
+    # spaCy noun-chunk extraction over several CVs (SkillExtractor.extract_many)
+    SPACY_BATCH_SIZE: int = int(os.getenv("SPACY_BATCH_SIZE", "16"))
+    SPACY_N_PROCESS: int = int(os.getenv("SPACY_N_PROCESS", "1"))  # >1 forks spaCy workers inside an analysis worker
+    # Route each CV to a pipeline for its detected language (en/ru/uz). SPACY_MODEL serves English;
+    # other languages use "lang:package" entries below, or the tokenizer only when they have none
+    SPACY_LANGUAGE_ROUTING: bool = os.getenv("SPACY_LANGUAGE_ROUTING", "1") == "1"
+    SPACY_LANGUAGE_MODELS: str = os.getenv("SPACY_LANGUAGE_MODELS", "")
+    SPACY_MEMORY_BUDGET_MB: float = float(os.getenv("SPACY_MEMORY_BUDGET_MB", "512"))  # LRU eviction above this; 0 = unlimited
+    # spaCy and the embedding model only see these CV sections (explicit skills are matched in the
+    # whole text); CVs without recognizable headings are processed in full
+    CV_SECTION_FILTER: bool = os.getenv("CV_SECTION_FILTER", "1") == "1"
+    CV_SKILL_SECTIONS: str = os.getenv("CV_SKILL_SECTIONS", "skills,experience,projects,summary,certificates")
+    # Resume validation diagnostics (one JSON line per upload): OFF, DEBUG, INFO, WARNING
+    CV_VALIDATION_LOG_LEVEL: str = os.getenv("CV_VALIDATION_LOG_LEVEL", "OFF")
+    
+    # PDF text extraction budgets (per document)
+    # Page worker processes per analysis worker (started inside its parser sandbox when PARSER_SANDBOX=1);
+    # 0 = serial in-process (the timeout can't interrupt a page then)
+    PDF_PARSE_WORKERS: int = int(os.getenv("PDF_PARSE_WORKERS", str(min(2, os.cpu_count() or 1))))
+    PDF_MAX_PAGES: int = int(os.getenv("PDF_MAX_PAGES", "30"))
+    PDF_MAX_CHARS: int = int(os.getenv("PDF_MAX_CHARS", "200000"))
+    PDF_TIMEOUT_SECONDS: float = float(os.getenv("PDF_TIMEOUT_SECONDS", "30"))  # Text read until then is kept
+    # Parse each CV in a separate sandbox process (one per analysis worker) with a memory cap and a
+    # hard wall-clock timeout, so a malformed or decompression-bomb file only kills that process
+    PARSER_SANDBOX: bool = os.getenv("PARSER_SANDBOX", "1") == "1"
+    PARSER_SANDBOX_MEMORY_MB: int = int(os.getenv("PARSER_SANDBOX_MEMORY_MB", "1024"))  # RLIMIT_AS above start-up size; 0 = no cap
+    PARSER_SANDBOX_TIMEOUT_SECONDS: float = float(os.getenv("PARSER_SANDBOX_TIMEOUT_SECONDS", str(PDF_TIMEOUT_SECONDS + 15)))
+    PARSER_SANDBOX_MAX_TASKS: int = int(os.getenv("PARSER_SANDBOX_MAX_TASKS", "50"))  # Files per process before it is recycled
+    
+    # Embedding backend for SkillMapper: "torch" (fp32 sentence-transformers) or "onnx-int8"
+    # (quantized ONNX Runtime export of the same model, created once under EMBEDDING_ONNX_DIR)
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "torch")
+    EMBEDDING_ONNX_DIR: str = os.getenv("EMBEDDING_ONNX_DIR", str(Path(__file__).parent.parent / "cache" / "onnx"))
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+    EMBEDDING_THREADS: int = int(os.getenv("EMBEDDING_THREADS", "0"))  # 0 = ONNX Runtime default
+    # An int8 export is rejected if any parity phrase drifts below this cosine vs fp32
+    EMBEDDING_PARITY_MIN_COSINE: float = float(os.getenv("EMBEDDING_PARITY_MIN_COSINE", "0.95"))
+    
+    # Phrase embedding cache for SkillMapper (memory LRU + shared on-disk tier)
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "1") == "1"
+    EMBEDDING_CACHE_DIR: str = os.getenv("EMBEDDING_CACHE_DIR", str(Path(__file__).parent.parent / "cache" / "embeddings"))
+    EMBEDDING_CACHE_MEMORY_ITEMS: int = int(os.getenv("EMBEDDING_CACHE_MEMORY_ITEMS", "20000"))
+    EMBEDDING_CACHE_DISK_ITEMS: int = int(os.getenv("EMBEDDING_CACHE_DISK_ITEMS", "200000"))
+    
+    # Background CV analysis (process pool)
+    ANALYSIS_WORKERS: int = int(os.getenv("ANALYSIS_WORKERS", "2"))
+    ANALYSIS_QUEUE_SIZE: int = int(os.getenv("ANALYSIS_QUEUE_SIZE", "32"))  # Max queued + running jobs
+    # Candidate phrase generator: "parser" (spaCy noun chunks), "fast" (tokenizer n-grams) or
+    # "auto" (fast once SKILL_EXTRACTION_FAST_QUEUE_DEPTH jobs are pending); requests may override it
+    SKILL_EXTRACTION_MODE: str = os.getenv("SKILL_EXTRACTION_MODE", "auto")
+    SKILL_EXTRACTION_FAST_QUEUE_DEPTH: int = int(os.getenv("SKILL_EXTRACTION_FAST_QUEUE_DEPTH", str(ANALYSIS_QUEUE_SIZE // 2)))
+    ANALYSIS_JOB_HISTORY: int = int(os.getenv("ANALYSIS_JOB_HISTORY", "500"))  # Finished jobs kept for status lookups
+    # How often /analyze checks whether its client is still connected; gone clients' jobs are cancelled
+    ANALYSIS_DISCONNECT_POLL_SECONDS: float = float(os.getenv("ANALYSIS_DISCONNECT_POLL_SECONDS", "0.5"))
+    # Retry-After (seconds) sent by CV endpoints while the worker models are still loading
+    ANALYSIS_WARMUP_RETRY_AFTER: int = int(os.getenv("ANALYSIS_WARMUP_RETRY_AFTER", "10"))
+    
+    # Batch CV import (/analyze-batch)
+    BATCH_MAX_FILES: int = int(os.getenv("BATCH_MAX_FILES", "500"))
+    BATCH_MAX_FILE_MB: int = int(os.getenv("BATCH_MAX_FILE_MB", "20"))
+    # Jobs one batch may keep in flight; leaves queue room for interactive /analyze calls
+    BATCH_MAX_IN_FLIGHT: int = int(os.getenv("BATCH_MAX_IN_FLIGHT", str(2 * ANALYSIS_WORKERS)))
+    # CVs analyzed together by one worker job, so spaCy processes them as one batch
+    BATCH_CHUNK_SIZE: int = int(os.getenv("BATCH_CHUNK_SIZE", "8"))
+    
+    # In-memory interview sessions (SessionManager). Sessions with a running question are pinned;
+    # finished and database-hydrated ones are evicted LRU / after the TTL and reloaded on demand
+    SESSION_CACHE_MAX_SIZE: int = int(os.getenv("SESSION_CACHE_MAX_SIZE", "500"))
+    SESSION_CACHE_TTL_SECONDS: float = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "1800"))  # 0 = no TTL
+    # Pinned sessions untouched this long (abandoned interviews) are dropped too, and so is the
+    # in-process state of an interview this long past its question's deadline; 0 = never
+    SESSION_CACHE_ABANDONED_SECONDS: float = float(os.getenv("SESSION_CACHE_ABANDONED_SECONDS", "86400"))
+    
+    # Where running interviews keep their current question and deadline: "memory" (this process only,
+    # so a single API worker) or "sqlite" (a file shared by all workers on the host: --workers N)
+    SESSION_STATE_BACKEND: str = os.getenv("SESSION_STATE_BACKEND", "memory")
+    SESSION_STATE_PATH: str = os.getenv("SESSION_STATE_PATH", str(Path(__file__).parent.parent / "cache" / "session_state.sqlite"))
+    # Milliseconds a state write waits for another worker's lock before the request fails (writes are single rows)
+    SESSION_STATE_BUSY_TIMEOUT_MS: int = int(os.getenv("SESSION_STATE_BUSY_TIMEOUT_MS", "1000"))
+    
+    # Database connection pools (per engine: sync, async and the read-only admin engine)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # Seconds to wait for a free connection
+    # SQLite profile, applied to every connection: WAL (readers and the writer don't block each other),
+    # synchronous=NORMAL (durable in WAL mode except for the last commits on power loss), and a wait
+    # of SQLITE_BUSY_TIMEOUT_MS for the write lock instead of failing with "database is locked"
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_MMAP_SIZE_MB: int = int(os.getenv("SQLITE_MMAP_SIZE_MB", "256"))  # Memory-mapped reads; 0 = off
+    SQLITE_CACHE_SIZE_MB: int = int(os.getenv("SQLITE_CACHE_SIZE_MB", "64"))  # Page cache per connection
+    # Admin/reporting reads (/admin/sessions); empty means the main database through read-only connections
+    READ_DATABASE_URL: str = os.getenv("READ_DATABASE_URL", "")
     
     # SMTP Settings
     SMTP_SERVER: str = os.getenv("SMTP_SERVER", "smtp.gmail.com")
@@ -0,0 +1,407 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from app.cv_intelligence.skill_extractor import EXTRACTION_MODES
+from app.cv_intelligence.cv_analyzer import AnalysisCancelled
+from app.cv_intelligence.schemas import AnalysisJob, AnalysisJobStatus, AnalysisMetrics, CVAnalysisResult, ComponentState, ComponentHealth
+from app.config import settings
+
+# Components loaded by each worker (keys of CVAnalyzer.load_times)
+WORKER_COMPONENTS = ("parser", "spacy", "sentence_transformer")
+
+# Per-worker analyzer, created once by the pool initializer
+_worker_analyzer = None
+# Cancellation flags shared with the API process, one per queue slot
+_cancel_flags = None
+
+def _init_worker():
+    """Loads the CV analysis models once per worker process."""
+    global _worker_analyzer
+    from app.cv_intelligence.cv_analyzer import CVAnalyzer
+    _worker_analyzer = CVAnalyzer()
+
+def _init_worker_process(initializer: Optional[Callable], cancel_flags):
+    global _cancel_flags
+    _cancel_flags = cancel_flags
+    if initializer is not None:
+        initializer()
+
+def is_cancelled(cancel_slot: Optional[int]) -> bool:
+    """Whether the API process cancelled the job holding this slot (call from worker tasks)."""
+    return cancel_slot is not None and _cancel_flags is not None and _cancel_flags[cancel_slot] == 1
+
+def _analyze_in_worker(file_path: str, extraction_mode: str = "parser", cancel_slot: Optional[int] = None) -> CVAnalysisResult:
+    return _worker_analyzer.analyze(file_path, extraction_mode=extraction_mode, should_cancel=lambda: is_cancelled(cancel_slot))
+
+def _analyze_many_in_worker(
+    file_paths: List[str],
+    extraction_mode: str = "parser",
+    cancel_slot: Optional[int] = None
+) -> List[Union[CVAnalysisResult, Exception]]:
+    return _worker_analyzer.analyze_many(file_paths, extraction_mode=extraction_mode, should_cancel=lambda: is_cancelled(cancel_slot))
+
+def _warm_up_worker() -> Dict[str, float]:
+    """Runs once models are loaded (the initializer runs first); reports their load times."""
+    return dict(_worker_analyzer.load_times)
+
+class AnalysisQueueFull(Exception):
+    """Raised when the analysis queue has no free slots."""
+    pass
+
+class AnalysisJobManager:
+    """
+    Runs CV analysis in a dedicated process pool so parsing, spaCy and the
+    embedding model never block the API event loop.
+    Jobs get an ID immediately; status and results are kept in a bounded history.
+
+    Jobs can be cancelled: queued ones are dropped, running ones see a flag in
+    shared memory (one per queue slot) and stop at the next pipeline stage.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = settings.ANALYSIS_WORKERS,
+        max_queue: int = settings.ANALYSIS_QUEUE_SIZE,
+        history_size: int = settings.ANALYSIS_JOB_HISTORY,
+        worker_initializer: Optional[Callable] = _init_worker,
+        worker_task: Callable = _analyze_in_worker,
+        warm_up_task: Callable = _warm_up_worker,
+        worker_batch_task: Callable = _analyze_many_in_worker,
+        extraction_mode: str = settings.SKILL_EXTRACTION_MODE,
+        fast_queue_depth: int = settings.SKILL_EXTRACTION_FAST_QUEUE_DEPTH
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(1, max_queue)
+        self.history_size = history_size
+        self.worker_initializer = worker_initializer
+        self.worker_task = worker_task
+        self.warm_up_task = warm_up_task
+        self.worker_batch_task = worker_batch_task
+        self.extraction_mode = extraction_mode
+        self.fast_queue_depth = fast_queue_depth
+
+        # Model warm-up state, reported by /health/ready
+        self.state = ComponentState.PENDING
+        self.load_seconds: Optional[float] = None
+        self.component_load_times: Dict[str, float] = {}
+        self.error: Optional[str] = None
+
+        self.jobs: "OrderedDict[str, AnalysisJob]" = OrderedDict()
+        self._futures: Dict[str, Future] = {}
+        # Exceptions of failed jobs in the history, re-raised by wait() with their original type
+        self._errors: Dict[str, BaseException] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # Every pending job or batch holds a slot; its flag is set to cancel it while running
+        self._cancel_flags = multiprocessing.get_context("spawn").RawArray("b", self.max_queue)
+        self._free_slots = list(range(self.max_queue))
+        self._slots: Dict[str, int] = {}
+        self._lock = threading.RLock()  # Done callbacks run in the executor's management thread
+        self.metrics_counters = AnalysisMetrics(pending=0)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: workers must not inherit torch/tokenizer thread state from the API process
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_process,
+                initargs=(self.worker_initializer, self._cancel_flags)
+            )
+        return self._executor
+
+    async def warm_up(self):
+        """
+        Start every worker and wait until each has loaded its models.
+        Runs as a background task at startup, so the API serves other requests meanwhile.
+        """
+        self.state = ComponentState.LOADING
+        self.error = None
+        start = time.perf_counter()
+        try:
+            # With the spawn context, each submit beyond the idle workers starts a new process
+            executor = self._get_executor()
+            futures = [asyncio.wrap_future(executor.submit(self.warm_up_task)) for _ in range(self.max_workers)]
+            reports = await asyncio.gather(*futures)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.state = ComponentState.FAILED
+            self.error = str(e) or e.__class__.__name__
+            print(f"CV analysis models failed to load: {self.error}")
+            return
+
+        # Workers load in parallel: a component is as slow as its slowest worker
+        for report in reports:
+            for name, seconds in report.items():
+                self.component_load_times[name] = max(seconds, self.component_load_times.get(name, 0.0))
+        self.load_seconds = time.perf_counter() - start
+        self.state = ComponentState.READY
+        print(f"CV analysis workers ready in {self.load_seconds:.1f}s")
+
+    def is_ready(self) -> bool:
+        return self.state == ComponentState.READY
+
+    def health(self) -> List[ComponentHealth]:
+        """Per-component load state: the worker pool and each model it loads."""
+        components = [ComponentHealth(
+            name="analysis_workers",
+            state=self.state,
+            load_seconds=round(self.load_seconds, 3) if self.load_seconds is not None else None,
+            error=self.error
+        )]
+        for name in WORKER_COMPONENTS:
+            seconds = self.component_load_times.get(name)
+            if seconds is None:
+                # Not reported yet: the component shares the state of the pool loading it
+                components.append(ComponentHealth(name=name, state=self.state))
+            else:
+                components.append(ComponentHealth(name=name, state=ComponentState.READY, load_seconds=round(seconds, 3)))
+        return components
+
+    def pending_count(self) -> int:
+        """Number of jobs queued or running."""
+        return len(self._futures)
+
+    def resolve_extraction_mode(self, requested: Optional[str] = None) -> str:
+        """
+        Candidate generator for the next job: the requested one, else the configured
+        default; "auto" picks "fast" while SKILL_EXTRACTION_FAST_QUEUE_DEPTH jobs are pending.
+        """
+        mode = requested or self.extraction_mode
+        if mode == "auto":
+            mode = "fast" if self.pending_count() >= self.fast_queue_depth else "parser"
+        if mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode '{mode}'. Use auto, {', '.join(EXTRACTION_MODES)}")
+        return mode
+
+    def submit(self, file_path: str, cv_path: Optional[str] = None, extraction_mode: Optional[str] = None) -> AnalysisJob:
+        """
+        Queue a CV for analysis and return its job immediately.
+
+        Raises:
+            AnalysisQueueFull: If max_queue jobs are already pending
+            ValueError: Unknown extraction mode
+        """
+        if self.pending_count() >= self.max_queue:
+            raise AnalysisQueueFull(f"Analysis queue is full ({self.max_queue} jobs pending)")
+        # Before anything is registered, so a rejected request leaves no job or slot behind
+        mode = self.resolve_extraction_mode(extraction_mode)
+
+        job = AnalysisJob(
+            job_id=str(uuid.uuid4()),
+            status=AnalysisJobStatus.QUEUED,
+            cv_path=cv_path,
+            created_at=datetime.now()
+        )
+        slot = self._take_slot(job.job_id)
+        try:
+            future = self._submit_to_pool(self.worker_task, file_path, mode, slot)
+        except Exception:
+            self._release_slot(job.job_id)
+            raise
+        self.jobs[job.job_id] = job
+        self._futures[job.job_id] = future
+        self.metrics_counters.submitted += 1
+        future.add_done_callback(lambda f, job_id=job.job_id: self._on_done(job_id, f))
+
+        self._prune_history()
+        return job
+
+    def _take_slot(self, key: str) -> int:
+        with self._lock:
+            slot = self._free_slots.pop()
+            self._cancel_flags[slot] = 0
+            self._slots[key] = slot
+            return slot
+
+    def _release_slot(self, key: str):
+        with self._lock:
+            slot = self._slots.pop(key, None)
+            if slot is not None:
+                self._free_slots.append(slot)
+
+    def _submit_to_pool(self, task: Callable, *args) -> Future:
+        try:
+            return self._get_executor().submit(task, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool
+            print("Analysis pool is broken, restarting workers...")
+            self._executor = None
+            return self._get_executor().submit(task, *args)
+
+    def submit_many(self, file_paths: List[str], extraction_mode: Optional[str] = None) -> Tuple[str, Future]:
+        """
+        Queue several CVs as one worker job (batched spaCy pass); await it with wait_many().
+        Takes one queue slot right away, so pending_count() counts it before the caller yields.
+
+        Raises:
+            AnalysisQueueFull: If max_queue jobs are already pending
+            ValueError: Unknown extraction mode
+        """
+        if self.pending_count() >= self.max_queue:
+            raise AnalysisQueueFull(f"Analysis queue is full ({self.max_queue} jobs pending)")
+
+        # Tracked like a job for queue accounting, but not listed in the job history
+        key = f"batch-{uuid.uuid4()}"
+        mode = self.resolve_extraction_mode(extraction_mode)
+        slot = self._take_slot(key)
+        try:
+            future = self._submit_to_pool(self.worker_batch_task, list(file_paths), mode, slot)
+        except Exception:
+            self._release_slot(key)
+            raise
+        self._futures[key] = future
+        self.metrics_counters.submitted += 1
+        future.add_done_callback(lambda f: self._on_done(key, f))
+        return key, future
+
+    async def wait_many(self, key: str, future: Future) -> List[Union[CVAnalysisResult, Exception]]:
+        """Await a job from submit_many(); per-file failures come back as exceptions in the list."""
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # The caller is gone (e.g. the client disconnected): stop the worker too
+            self.cancel(key)
+            raise
+
+    async def run_many(self, file_paths: List[str], extraction_mode: Optional[str] = None) -> List[Union[CVAnalysisResult, Exception]]:
+        """Analyze several CVs as one worker job and await them (submit_many + wait_many)."""
+        return await self.wait_many(*self.submit_many(file_paths, extraction_mode=extraction_mode))
+
+    def add_completed(self, result: CVAnalysisResult, cv_path: Optional[str] = None) -> AnalysisJob:
+        """Record a job that is already done, e.g. answered from the analysis store."""
+        now = datetime.now()
+        job = AnalysisJob(
+            job_id=str(uuid.uuid4()),
+            status=AnalysisJobStatus.DONE,
+            cv_path=cv_path,
+            created_at=now,
+            finished_at=now,
+            result=result
+        )
+        self.jobs[job.job_id] = job
+        self._prune_history()
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a pending job (or batch). A queued job never starts; a running
+        one stops before its next pipeline stage. Returns False if it already finished.
+        """
+        with self._lock:
+            future = self._futures.get(job_id)
+            if future is None or future.done():
+                return False
+            self.metrics_counters.cancel_requests += 1
+            if not future.cancel():
+                slot = self._slots.get(job_id)
+                if slot is not None:
+                    self._cancel_flags[slot] = 1
+            return True
+
+    def metrics(self) -> AnalysisMetrics:
+        return self.metrics_counters.copy(update={"pending": self.pending_count()})
+
+    def _on_done(self, job_id: str, future: Future):
+        # Runs in the executor's management thread (or in cancel(), for queued jobs)
+        with self._lock:
+            self._futures.pop(job_id, None)
+            self._release_slot(job_id)
+            error = future.exception() if not future.cancelled() else None
+            if future.cancelled():
+                self.metrics_counters.cancelled_queued += 1
+            elif isinstance(error, AnalysisCancelled):
+                self.metrics_counters.cancelled_running += 1
+            elif error:
+                self.metrics_counters.failed += 1
+            else:
+                self.metrics_counters.completed += 1
+
+        job = self.jobs.get(job_id)
+        if not job:
+            return
+
+        job.finished_at = datetime.now()
+        if future.cancelled() or isinstance(error, AnalysisCancelled):
+            job.status = AnalysisJobStatus.CANCELLED
+            job.error = "Cancelled"
+        elif error:
+            job.status = AnalysisJobStatus.FAILED
+            job.error = str(error)
+            job.error_reason = getattr(error, "reason", None)
+            self._errors[job_id] = error
+        else:
+            result = future.result()
+            if job.cv_path:
+                result.cv_path = job.cv_path
+            job.result = result
+            job.status = AnalysisJobStatus.DONE
+
+    def _prune_history(self):
+        """Drop the oldest finished jobs beyond the history size."""
+        overflow = len(self.jobs) - self.history_size
+        for job_id in list(self.jobs.keys()):
+            if overflow <= 0:
+                break
+            if job_id not in self._futures:
+                del self.jobs[job_id]
+                self._errors.pop(job_id, None)
+                overflow -= 1
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """Get the current state of a job."""
+        job = self.jobs.get(job_id)
+        if job and job.status == AnalysisJobStatus.QUEUED:
+            future = self._futures.get(job_id)
+            if future and future.running():
+                job.status = AnalysisJobStatus.RUNNING
+        return job
+
+    async def wait_for_slot(self):
+        """Wait until the queue has room for another job."""
+        while self.pending_count() >= self.max_queue:
+            pending = [asyncio.wrap_future(f) for f in list(self._futures.values())]
+            if pending:
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+    async def wait(self, job_id: str) -> CVAnalysisResult:
+        """
+        Await a job without blocking the event loop.
+        Re-raises the worker's exception (e.g. ValueError for non-resume files).
+        """
+        job = self.jobs.get(job_id)
+        if not job:
+            raise KeyError(f"Job {job_id} not found")
+
+        future = self._futures.get(job_id)
+        if future is not None:
+            await asyncio.wrap_future(future)
+
+        if job.status != AnalysisJobStatus.DONE:
+            error = self._errors.get(job_id)
+            if error is not None:
+                raise error
+            raise RuntimeError(job.error or f"Job {job_id} did not complete")
+        return job.result
+
+    async def run(self, file_path: str, cv_path: Optional[str] = None, extraction_mode: Optional[str] = None) -> CVAnalysisResult:
+        """Submit a CV and await its result; cancelling the caller cancels the job."""
+        job = self.submit(file_path, cv_path=cv_path, extraction_mode=extraction_mode)
+        try:
+            return await self.wait(job.job_id)
+        except asyncio.CancelledError:
+            self.cancel(job.job_id)
+            raise
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
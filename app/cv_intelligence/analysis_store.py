@@ -0,0 +1,65 @@
+import hashlib
+import json
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from app.database import SessionLocal
+from app.models import CVAnalysisRecord
+from app.cv_intelligence.schemas import CVAnalysisResult
+
+class CVAnalysisStore:
+    """
+    Content-addressed store of CV analysis results.
+    Results are keyed by the SHA-256 of the file bytes plus the analyzer/model
+    version tag, so a pipeline upgrade never serves stale analyses.
+    """
+
+    CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+    def __init__(self, version_tag: str, session_factory=SessionLocal):
+        self.version_tag = version_tag
+        self.session_factory = session_factory
+
+    @classmethod
+    def hash_file(cls, file_path: str) -> str:
+        """Compute the SHA-256 of a file without loading it into memory."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(cls.CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, content_hash: str) -> Optional[CVAnalysisResult]:
+        """Return the stored analysis for a content hash, or None."""
+        db = self.session_factory()
+        try:
+            record = db.query(CVAnalysisRecord).filter(
+                CVAnalysisRecord.content_hash == content_hash,
+                CVAnalysisRecord.analyzer_version == self.version_tag
+            ).first()
+            if not record or not record.result:
+                return None
+            return CVAnalysisResult(**record.result)
+        finally:
+            db.close()
+
+    def put(self, content_hash: str, result: CVAnalysisResult):
+        """Persist an analysis result. Existing entries for the same key are kept."""
+        db = self.session_factory()
+        try:
+            payload = json.loads(result.json())
+            payload["cv_path"] = None  # Same bytes may live under several upload paths
+            db.add(CVAnalysisRecord(
+                content_hash=content_hash,
+                analyzer_version=self.version_tag,
+                result=payload
+            ))
+            db.commit()
+        except IntegrityError:
+            # Another request stored the same analysis first
+            db.rollback()
+        finally:
+            db.close()
+
+    def get_for_file(self, file_path: str) -> Optional[CVAnalysisResult]:
+        """Hash a file and return its stored analysis, if any."""
+        return self.get(self.hash_file(file_path))
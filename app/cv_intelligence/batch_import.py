@@ -0,0 +1,110 @@
+import os
+import zlib
+import zipfile
+from typing import BinaryIO, Callable, List, Optional, Tuple
+from app.cv_intelligence.schemas import BatchItemResult, AnalysisJobStatus
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+COPY_CHUNK_SIZE = 1024 * 1024  # 1 MB
+# Reading one upload or archive entry failed: corrupt or truncated data (bad CRC, bad deflate stream),
+# encrypted or unsupported-compression entries, disk errors while saving. Only that file is rejected
+READ_ERRORS = (zipfile.BadZipFile, zlib.error, EOFError, OSError, RuntimeError, NotImplementedError)
+
+class FileTooLarge(ValueError):
+    pass
+
+def copy_limited(src: BinaryIO, dst: BinaryIO, max_bytes: Optional[int] = None, digest=None) -> int:
+    """
+    Copy a stream chunk by chunk, refusing to write more than max_bytes.
+    ZIP headers can lie about sizes, so the limit is enforced on the bytes actually read.
+    If a hashlib object is given as digest, it is updated with every chunk.
+    """
+    written = 0
+    while True:
+        chunk = src.read(COPY_CHUNK_SIZE)
+        if not chunk:
+            return written
+        written += len(chunk)
+        if max_bytes is not None and written > max_bytes:
+            raise FileTooLarge(f"File exceeds the {max_bytes // (1024 * 1024)} MB limit")
+        if digest is not None:
+            digest.update(chunk)
+        dst.write(chunk)
+
+def expand_batch(
+    uploads: List[Tuple[str, BinaryIO]],
+    save_stream: Callable[[BinaryIO, str, int], str],
+    max_files: int,
+    max_file_bytes: int
+) -> Tuple[List[Tuple[int, str, str]], List[BatchItemResult]]:
+    """
+    Expands uploaded files and ZIP archives into individual CV files on disk.
+    ZIP entries are streamed one at a time, so the archive is never loaded into memory.
+
+    Args:
+        uploads: (filename, binary stream) pairs as received
+        save_stream: Saves a stream with the given extension and size limit, returns its cv_path
+        max_files: Maximum number of CVs accepted per batch
+        max_file_bytes: Maximum uncompressed size of a single CV
+
+    Returns:
+        (accepted, rejected): accepted is a list of (index, filename, cv_path),
+        rejected holds a failed BatchItemResult per file that could not be stored
+    """
+    accepted: List[Tuple[int, str, str]] = []
+    rejected: List[BatchItemResult] = []
+    index = 0
+
+    def _reject(filename: str, error: str):
+        nonlocal index
+        rejected.append(BatchItemResult(index=index, filename=filename, status=AnalysisJobStatus.FAILED, error=error))
+        index += 1
+
+    def _store(filename: str, stream: BinaryIO):
+        nonlocal index
+        ext = os.path.splitext(filename)[1].lower()
+        if ext not in SUPPORTED_EXTENSIONS:
+            _reject(filename, "Unsupported file format. Please upload .pdf or .docx")
+            return
+        if len(accepted) >= max_files:
+            _reject(filename, f"Batch limit of {max_files} files reached")
+            return
+        try:
+            cv_path = save_stream(stream, ext, max_file_bytes)
+        except FileTooLarge as e:
+            _reject(filename, str(e))
+            return
+        except READ_ERRORS as e:
+            _reject(filename, f"Could not read file: {e}")
+            return
+        accepted.append((index, filename, cv_path))
+        index += 1
+
+    for filename, stream in uploads:
+        if os.path.splitext(filename)[1].lower() != ".zip":
+            _store(filename, stream)
+            continue
+
+        try:
+            archive = zipfile.ZipFile(stream)
+        except (zipfile.BadZipFile, EOFError, OSError):
+            _reject(filename, "Invalid ZIP archive")
+            continue
+
+        with archive:
+            for info in archive.infolist():
+                entry_name = info.filename
+                # Skip folders and macOS resource forks
+                if info.is_dir() or entry_name.startswith("__MACOSX/") or os.path.basename(entry_name).startswith("._"):
+                    continue
+                if info.file_size > max_file_bytes:
+                    _reject(entry_name, f"File exceeds the {max_file_bytes // (1024 * 1024)} MB limit")
+                    continue
+                try:
+                    with archive.open(info) as entry_stream:
+                        _store(entry_name, entry_stream)
+                except READ_ERRORS as e:
+                    # Encrypted or unsupported-compression entries (data errors are caught by _store)
+                    _reject(entry_name, f"Could not read archive entry: {e}")
+
+    return accepted, rejected
@@ -1,105 +1,259 @@
 from app.cv_intelligence.parser import CVParser
+from app.cv_intelligence.parser_sandbox import ParserSandbox
 from app.cv_intelligence.skill_extractor import SkillExtractor
 from app.cv_intelligence.skill_mapper import SkillMapper
-from app.cv_intelligence.schemas import CVAnalysisResult
+from app.cv_intelligence.schemas import CVAnalysisResult, CVSection, ResumeValidation
+from app.cv_intelligence.analysis_store import CVAnalysisStore
+from app.cv_intelligence.ontology import DEFAULT_ONTOLOGY_PATH, read_ontology_version
+from app.cv_intelligence.language import detect_language, DEFAULT_LANGUAGE
+from app.cv_intelligence.nlp_models import parse_language_models
+from app.cv_intelligence.sections import segment_sections, section_text
+from app.cv_intelligence.validation import validate_resume
 from app.config import settings
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import re
+import time
+
+class AnalysisCancelled(Exception):
+    """Raised between pipeline stages once the caller no longer wants the result."""
+    pass
+
+def _check_cancelled(should_cancel: Optional[Callable[[], bool]], next_stage: str):
+    if should_cancel is not None and should_cancel():
+        print(f"CV analysis cancelled before {next_stage}")
+        raise AnalysisCancelled(f"Analysis cancelled before {next_stage}")
 
 class CVAnalyzer:
+    # Bump whenever parsing/extraction/mapping logic changes so stored analyses are recomputed
+    ANALYZER_VERSION = "4"
+
     def __init__(self):
         print("Initializing CV Analyzer components...")
-        self.parser = CVParser()
-        self.extractor = SkillExtractor(model=settings.SPACY_MODEL)
+        # Seconds spent loading each component, reported by the readiness endpoint
+        self.load_times: Dict[str, float] = {}
+
+        start = time.perf_counter()
+        self.parser = CVParser(sandbox=ParserSandbox() if settings.PARSER_SANDBOX else None)
+        self.load_times["parser"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.extractor = SkillExtractor(
+            model=settings.SPACY_MODEL,
+            vocabulary_path=settings.SKILL_VOCABULARY_PATH or None,
+            language_models=parse_language_models(settings.SPACY_LANGUAGE_MODELS),
+            memory_budget_mb=settings.SPACY_MEMORY_BUDGET_MB
+        )
+        self.load_times["spacy"] = time.perf_counter() - start
+
+        start = time.perf_counter()
         self.mapper = SkillMapper(model_name=settings.TRANSFORMER_MODEL)
-        print("CV Analyzer ready.")
+        self.load_times["sentence_transformer"] = time.perf_counter() - start
 
-    def _validate_resume(self, text: str) -> bool:
+        self.store = CVAnalysisStore(self.version_tag())
+        print(f"CV Analyzer ready in {sum(self.load_times.values()):.1f}s.")
+
+    @classmethod
+    def version_tag(cls) -> str:
         """
-        Validates if the provided text looks like a resume.
-        Diagnostic logging added to help debug remote access issues and unexpected rejections.
+        Identifies the analyzer and model versions behind a result.
+        Computable without loading any model, so readers can query the store cheaply.
         """
-        if not text:
-            print("[VALIDATION_DEBUG] Empty text provided.")
-            return False
-
-        char_count = len(text.strip())
-        if char_count < 50:
-            print(f"[VALIDATION_DEBUG] Text too short: {char_count} chars.")
-            return False
-
-        text_lower = text.lower()
-        
-        # 1. Essential Resume Section Markers (RU, UZ, EN)
-        resume_markers = [
-            "experience", "work history", "employment", "projects", "education", "skills", "technologies", "certificates", "languages", "summary", "profile", "cv", "resume", "curriculum vitae", "university", "college", "job", "career", "training",
-            "опыт работы", "образование", "навыки", "технологии", "проекты", "курсы", "сертификаты", "о себе", "контакты", "личные данные", "резюме", "телефон", "почта", "разработка", "работа",
-            "ish tajribasi", "ma'lumoti", "ko'nikmalar", "loyihalar", "kurslar", "sertifikatlar", "til", "aloqa", "rabota", "telefon", "manzil"
-        ]
-        
-        found_markers = [m for m in resume_markers if m in text_lower]
-        marker_count = len(found_markers)
-        
-        # 2. Contact Info Check
-        has_email = bool(re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text))
-        has_phone = bool(re.search(r'\+?\d{9,15}', text))
-        
-        # 3. Date Pattern Check
-        has_years = bool(re.search(r'\b(19|20)\d{2}\b', text))
+        ontology_version = read_ontology_version(settings.ONTOLOGY_PATH or DEFAULT_ONTOLOGY_PATH)
+        tag = (
+            f"cv-analyzer:{cls.ANALYZER_VERSION}|spacy:{settings.SPACY_MODEL}"
+            f"|st:{settings.TRANSFORMER_MODEL}|ontology:{ontology_version}"
+        )
+        if settings.EMBEDDING_BACKEND != "torch":
+            tag += f"|emb:{settings.EMBEDDING_BACKEND}"
+        if settings.SKILL_MAPPER_TOP_K != 1:
+            tag += f"|topk:{settings.SKILL_MAPPER_TOP_K}"
+        if settings.SPACY_LANGUAGE_ROUTING:
+            tag += f"|lang:{settings.SPACY_LANGUAGE_MODELS or 'tokenizer'}"
+        if settings.CV_SECTION_FILTER:
+            tag += f"|sections:{settings.CV_SKILL_SECTIONS}"
+        return tag
 
-        # Scoring heuristics (Threshold = 20)
-        validation_score = 0
-        
-        # Contact info is VERY strong signal
-        if has_email or has_phone:
-            validation_score += 20
-        
-        if marker_count >= 2: validation_score += 20
-        elif marker_count >= 1: validation_score += 10
-        
-        if has_years: validation_score += 10
-
-        # Special check for "fairy tales" (Long text with low markers)
-        if char_count > 3000 and marker_count < 3:
-            print(f"[VALIDATION_DEBUG] Detected long document ({char_count}) but low marker density ({marker_count}). Potential non-CV.")
-            validation_score -= 15
-
-        # DIAGNOSTIC LOGGING
-        print(f"--- [CV VALIDATION DIAGNOSTICS] ---")
-        print(f"Length: {char_count} chars")
-        print(f"Markers Found ({marker_count}): {found_markers[:10]}{'...' if marker_count > 10 else ''}")
-        print(f"Has Email: {has_email}, Has Phone: {has_phone}, Has Years: {has_years}")
-        print(f"Final Validation Score: {validation_score} (Needed: 20)")
-        print(f"-----------------------------------")
-        
-        return validation_score >= 20
+    def _validate_resume(self, text: str) -> bool:
+        """Validates if the provided text looks like a resume (see validation.validate_resume)."""
+        return validate_resume(text).is_resume
 
-    def analyze(self, file_path: str) -> CVAnalysisResult:
+    def analyze(
+        self,
+        file_path: str,
+        use_cache: bool = True,
+        extraction_mode: str = "parser",
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> CVAnalysisResult:
         """
         Orchestrates the CV analysis process:
+        0. Return the stored analysis if this exact file was analyzed before
         1. Parse text from file
         2. Validate if it's a resume
         3. Extract explicit skills and semantic candidates
         4. Map candidates to inferred skills
-        5. Return structured result
+        5. Store and return structured result
+
+        extraction_mode "fast" skips the dependency parser (see SkillExtractor);
+        its results are returned but not stored, so the CV gets a full analysis next time.
+
+        should_cancel is polled between stages (a running stage is not interrupted);
+        once it returns True, AnalysisCancelled is raised and nothing is stored.
         """
+        # Pick up ontology edits; results of the new ontology are stored under a new tag
+        if self.mapper.ontology.maybe_reload():
+            self.store.version_tag = self.version_tag()
+
+        content_hash = None
+        if use_cache:
+            try:
+                content_hash = self.store.hash_file(file_path)
+                cached = self.store.get(content_hash)
+                if cached:
+                    print(f"Using stored analysis for {file_path} ({content_hash[:12]})")
+                    return cached
+            except FileNotFoundError:
+                raise
+            except Exception as e:
+                print(f"CV analysis store lookup failed: {e}")
+
+        result = self._run_pipeline(file_path, extraction_mode, should_cancel)
+
+        if content_hash and extraction_mode == "parser":
+            try:
+                self.store.put(content_hash, result)
+            except Exception as e:
+                print(f"CV analysis store write failed: {e}")
+
+        return result
+
+    def analyze_many(
+        self,
+        file_paths: List[str],
+        use_cache: bool = True,
+        extraction_mode: str = "parser",
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> List[Union[CVAnalysisResult, Exception]]:
+        """
+        Analyzes several CVs with one batched spaCy pass over all of them.
+        Returns one entry per file, in order: its result, or the exception
+        analyze() would have raised for it (a bad file never fails the others).
+        Cancellation (see analyze) abandons the whole batch with AnalysisCancelled.
+        """
+        if self.mapper.ontology.maybe_reload():
+            self.store.version_tag = self.version_tag()
+
+        outcomes: List[Union[CVAnalysisResult, Exception, None]] = [None] * len(file_paths)
+        content_hashes: List[Union[str, None]] = [None] * len(file_paths)
+        texts: Dict[int, str] = {}
+        validations: Dict[int, ResumeValidation] = {}
+        for i, file_path in enumerate(file_paths):
+            if use_cache:
+                try:
+                    content_hashes[i] = self.store.hash_file(file_path)
+                    cached = self.store.get(content_hashes[i])
+                    if cached:
+                        print(f"Using stored analysis for {file_path} ({content_hashes[i][:12]})")
+                        outcomes[i] = cached
+                        continue
+                except FileNotFoundError as e:
+                    outcomes[i] = e
+                    continue
+                except Exception as e:
+                    print(f"CV analysis store lookup failed: {e}")
+            try:
+                texts[i], validations[i] = self._parse_and_validate(file_path, should_cancel)
+            except AnalysisCancelled:
+                raise
+            except Exception as e:
+                outcomes[i] = e
+
+        _check_cancelled(should_cancel, "skill extraction")
+        print(f"Extracting skills from {len(texts)} CVs...")
+        languages = [self._language(text) for text in texts.values()]
+        sections = [segment_sections(text) for text in texts.values()]
+        extractions = self.extractor.extract_many(
+            list(texts.values()),
+            mode=extraction_mode,
+            languages=languages,
+            candidate_texts=[self._skill_text(text, s) for text, s in zip(texts.values(), sections)]
+        )
+        for (i, raw_text), extraction_result, language, cv_sections in zip(texts.items(), extractions, languages, sections):
+            try:
+                outcomes[i] = self._build_result(
+                    raw_text, extraction_result, extraction_mode, language, cv_sections, validations[i], should_cancel
+                )
+            except AnalysisCancelled:
+                raise
+            except Exception as e:
+                outcomes[i] = e
+                continue
+            if content_hashes[i] and extraction_mode == "parser":
+                try:
+                    self.store.put(content_hashes[i], outcomes[i])
+                except Exception as e:
+                    print(f"CV analysis store write failed: {e}")
+
+        return outcomes
+
+    def _run_pipeline(
+        self,
+        file_path: str,
+        extraction_mode: str = "parser",
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> CVAnalysisResult:
+        """Runs the full parse -> validate -> extract -> map pipeline."""
+        raw_text, validation = self._parse_and_validate(file_path, should_cancel)
+
+        # 3. Extract Skills
+        _check_cancelled(should_cancel, "skill extraction")
+        language = self._language(raw_text)
+        sections = segment_sections(raw_text)
+        skill_text = self._skill_text(raw_text, sections)
+        print(f"Extracting skills ({extraction_mode}, {language}, {len(skill_text)}/{len(raw_text)} chars)...")
+        extraction_result = self.extractor.extract(raw_text, mode=extraction_mode, language=language, candidate_text=skill_text)
+        return self._build_result(raw_text, extraction_result, extraction_mode, language, sections, validation, should_cancel)
+
+    def _language(self, text: str) -> str:
+        return detect_language(text) if settings.SPACY_LANGUAGE_ROUTING else DEFAULT_LANGUAGE
+
+    def _skill_text(self, text: str, sections: List[CVSection]) -> str:
+        """Text spaCy and the embedding model work on: the skill-bearing sections."""
+        if not settings.CV_SECTION_FILTER:
+            return text
+        return section_text(text, sections, settings.CV_SKILL_SECTIONS.split(","))
+
+    def _parse_and_validate(
+        self,
+        file_path: str,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> Tuple[str, ResumeValidation]:
         # 1. Parse Text
+        _check_cancelled(should_cancel, "parsing")
         print(f"Parsing file: {file_path}")
-        raw_text = self.parser.parse(file_path)
-        
-        # 2. Validate Resume
-        if not self._validate_resume(raw_text):
-            print(f"[VALIDATION_FAIL] File {file_path} does not look like a resume.")
+        # 2. Validate Resume (PDF pages are validated as they are extracted)
+        raw_text, validation = self.parser.parse_and_validate(file_path)
+        if not validation.is_resume:
+            print(f"[VALIDATION_FAIL] File {file_path} does not look like a resume (score {validation.score}/{validation.threshold}).")
             raise ValueError("The uploaded file does not look like a professional resume. Please provide a valid CV.")
+        return raw_text, validation
 
-        # 3. Extract Skills
-        print("Extracting skills...")
-        extraction_result = self.extractor.extract(raw_text)
+    def _build_result(
+        self,
+        raw_text: str,
+        extraction_result: Dict[str, List[str]],
+        extraction_mode: str,
+        language: str,
+        sections: List[CVSection],
+        validation: Optional[ResumeValidation] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> CVAnalysisResult:
         explicit_skills = extraction_result["explicit"]
         candidates = extraction_result["candidates"]
         
         # 3. Map Skills (Semantic Understanding)
+        _check_cancelled(should_cancel, "skill mapping")
         print("Mapping semantic skills...")
-        inferred_skills = self.mapper.map_skills(candidates)
+        inferred_skills = self.mapper.map_skills(candidates, top_k=settings.SKILL_MAPPER_TOP_K)
         
         # 4. Construct Result
         return CVAnalysisResult(
@@ -111,7 +265,11 @@ class CVAnalyzer:
                 "parsing": 1.0 if raw_text else 0.0,
                 "skill_extraction": 0.85 if explicit_skills else 0.1,
                 "semantic_inference": 0.75 if inferred_skills else 0.0
-            }
+            },
+            extraction_mode=extraction_mode,
+            language=language,
+            sections=sections,
+            validation=validation
         )
 
     def _estimate_experience(self, text: str) -> float | None:
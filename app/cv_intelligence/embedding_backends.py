@@ -0,0 +1,285 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+from typing import Dict, List, Optional
+import numpy as np
+
+BACKENDS = ("torch", "onnx-int8")
+
+# Fixed phrase set for the accuracy-parity check: CV-style noun chunks plus ontology-like terms
+PARITY_PHRASES = [
+    "modern javascript", "modern js features", "frontend frameworks", "backend experience",
+    "rest api design", "cloud native applications", "microservices architecture", "big data pipelines",
+    "data science stack", "machine learning models", "full stack development", "responsive design",
+    "state management", "database design", "ci/cd pipelines", "docker containers",
+    "kubernetes clusters", "team lead", "project management", "agile methodology",
+    "unit testing", "system architecture", "authentication and authorization", "caching layer",
+    "python developer", "java spring boot", "react native mobile apps", "sql query optimization",
+    "english language", "customer support", "veb-ilovalar yaratish", "опыт работы с базами данных"
+]
+
+def _patch_torch_pytree():
+    """
+    Compatibility shim for transformers releases that expect newer torch pytree helpers.
+    Applied right before sentence-transformers is imported, so importing the app never loads torch.
+    """
+    try:
+        import torch.utils._pytree
+        if not hasattr(torch.utils._pytree, "register_pytree_node"):
+            torch.utils._pytree.register_pytree_node = getattr(torch.utils._pytree, "_register_pytree_node", lambda *args, **kwargs: None)
+        if not hasattr(torch.utils._pytree, "serialized_type_name"):
+            torch.utils._pytree.serialized_type_name = lambda *args, **kwargs: "unknown"
+    except ImportError:
+        pass
+
+def _load_sentence_transformer(model_name: str):
+    _patch_torch_pytree()
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+def backend_namespace(model_name: str, backend: str) -> str:
+    """
+    Cache namespace for embeddings produced by a backend.
+    Quantized vectors differ slightly from fp32 ones, so they never share a cache.
+    """
+    return model_name if backend == "torch" else f"{model_name}-{backend}"
+
+def parity_report(reference: np.ndarray, candidate: np.ndarray) -> Dict[str, float]:
+    """Row-wise cosine similarity between two embeddings of the same phrases."""
+    ref = reference / np.maximum(np.linalg.norm(reference, axis=1, keepdims=True), 1e-12)
+    cand = candidate / np.maximum(np.linalg.norm(candidate, axis=1, keepdims=True), 1e-12)
+    cosines = np.sum(ref * cand, axis=1)
+    return {
+        "phrases": int(len(cosines)),
+        "min_cosine": round(float(cosines.min()), 4) if len(cosines) else 1.0,
+        "mean_cosine": round(float(cosines.mean()), 4) if len(cosines) else 1.0
+    }
+
+class EmbeddingBackend:
+    """Turns phrases into embedding vectors. Selected by Settings.EMBEDDING_BACKEND."""
+    name = "base"
+
+    def encode(self, phrases: List[str]) -> np.ndarray:
+        """Encode phrases into an (n, dim) float32 matrix."""
+        raise NotImplementedError
+
+    def dimension(self) -> int:
+        raise NotImplementedError
+
+class TorchBackend(EmbeddingBackend):
+    """The original fp32 PyTorch sentence-transformers model."""
+    name = "torch"
+
+    def __init__(self, model_name: str, batch_size: int = 64):
+        self.model = _load_sentence_transformer(model_name)
+        self.batch_size = batch_size
+
+    def encode(self, phrases: List[str]) -> np.ndarray:
+        return np.asarray(self.model.encode(phrases, batch_size=self.batch_size, convert_to_numpy=True), dtype=np.float32)
+
+    def dimension(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+class OnnxInt8Backend(EmbeddingBackend):
+    """
+    The same model exported to ONNX with int8 dynamically quantized weights,
+    run by ONNX Runtime on CPU. Needs neither torch nor sentence-transformers at
+    runtime; they are only used once, to export the model into export_dir.
+    """
+    name = "onnx-int8"
+
+    def __init__(
+        self,
+        model_name: str,
+        export_dir: str,
+        batch_size: int = 64,
+        num_threads: int = 0,
+        min_parity_cosine: float = 0.95
+    ):
+        try:
+            import onnxruntime  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "The onnx-int8 embedding backend needs 'onnxruntime' and 'onnx' "
+                "(pip install onnxruntime onnx)"
+            ) from e
+
+        self.export_dir = os.path.join(export_dir, re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name))
+        if not os.path.exists(os.path.join(self.export_dir, "config.json")):
+            export_onnx_int8(model_name, self.export_dir, min_parity_cosine=min_parity_cosine)
+        self._load(self.export_dir, batch_size, num_threads)
+
+    @classmethod
+    def from_directory(cls, directory: str, batch_size: int = 64, num_threads: int = 0) -> "OnnxInt8Backend":
+        """Load an existing export without checking or creating it."""
+        backend = cls.__new__(cls)
+        backend.export_dir = directory
+        backend._load(directory, batch_size, num_threads)
+        return backend
+
+    def _load(self, directory: str, batch_size: int, num_threads: int):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        with open(os.path.join(directory, "config.json"), "r", encoding="utf-8") as f:
+            self.config = json.load(f)
+        self.batch_size = batch_size
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(directory, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=self.config["max_seq_length"])
+        self.tokenizer.enable_padding(pad_id=self.config["pad_token_id"], pad_token=self.config["pad_token"])
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(directory, "model.int8.onnx"), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def dimension(self) -> int:
+        return self.config["dimension"]
+
+    def encode(self, phrases: List[str]) -> np.ndarray:
+        if not phrases:
+            return np.zeros((0, self.dimension()), dtype=np.float32)
+
+        # Batch phrases of similar length together to minimize padding
+        order = np.argsort([len(p) for p in phrases])
+        output = np.empty((len(phrases), self.dimension()), dtype=np.float32)
+        for start in range(0, len(phrases), self.batch_size):
+            batch_idx = order[start:start + self.batch_size]
+            output[batch_idx] = self._encode_batch([phrases[i] for i in batch_idx])
+        return output
+
+    def _encode_batch(self, phrases: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(phrases)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+
+        hidden = self.session.run(["last_hidden_state"], feeds)[0]
+        if self.config["pooling"] == "cls":
+            pooled = hidden[:, 0]
+        else:
+            mask = attention_mask[:, :, None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        if self.config["normalize"]:
+            pooled = pooled / np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+        return pooled.astype(np.float32)
+
+def export_onnx_int8(model_name: str, export_dir: str, min_parity_cosine: float = 0.95) -> Dict:
+    """
+    Export a sentence-transformers model to an int8-quantized ONNX model.
+
+    The export is checked against the fp32 model on PARITY_PHRASES and rejected if
+    any phrase falls below min_parity_cosine. The export directory is written
+    under a temporary name and renamed at the end, so concurrent workers never
+    load a partial export.
+
+    Returns:
+        The export config, including the parity report
+    """
+    import torch
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    from sentence_transformers import models
+
+    print(f"Exporting '{model_name}' to int8 ONNX (one-time)...")
+    st = _load_sentence_transformer(model_name)
+    transformer, pooling = st[0], st[1]
+    if not isinstance(transformer, models.Transformer) or not isinstance(pooling, models.Pooling):
+        raise ValueError(f"Unsupported model layout for ONNX export: {[type(m).__name__ for m in st]}")
+    pooling_mode = pooling.get_pooling_mode_str()
+    if pooling_mode not in ("mean", "cls"):
+        raise ValueError(f"Unsupported pooling mode for ONNX export: {pooling_mode}")
+
+    auto_model = transformer.auto_model.eval()
+    tokenizer = transformer.tokenizer
+    input_names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in tokenizer.model_input_names]
+
+    os.makedirs(os.path.dirname(os.path.abspath(export_dir)), exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=".export-", dir=os.path.dirname(os.path.abspath(export_dir)))
+    try:
+        fp32_path = os.path.join(tmp_dir, "model.onnx")
+        int8_path = os.path.join(tmp_dir, "model.int8.onnx")
+
+        sample = tokenizer(["a sample phrase"], return_tensors="pt")
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+        with torch.no_grad():
+            torch.onnx.export(
+                auto_model,
+                tuple(sample[name] for name in input_names),
+                fp32_path,
+                input_names=input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=14,
+                dynamo=False
+            )
+        quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+        os.remove(fp32_path)
+
+        tokenizer.save_pretrained(tmp_dir)
+        if not os.path.exists(os.path.join(tmp_dir, "tokenizer.json")):
+            raise ValueError("ONNX export needs a fast tokenizer (tokenizer.json)")
+
+        config = {
+            "model_name": model_name,
+            "dimension": st.get_sentence_embedding_dimension(),
+            "max_seq_length": st.max_seq_length or tokenizer.model_max_length,
+            "pooling": pooling_mode,
+            "normalize": any(isinstance(m, models.Normalize) for m in st),
+            "pad_token": tokenizer.pad_token,
+            "pad_token_id": tokenizer.pad_token_id
+        }
+        with open(os.path.join(tmp_dir, "config.json"), "w", encoding="utf-8") as f:
+            json.dump(config, f, indent=2)
+
+        # Accuracy parity against the fp32 model before the export is accepted
+        reference = st.encode(PARITY_PHRASES, convert_to_numpy=True)
+        quantized = OnnxInt8Backend.from_directory(tmp_dir)
+        report = parity_report(reference, quantized.encode(PARITY_PHRASES))
+        print(f"ONNX int8 parity vs fp32: {report}")
+        if report["min_cosine"] < min_parity_cosine:
+            raise ValueError(
+                f"Quantized model diverges from fp32 (min cosine {report['min_cosine']} < {min_parity_cosine})"
+            )
+        config["parity"] = report
+        with open(os.path.join(tmp_dir, "config.json"), "w", encoding="utf-8") as f:
+            json.dump(config, f, indent=2)
+
+        try:
+            os.rename(tmp_dir, export_dir)
+        except OSError:
+            # Another worker finished the same export first
+            if not os.path.exists(os.path.join(export_dir, "config.json")):
+                raise
+        return config
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def create_embedding_backend(
+    name: str,
+    model_name: str,
+    export_dir: Optional[str] = None,
+    batch_size: int = 64,
+    num_threads: int = 0,
+    min_parity_cosine: float = 0.95
+) -> EmbeddingBackend:
+    """Build the embedding backend selected in Settings.EMBEDDING_BACKEND."""
+    if name == "torch":
+        return TorchBackend(model_name, batch_size=batch_size)
+    if name == "onnx-int8":
+        if not export_dir:
+            raise ValueError("The onnx-int8 backend needs an export directory")
+        return OnnxInt8Backend(
+            model_name, export_dir, batch_size=batch_size,
+            num_threads=num_threads, min_parity_cosine=min_parity_cosine
+        )
+    raise ValueError(f"Unknown embedding backend '{name}'. Choose one of: {', '.join(BACKENDS)}")
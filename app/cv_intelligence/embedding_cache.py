@@ -0,0 +1,295 @@
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+import numpy as np
+
+SQLITE_MAX_VARIABLES = 500  # Chunk size for IN (...) queries
+
+def normalize_phrase(phrase: str) -> str:
+    """Cache key for a phrase: lowercased, whitespace-collapsed."""
+    return " ".join(phrase.lower().split())
+
+def _phrase_tag(phrase: str) -> int:
+    """Non-zero 63-bit fingerprint of a phrase, stored next to its matrix row."""
+    return (int.from_bytes(hashlib.blake2b(phrase.encode("utf-8"), digest_size=8).digest(), "little") >> 1) or 1
+
+class EmbeddingCache:
+    """
+    Two-tier cache of phrase embeddings, keyed by normalized phrase text.
+
+    - Memory tier: per-process LRU of float32 vectors.
+    - Disk tier: a memory-mapped float16 matrix (one row per phrase) plus a
+      SQLite phrase -> row index. Both files survive restarts and are shared by
+      all analysis worker processes; the least recently used rows are reused
+      once the matrix is full. Each row also carries a phrase fingerprint, so a
+      reader racing with another process that recycles the row sees a miss
+      instead of a wrong vector.
+
+    Only phrases missing from both tiers are sent to the model, in one batch.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        dim: int,
+        cache_dir: str,
+        memory_size: int = 20000,
+        disk_capacity: int = 200000
+    ):
+        self.namespace = re.sub(r"[^A-Za-z0-9_.-]+", "_", namespace)
+        self.dim = dim
+        self.cache_dir = cache_dir
+        self.memory_size = memory_size
+        self.disk_capacity = disk_capacity
+
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.stats_local: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.matrix_path = os.path.join(cache_dir, f"{self.namespace}.f16")
+        self.tags_path = os.path.join(cache_dir, f"{self.namespace}.tags")
+        self.index_path = os.path.join(cache_dir, f"{self.namespace}.index.sqlite")
+
+        self._db = self._connect(self.index_path)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS phrases (
+                phrase TEXT PRIMARY KEY,
+                row INTEGER NOT NULL UNIQUE,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_phrases_last_used ON phrases (last_used);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+        """)
+        self._matrix, self._tags = self._open_matrix()
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        # Autocommit mode; write transactions are managed explicitly
+        return sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+
+    def _open_matrix(self):
+        shape = (self.disk_capacity, self.dim)
+        expected_bytes = self.disk_capacity * self.dim * np.dtype(np.float16).itemsize
+        if (
+            os.path.exists(self.matrix_path) and os.path.getsize(self.matrix_path) == expected_bytes
+            and os.path.exists(self.tags_path) and os.path.getsize(self.tags_path) == self.disk_capacity * 8
+        ):
+            return (
+                np.memmap(self.matrix_path, dtype=np.float16, mode="r+", shape=shape),
+                np.memmap(self.tags_path, dtype=np.int64, mode="r+", shape=(self.disk_capacity,))
+            )
+
+        # New cache, or capacity/dimension changed: start over
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._db.execute("DELETE FROM phrases")
+            matrix = np.memmap(self.matrix_path, dtype=np.float16, mode="w+", shape=shape)
+            tags = np.memmap(self.tags_path, dtype=np.int64, mode="w+", shape=(self.disk_capacity,))
+            matrix.flush()
+            tags.flush()
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+        return matrix, tags
+
+    def get_many(self, phrases: List[str], encode_fn: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """
+        Return embeddings for the given phrases, in order, as a float32 matrix.
+
+        Args:
+            phrases: Phrases to embed
+            encode_fn: Encodes a list of (normalized) phrases into an (n, dim) array
+        """
+        keys = [normalize_phrase(p) for p in phrases]
+        found: Dict[str, np.ndarray] = {}
+
+        # 1. Memory tier
+        for key in set(keys):
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                found[key] = vector
+        memory_hits = len(found)
+
+        # 2. Disk tier
+        missing = [k for k in set(keys) if k not in found]
+        disk_hits = self._read_disk(missing) if missing else {}
+        found.update(disk_hits)
+
+        # 3. Model, one batch for all misses
+        misses = [k for k in missing if k not in found]
+        if misses:
+            encoded = np.asarray(encode_fn(misses), dtype=np.float32)
+            for key, vector in zip(misses, encoded):
+                found[key] = vector
+            self._write_disk(misses, encoded)
+
+        for key in disk_hits.keys() | set(misses):
+            self._remember(key, found[key])
+
+        self._record(memory_hits=memory_hits, disk_hits=len(disk_hits), misses=len(misses))
+
+        if not keys:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.stack([found[k] for k in keys])
+
+    def _remember(self, key: str, vector: np.ndarray):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        hits: Dict[str, np.ndarray] = {}
+        now = time.time()
+        for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+            chunk = keys[start:start + SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._db.execute(
+                f"SELECT phrase, row FROM phrases WHERE phrase IN ({placeholders})", chunk
+            ).fetchall()
+            for phrase, row in rows:
+                vector = np.array(self._matrix[row], dtype=np.float32)
+                # Checked after the copy: if another process recycled the row meanwhile, it's a miss
+                if int(self._tags[row]) == _phrase_tag(phrase):
+                    hits[phrase] = vector
+
+        if hits:
+            # Recency update is best effort; losing it only affects eviction order
+            try:
+                self._db.executemany(
+                    "UPDATE phrases SET last_used = ? WHERE phrase = ?", [(now, k) for k in hits]
+                )
+            except sqlite3.OperationalError:
+                pass
+        return hits
+
+    def _write_disk(self, keys: List[str], vectors: np.ndarray):
+        # More phrases than the whole disk tier: keep only the most recent ones
+        if len(keys) > self.disk_capacity:
+            keys, vectors = keys[-self.disk_capacity:], vectors[-self.disk_capacity:]
+
+        now = time.time()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            # Another worker may have stored some of these phrases meanwhile
+            existing = set()
+            for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+                chunk = keys[start:start + SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                existing.update(r[0] for r in self._db.execute(
+                    f"SELECT phrase FROM phrases WHERE phrase IN ({placeholders})", chunk
+                ))
+            pending = [(k, v) for k, v in zip(keys, vectors) if k not in existing]
+            if not pending:
+                self._db.execute("COMMIT")
+                return
+
+            # Rows are handed out densely and evicted rows are refilled right away,
+            # so the free rows are always the tail of the matrix
+            count = self._db.execute("SELECT COUNT(*) FROM phrases").fetchone()[0]
+            free_rows = list(range(count, min(self.disk_capacity, count + len(pending))))
+
+            evicted = 0
+            if len(free_rows) < len(pending):
+                victims = self._db.execute(
+                    "SELECT phrase, row FROM phrases ORDER BY last_used LIMIT ?",
+                    (len(pending) - len(free_rows),)
+                ).fetchall()
+                self._db.executemany("DELETE FROM phrases WHERE phrase = ?", [(p,) for p, _ in victims])
+                free_rows.extend(row for _, row in victims)
+                evicted = len(victims)
+
+            for (key, vector), row in zip(pending, free_rows):
+                # Invalidate, write, then tag: readers never accept a half-written row
+                self._tags[row] = 0
+                self._matrix[row] = vector.astype(np.float16)
+                self._tags[row] = _phrase_tag(key)
+            # No flush here: MAP_SHARED pages are visible to other workers right away,
+            # and rows lost in an OS crash fail the tag check rather than being misread
+            self._db.executemany(
+                "INSERT INTO phrases (phrase, row, last_used) VALUES (?, ?, ?)",
+                [(key, row, now) for (key, _), row in zip(pending, free_rows)]
+            )
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+
+        self.stats_local["evictions"] += evicted
+        if evicted:
+            self._bump("evictions", evicted)
+
+    def _record(self, memory_hits: int, disk_hits: int, misses: int):
+        self.stats_local["memory_hits"] += memory_hits
+        self.stats_local["disk_hits"] += disk_hits
+        self.stats_local["misses"] += misses
+        self._bump("memory_hits", memory_hits)
+        self._bump("disk_hits", disk_hits)
+        self._bump("misses", misses)
+
+    def _bump(self, key: str, amount: int):
+        if not amount:
+            return
+        try:
+            self._db.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+                (key, amount)
+            )
+        except sqlite3.OperationalError:
+            # Counters are informational; never fail a request over them
+            pass
+
+    def stats(self) -> Dict:
+        """Per-process counters plus the shared (all workers) totals and sizes."""
+        shared = self.read_shared_stats(self.cache_dir, self.namespace)
+        local_lookups = self.stats_local["memory_hits"] + self.stats_local["disk_hits"] + self.stats_local["misses"]
+        shared["process"] = dict(
+            self.stats_local,
+            memory_items=len(self._memory),
+            memory_capacity=self.memory_size,
+            hit_rate=round((local_lookups - self.stats_local["misses"]) / local_lookups, 4) if local_lookups else 0.0
+        )
+        return shared
+
+    @classmethod
+    def read_shared_stats(cls, cache_dir: str, namespace: str) -> Optional[Dict]:
+        """
+        Read the shared counters of a cache without loading its matrix.
+        Usable from processes that never embed anything (e.g. the API process).
+        """
+        namespace = re.sub(r"[^A-Za-z0-9_.-]+", "_", namespace)
+        index_path = os.path.join(cache_dir, f"{namespace}.index.sqlite")
+        if not os.path.exists(index_path):
+            return None
+
+        db = cls._connect(index_path)
+        try:
+            counters = dict(db.execute("SELECT key, value FROM meta").fetchall())
+            disk_items = db.execute("SELECT COUNT(*) FROM phrases").fetchone()[0]
+        finally:
+            db.close()
+
+        lookups = sum(counters.get(k, 0) for k in ("memory_hits", "disk_hits", "misses"))
+        matrix_path = os.path.join(cache_dir, f"{namespace}.f16")
+        return {
+            "namespace": namespace,
+            "disk_items": disk_items,
+            "disk_bytes": os.path.getsize(matrix_path) if os.path.exists(matrix_path) else 0,
+            "memory_hits": counters.get("memory_hits", 0),
+            "disk_hits": counters.get("disk_hits", 0),
+            "misses": counters.get("misses", 0),
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": round((lookups - counters.get("misses", 0)) / lookups, 4) if lookups else 0.0
+        }
+
+    def close(self):
+        self._matrix.flush()
+        self._tags.flush()
+        self._db.close()
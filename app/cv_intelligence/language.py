@@ -0,0 +1,55 @@
+import re
+from collections import Counter
+
+# Languages our CVs come in; anything else is treated as English
+SUPPORTED_LANGUAGES = ("en", "ru", "uz")
+DEFAULT_LANGUAGE = "en"
+
+# Letters only Uzbek Cyrillic uses (Russian has none of them)
+_UZ_CYRILLIC = re.compile(r"[ўқғҳЎҚҒҲ]")
+_CYRILLIC = re.compile(r"[Ѐ-ӿ]")
+_LATIN = re.compile(r"[A-Za-z]")
+_LATIN_WORD = re.compile(r"[a-z]+(?:['‘’ʻ][a-z]+)*")
+# o‘ / g‘ (with any of the apostrophes people type) are Uzbek Latin letters
+_UZ_LATIN_LETTER = re.compile(r"[og]['‘’ʻ]")
+
+# Frequent words of CVs; a vote between them separates Uzbek Latin from English
+_EN_WORDS = frozenset([
+    "the", "and", "of", "with", "in", "for", "to", "on", "at", "as", "a", "an", "is", "was",
+    "experience", "skills", "education", "work", "years", "developer", "university", "projects"
+])
+_UZ_WORDS = frozenset([
+    "va", "bilan", "uchun", "yil", "yillar", "ish", "tajribasi", "tajriba", "haqida", "men",
+    "bo'yicha", "ma'lumoti", "ma'lumot", "ko'nikmalar", "loyihalar", "universiteti", "dasturchi",
+    "tili", "kurslar", "sertifikatlar", "manzil", "telefon", "hozirgi", "kabi", "ham", "yoki"
+])
+
+# Uzbek function words; spaCy has no Uzbek stop list, these bound the fast-path n-grams
+UZ_STOP_WORDS = frozenset([
+    "va", "bilan", "uchun", "ham", "yoki", "lekin", "ammo", "bu", "shu", "u", "ular", "men", "biz",
+    "siz", "da", "dan", "ga", "ning", "ni", "esa", "kabi", "bo'yicha", "orqali", "hamda", "edi",
+    "bo'lgan", "bo'ladi", "etib", "qilib", "har", "bir", "ko'p", "juda", "eng", "hali", "endi",
+    "ва", "билан", "учун", "ҳам", "ёки", "лекин", "бу", "шу", "улар", "мен", "биз", "сиз", "эса", "каби"
+])
+
+def detect_language(text: str, sample_chars: int = 5000) -> str:
+    """
+    Guesses the CV language ("en", "ru" or "uz") from letter statistics of the
+    first sample_chars characters. Cheap enough to run on every CV (no model).
+    """
+    sample = (text or "")[:sample_chars]
+    cyrillic = len(_CYRILLIC.findall(sample))
+    latin = len(_LATIN.findall(sample))
+    if not cyrillic and not latin:
+        return DEFAULT_LANGUAGE
+
+    # Cyrillic CVs still name Latin-script technologies (Python, Docker), hence the 40%
+    if cyrillic >= 0.4 * (cyrillic + latin):
+        uz_letters = len(_UZ_CYRILLIC.findall(sample))
+        return "uz" if uz_letters >= max(3, 0.01 * cyrillic) else "ru"
+
+    lowered = sample.lower()
+    words = Counter(w.replace("‘", "'").replace("’", "'").replace("ʻ", "'") for w in _LATIN_WORD.findall(lowered))
+    uz_score = sum(count for word, count in words.items() if word in _UZ_WORDS) + len(_UZ_LATIN_LETTER.findall(lowered))
+    en_score = sum(count for word, count in words.items() if word in _EN_WORDS)
+    return "uz" if uz_score > en_score else "en"
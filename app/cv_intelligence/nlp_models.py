@@ -0,0 +1,152 @@
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+from app.cv_intelligence.language import UZ_STOP_WORDS
+
+def parse_language_models(spec: str) -> Dict[str, str]:
+    """Parses "ru:ru_core_news_sm,de:de_core_news_sm" into {"ru": "ru_core_news_sm", ...}."""
+    models = {}
+    for item in spec.split(","):
+        if ":" in item:
+            language, model = item.split(":", 1)
+            models[language.strip()] = model.strip()
+    return models
+
+def _rss_mb() -> float:
+    """Current resident set size of this process (Linux; 0 elsewhere)."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+def load_spacy_model(model: str, exclude: List[str]):
+    """
+    Loads a spaCy package (downloading it if missing).
+    Returns (nlp, megabytes): the RSS growth the load caused, charged to the memory budget.
+    """
+    import spacy
+
+    if not spacy.util.is_package(model):
+        print(f"Downloading Spacy model '{model}'...")
+        spacy.cli.download(model)
+
+    rss_before = _rss_mb()
+    print(f"Loading Spacy model '{model}'...")
+    nlp = spacy.load(model, exclude=exclude)
+    print(f"Spacy pipeline: {nlp.pipe_names}")
+    return nlp, max(0.0, _rss_mb() - rss_before)
+
+def has_noun_chunks(language: str) -> bool:
+    """Whether spaCy can produce noun chunks for a language (not every language defines them)."""
+    import spacy
+    try:
+        return "noun_chunks" in spacy.util.get_lang_class(language).Defaults.syntax_iterators
+    except Exception:
+        return False
+
+class NLPModelPool:
+    """
+    spaCy pipelines per language.
+
+    Full models are loaded on first use and kept in LRU order; once their
+    measured memory exceeds memory_budget_mb the least recently used ones are
+    dropped (and reloaded if their language shows up again). Languages without
+    a configured model, or whose model cannot produce noun chunks, get a blank
+    tokenizer-only pipeline instead, so no parser runs on them at all.
+    """
+
+    def __init__(
+        self,
+        models: Dict[str, str],
+        exclude: Optional[List[str]] = None,
+        memory_budget_mb: float = 512,
+        loader: Callable = load_spacy_model
+    ):
+        """
+        Args:
+            models: Language code -> spaCy package
+            exclude: Pipeline components never loaded
+            memory_budget_mb: RSS the loaded models may use together (0 = unlimited)
+            loader: Callable(model, exclude) -> (nlp, megabytes)
+        """
+        self.models = dict(models)
+        self.exclude = exclude or []
+        self.memory_budget_mb = memory_budget_mb
+        self.loader = loader
+
+        self._loaded: "OrderedDict[str, Tuple[object, float]]" = OrderedDict()
+        self._tokenizers: Dict[str, object] = {}
+        self._unavailable = set()  # Languages whose model failed to load; not retried
+        self.loads = 0
+        self.evictions = 0
+
+        for language, model in list(self.models.items()):
+            if not has_noun_chunks(language):
+                print(f"Spacy has no noun chunks for '{language}'; '{model}' is not loaded, tokenizer only")
+                del self.models[language]
+
+    def get(self, language: str, required: bool = False) -> Tuple[object, bool]:
+        """
+        Pipeline for a language.
+
+        Returns:
+            (nlp, parsed): parsed is False for tokenizer-only pipelines (use n-grams, not noun chunks)
+
+        Raises:
+            Whatever the loader raises, if required; otherwise load errors fall back to the tokenizer
+        """
+        if language in self._loaded:
+            self._loaded.move_to_end(language)
+            return self._loaded[language][0], True
+
+        model = self.models.get(language)
+        if model is None or language in self._unavailable:
+            return self.tokenizer(language), False
+
+        try:
+            nlp, size_mb = self.loader(model, self.exclude)
+        except (Exception, SystemExit) as e:  # spacy.cli.download exits when offline
+            if required:
+                raise
+            print(f"Spacy model '{model}' unavailable ({e}); '{language}' CVs use the tokenizer only")
+            self._unavailable.add(language)
+            return self.tokenizer(language), False
+
+        self.loads += 1
+        self._loaded[language] = (nlp, size_mb)
+        self._evict(keep=language)
+        return nlp, True
+
+    def tokenizer(self, language: str):
+        """Blank pipeline (tokenizer and stop words only) for a language; tiny, always kept."""
+        if language not in self._tokenizers:
+            import spacy
+            try:
+                nlp = spacy.blank(language)
+            except Exception:
+                # No spaCy language class (e.g. Uzbek): multi-language tokenizer plus our stop words
+                nlp = spacy.blank("xx")
+            if language == "uz":
+                for word in UZ_STOP_WORDS:
+                    nlp.vocab[word].is_stop = True
+            self._tokenizers[language] = nlp
+        return self._tokenizers[language]
+
+    def memory_mb(self) -> float:
+        return sum(size_mb for _, size_mb in self._loaded.values())
+
+    def loaded_languages(self) -> List[str]:
+        """Languages with a full model in memory, least recently used first."""
+        return list(self._loaded.keys())
+
+    def _evict(self, keep: str):
+        while self.memory_budget_mb and self.memory_mb() > self.memory_budget_mb and len(self._loaded) > 1:
+            language = next(iter(self._loaded))
+            if language == keep:
+                break
+            _, size_mb = self._loaded.pop(language)
+            self.evictions += 1
+            print(f"Evicted Spacy model for '{language}' ({size_mb:.0f} MB) to stay within {self.memory_budget_mb} MB")
@@ -0,0 +1,160 @@
+import glob
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from app.cv_intelligence.vector_index import FlatIndex, normalize_rows
+
+DEFAULT_ONTOLOGY_PATH = os.path.join(os.path.dirname(__file__), "data", "ontology.json")
+
+def _version_tag(version, raw: bytes) -> str:
+    # Content digest included: an edit that forgets to bump "version" still changes the tag
+    return f"{version}-{hashlib.sha256(raw).hexdigest()[:8]}"
+
+def read_ontology_version(path: str = DEFAULT_ONTOLOGY_PATH) -> str:
+    """Version tag of an ontology file, without computing any embeddings."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return _version_tag(json.loads(raw).get("version", "0"), raw)
+    except (OSError, ValueError):
+        return "0"
+
+class OntologyStore:
+    """
+    File-based skill ontology (abstract term -> concrete skills) with precomputed
+    key embeddings.
+
+    Key embeddings are L2-normalized and saved as an .npy file named after the
+    model and the key list, next to a JSON list of its keys. Workers open it with
+    np.load(mmap_mode="r"), so they share the same physical pages and nothing is
+    encoded at startup once the file exists. When the ontology file changes, it
+    is reloaded on the next access and only new or renamed keys are encoded.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        namespace: str,
+        cache_dir: str,
+        path: str = DEFAULT_ONTOLOGY_PATH,
+        reload_interval: float = 5.0
+    ):
+        self.encode_fn = encode_fn
+        self.namespace = re.sub(r"[^A-Za-z0-9_.-]+", "_", namespace)
+        self.cache_dir = cache_dir
+        self.path = path
+        self.reload_interval = reload_interval
+
+        self.version: str = "0"
+        self.concepts: Dict[str, List[str]] = {}
+        self.keys: List[str] = []
+        self.embeddings: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self.index = FlatIndex(self.embeddings, normalized=True)
+
+        self._mtime_ns: Optional[int] = None
+        self._last_check = 0.0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.reload()
+
+    def maybe_reload(self) -> bool:
+        """
+        Reload the ontology if its file changed. The stat call is throttled to
+        once per reload_interval, so this is cheap to call on every request.
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.reload_interval:
+            return False
+        self._last_check = now
+
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime_ns == self._mtime_ns:
+            return False
+
+        try:
+            self.reload()
+        except (OSError, ValueError) as e:
+            # A half-written or invalid file: keep serving the previous ontology
+            print(f"Ontology reload failed, keeping version {self.version}: {e}")
+            return False
+        print(f"Ontology reloaded: version {self.version}, {len(self.keys)} concepts")
+        return True
+
+    def reload(self):
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw)
+
+        concepts = {key.lower(): list(skills) for key, skills in data.get("concepts", {}).items()}
+        keys = list(concepts.keys())
+        embeddings = self._load_embeddings(keys)
+
+        # Swap everything at once so readers never see a mismatched key/embedding pair
+        self.version = _version_tag(data.get("version", "0"), raw)
+        self.concepts, self.keys, self.embeddings, self.index = (
+            concepts, keys, embeddings, FlatIndex(embeddings, normalized=True)
+        )
+        self._mtime_ns = mtime_ns
+        self._last_check = time.monotonic()
+
+    def _paths(self, keys: List[str]):
+        digest = hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()[:16]
+        base = os.path.join(self.cache_dir, f"ontology_{self.namespace}_{digest}")
+        return base + ".npy", base + ".keys.json"
+
+    def _load_embeddings(self, keys: List[str]) -> np.ndarray:
+        matrix_path, keys_path = self._paths(keys)
+        if os.path.exists(matrix_path):
+            return np.load(matrix_path, mmap_mode="r")
+
+        # Reuse rows from the most recent previous matrix; encode only new keys
+        previous = self._latest_previous(exclude=matrix_path)
+        known: Dict[str, np.ndarray] = {}
+        if previous:
+            prev_matrix_path, prev_keys_path = previous
+            with open(prev_keys_path, "r", encoding="utf-8") as f:
+                prev_keys = json.load(f)
+            prev_matrix = np.load(prev_matrix_path, mmap_mode="r")
+            if len(prev_keys) == prev_matrix.shape[0]:
+                known = {k: np.array(prev_matrix[i]) for i, k in enumerate(prev_keys)}
+
+        new_keys = [k for k in keys if k not in known]
+        if new_keys:
+            print(f"Encoding {len(new_keys)} new ontology concept(s)...")
+            encoded = normalize_rows(self.encode_fn(new_keys))
+            known.update(zip(new_keys, encoded))
+
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        matrix = np.stack([known[k] for k in keys]).astype(np.float32)
+
+        # Write under temporary names, then rename: concurrent workers never load a partial file
+        tmp_suffix = f".{os.getpid()}.tmp"
+        with open(keys_path + tmp_suffix, "w", encoding="utf-8") as f:
+            json.dump(keys, f, ensure_ascii=False)
+        with open(matrix_path + tmp_suffix, "wb") as f:
+            np.save(f, matrix)
+        os.replace(keys_path + tmp_suffix, keys_path)
+        os.replace(matrix_path + tmp_suffix, matrix_path)
+
+        return np.load(matrix_path, mmap_mode="r")
+
+    def _latest_previous(self, exclude: str):
+        candidates = []
+        for matrix_path in glob.glob(os.path.join(self.cache_dir, f"ontology_{self.namespace}_*.npy")):
+            keys_path = matrix_path[:-len(".npy")] + ".keys.json"
+            if matrix_path != exclude and os.path.exists(keys_path):
+                candidates.append((os.path.getmtime(matrix_path), matrix_path, keys_path))
+        if not candidates:
+            return None
+        _, matrix_path, keys_path = max(candidates)
+        return matrix_path, keys_path
@@ -1,30 +1,330 @@
 import pdfplumber
 import docx
 import os
+import re
+import time
+import zipfile
+import multiprocessing
+import xml.etree.ElementTree as ET
+from collections import deque
+from typing import Iterator, List, Optional, Tuple
+from app.cv_intelligence.parser_sandbox import ParserSandbox, ParseFailure, ParseTimeout
+from app.cv_intelligence.schemas import ResumeValidation
+from app.cv_intelligence.validation import ResumeValidator
+from app.config import settings
+
+# WordprocessingML tags read by the streaming DOCX parser
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P, _W_T, _W_TAB, _W_BR, _W_CR = _W + "p", _W + "t", _W + "tab", _W + "br", _W + "cr"
+_W_TR, _W_TC = _W + "tr", _W + "tc"
+_DOCX_CONTAINERS = (_W + "body", _W + "hdr", _W + "ftr")
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_DOCX_HEADER = re.compile(r"^word/header\d*\.xml$")
+_DOCX_FOOTER = re.compile(r"^word/footer\d*\.xml$")
+
+# Per-process handle of the PDF being read by a page worker, reused across its pages
+_worker_pdf = None
+_worker_pdf_path = None
+
+def _extract_pdf_page(file_path: str, page_number: int) -> str:
+    """Extracts the text of one page; runs in a page worker process."""
+    global _worker_pdf, _worker_pdf_path
+    if _worker_pdf_path != file_path:
+        if _worker_pdf is not None:
+            _worker_pdf.close()
+        _worker_pdf = pdfplumber.open(file_path)
+        _worker_pdf_path = file_path
+    page = _worker_pdf.pages[page_number]
+    try:
+        return page.extract_text() or ""
+    finally:
+        # Release the parsed layout objects; long documents otherwise keep every page in memory
+        page.close()
+
+# Parser of the sandbox process, kept across tasks so its page workers are reused
+_sandbox_parser = None
+
+def _parse_in_sandbox(
+    file_path: str, validate: bool, pdf_workers: int, max_pages: int, max_chars: int, timeout: float
+) -> Tuple[str, Optional[ResumeValidation]]:
+    """
+    Parses (and validates) one file inside the parser sandbox process. PDF pages
+    are read by page workers started from the sandbox: they share its memory cap
+    and its process group, so they are killed with it.
+    """
+    global _sandbox_parser
+    parser = _sandbox_parser
+    if parser is None or (parser.pdf_workers, parser.max_pages, parser.max_chars, parser.timeout) != (pdf_workers, max_pages, max_chars, timeout):
+        if parser is not None:
+            parser.close()
+        parser = _sandbox_parser = CVParser(pdf_workers=pdf_workers, max_pages=max_pages, max_chars=max_chars, timeout=timeout)
+    try:
+        return parser._parse_file(file_path, validate)
+    except (ParseFailure, MemoryError):
+        raise
+    except Exception as e:
+        # Malformed files: report why instead of an internal error
+        raise ParseFailure(f"Could not read the file: {e}")
 
 class CVParser:
+    def __init__(
+        self,
+        pdf_workers: int = settings.PDF_PARSE_WORKERS,
+        max_pages: int = settings.PDF_MAX_PAGES,
+        max_chars: int = settings.PDF_MAX_CHARS,
+        timeout: float = settings.PDF_TIMEOUT_SECONDS,
+        sandbox: Optional[ParserSandbox] = None
+    ):
+        """
+        Args:
+            pdf_workers: Processes extracting PDF pages in parallel (0 = serial, in-process)
+            max_pages: Pages read per PDF; the rest are ignored
+            max_chars: Characters read per PDF or DOCX; reading stops once reached
+            timeout: Seconds per PDF; text extracted until then is kept
+            sandbox: Parse whole files in this memory-capped, killable process instead
+                (the pdf_workers page workers then run inside the sandbox process)
+        """
+        self.pdf_workers = pdf_workers
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.timeout = timeout
+        self.sandbox = sandbox
+        self._pdf_pool = None
+        self.timed_out = False  # Whether the last PDF hit the timeout
+
     def parse(self, file_path: str) -> str:
+        """
+        Raises:
+            FileNotFoundError: No such file
+            ValueError: Unsupported format; ParseFailure (a ValueError) with a reason
+                when the file cannot be read (timeout, memory_limit, crashed, unreadable)
+        """
+        return self._run(file_path, validate=False)[0]
+
+    def parse_and_validate(self, file_path: str) -> Tuple[str, ResumeValidation]:
+        """
+        Parses the file and validates it as a resume while it is read: each PDF
+        page is validated as soon as it is extracted (same result as
+        validation.validate_resume of the text). Raises like parse().
+        """
+        return self._run(file_path, validate=True)
+
+    def _run(self, file_path: str, validate: bool) -> Tuple[str, Optional[ResumeValidation]]:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         ext = os.path.splitext(file_path)[1].lower()
-        if ext == '.pdf':
-            return self._parse_pdf(file_path)
-        elif ext == '.docx':
-            return self._parse_docx(file_path)
-        else:
+        if ext not in ('.pdf', '.docx'):
             raise ValueError(f"Unsupported file format: {ext}")
+        if self.sandbox is not None:
+            return self.sandbox.run(
+                _parse_in_sandbox, file_path, validate, self.pdf_workers, self.max_pages, self.max_chars, self.timeout
+            )
+        return self._parse_file(file_path, validate)
+
+    def _parse_file(self, file_path: str, validate: bool) -> Tuple[str, Optional[ResumeValidation]]:
+        validator = ResumeValidator() if validate else None
+        if os.path.splitext(file_path)[1].lower() == '.pdf':
+            text = self._parse_pdf(file_path, validator)
+        else:
+            text = self._parse_docx(file_path)
+            if validator is not None:
+                validator.feed(text)
+        return text, validator.result() if validator is not None else None
+
+    def _parse_pdf(self, file_path: str, validator: Optional[ResumeValidator] = None) -> str:
+        # Cleaning page by page gives the same text as cleaning the joined pages
+        pages = []
+        for page_text in self.iter_pdf_pages(file_path):
+            page_text = self._clean_text(page_text)
+            if page_text:
+                pages.append(page_text)
+                if validator is not None:
+                    validator.feed(page_text)
+        text = "\n".join(pages)
+        if not text and self.timed_out:
+            raise ParseTimeout(f"Could not read the PDF within {self.timeout:g} seconds. Please upload a simpler file.")
+        return text
 
-    def _parse_pdf(self, file_path: str) -> str:
-        text = ""
+    def iter_pdf_pages(self, file_path: str) -> Iterator[str]:
+        """
+        Yields the text of each PDF page in order, as soon as it is extracted,
+        within the page, character and time budgets.
+        """
+        self.timed_out = False
         with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return self._clean_text(text)
+            total_pages = len(pdf.pages)
+        page_count = min(total_pages, self.max_pages)
+        if page_count < total_pages:
+            print(f"PDF has {total_pages} pages, reading the first {page_count}: {file_path}")
+
+        if self.pdf_workers > 0:
+            pages = self._iter_pages_parallel(file_path, page_count)
+        else:
+            pages = self._iter_pages_serial(file_path, page_count)
+
+        chars = 0
+        for page_text in pages:
+            if chars + len(page_text) >= self.max_chars:
+                yield page_text[:self.max_chars - chars]
+                print(f"PDF character budget ({self.max_chars}) reached, rest ignored: {file_path}")
+                pages.close()
+                return
+            chars += len(page_text) + 1  # Pages are joined with a newline
+            yield page_text
+
+    def _iter_pages_serial(self, file_path: str, page_count: int) -> Iterator[str]:
+        # A single slow page cannot be interrupted here; the deadline is checked between pages
+        deadline = time.monotonic() + self.timeout
+        with pdfplumber.open(file_path) as pdf:
+            for page_number in range(page_count):
+                if time.monotonic() > deadline:
+                    print(f"PDF timeout ({self.timeout}s) after {page_number} pages: {file_path}")
+                    self.timed_out = True
+                    return
+                page = pdf.pages[page_number]
+                try:
+                    yield page.extract_text() or ""
+                finally:
+                    page.close()
+
+    def _iter_pages_parallel(self, file_path: str, page_count: int) -> Iterator[str]:
+        # Only a small window of pages is queued, so stopping early leaves little work behind
+        deadline = time.monotonic() + self.timeout
+        window = 2 * self.pdf_workers
+        pool = self._get_pdf_pool()
+        in_flight = deque()
+        next_page = 0
+
+        while in_flight or next_page < page_count:
+            while next_page < page_count and len(in_flight) < window:
+                in_flight.append((next_page, pool.apply_async(_extract_pdf_page, (file_path, next_page))))
+                next_page += 1
+
+            page_number, result = in_flight.popleft()
+            try:
+                page_text = result.get(timeout=max(0.0, deadline - time.monotonic()))
+            except multiprocessing.TimeoutError:
+                # Stuck workers cannot be interrupted: kill the pool, a fresh one starts on the next PDF
+                print(f"PDF timeout ({self.timeout}s) at page {page_number + 1}: {file_path}")
+                self.timed_out = True
+                self.close()
+                return
+            except Exception as e:
+                print(f"Skipping unreadable PDF page {page_number + 1} of {file_path}: {e}")
+                continue
+            yield page_text
+
+    def _get_pdf_pool(self):
+        if self._pdf_pool is None:
+            # spawn: page workers must not inherit model/thread state from the analysis worker
+            self._pdf_pool = multiprocessing.get_context("spawn").Pool(self.pdf_workers)
+        return self._pdf_pool
+
+    def close(self):
+        """Stops the PDF page workers and the sandbox process, if any."""
+        if self._pdf_pool is not None:
+            self._pdf_pool.terminate()
+            self._pdf_pool = None
+        if self.sandbox is not None:
+            self.sandbox.close()
 
     def _parse_docx(self, file_path: str) -> str:
+        """
+        Streams the document text straight from the DOCX zip: headers, body
+        (paragraphs and table rows, in order) and footers. Elements are dropped
+        as soon as they are read, so memory stays flat on large documents.
+        """
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                names = archive.namelist()
+                parts = (
+                    sorted(n for n in names if _DOCX_HEADER.match(n))
+                    + ["word/document.xml"]
+                    + sorted(n for n in names if _DOCX_FOOTER.match(n))
+                )
+                lines: List[str] = []
+                seen_header_footer = set()
+                chars = 0
+                for part in parts:
+                    is_body = part == "word/document.xml"
+                    with archive.open(part) as stream:
+                        for line in self._iter_docx_part_lines(stream):
+                            if not is_body:
+                                # First/even/default headers usually repeat the same text
+                                if line in seen_header_footer:
+                                    continue
+                                seen_header_footer.add(line)
+                            lines.append(line)
+                            chars += len(line) + 1
+                            if chars >= self.max_chars:
+                                print(f"DOCX character budget ({self.max_chars}) reached, rest ignored: {file_path}")
+                                return self._clean_text("\n".join(lines)[:self.max_chars])
+        except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+            raise ParseFailure(f"Could not read the DOCX file: {e}")
+
+        return self._clean_text("\n".join(lines))
+
+    @staticmethod
+    def _iter_docx_part_lines(stream) -> Iterator[str]:
+        """
+        Yields one line per paragraph of a WordprocessingML part; a table row
+        becomes one line with its cells separated by " | ".
+        """
+        paragraph: List[str] = []
+        cells: List[List[str]] = []  # Paragraph texts of each open (possibly nested) table cell
+        rows: List[List[str]] = []   # Cell texts of each open table row
+        depth = 0
+        container = None             # w:body, w:hdr or w:ftr; its finished children are dropped
+        container_depth = -1
+        fallback_depth = 0           # Inside mc:Fallback (duplicate of the mc:Choice content)
+
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                depth += 1
+                if tag == _W_TC:
+                    cells.append([])
+                elif tag == _W_TR:
+                    rows.append([])
+                elif tag in _DOCX_CONTAINERS:
+                    container, container_depth = elem, depth
+                elif tag == _MC_FALLBACK:
+                    fallback_depth += 1
+                continue
+
+            depth -= 1
+            if fallback_depth:
+                if tag == _MC_FALLBACK:
+                    fallback_depth -= 1
+            elif tag == _W_T:
+                paragraph.append(elem.text or "")
+            elif tag == _W_TAB:
+                paragraph.append("\t")
+            elif tag == _W_BR or tag == _W_CR:
+                paragraph.append("\n")
+            elif tag == _W_P:
+                text = "".join(paragraph)
+                paragraph = []
+                if cells:
+                    cells[-1].append(text)
+                else:
+                    yield text
+            elif tag == _W_TC:
+                rows[-1].append(" ".join(t.strip() for t in cells.pop() if t.strip()))
+            elif tag == _W_TR:
+                line = " | ".join(c for c in rows.pop() if c)
+                if cells:
+                    cells[-1].append(line)
+                else:
+                    yield line
+
+            # Finished top-level paragraphs and tables are no longer needed
+            if depth == container_depth:
+                container.remove(elem)
+
+    def _parse_docx_python_docx(self, file_path: str) -> str:
+        """Previous python-docx extraction (body paragraphs only); kept for benchmarks."""
         doc = docx.Document(file_path)
         text = "\n".join([para.text for para in doc.paragraphs])
         return self._clean_text(text)
@@ -0,0 +1,166 @@
+import os
+import signal
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional
+from app.config import settings
+
+try:
+    import resource
+except ImportError:  # Windows: no RLIMIT_AS, the sandbox only isolates and times out
+    resource = None
+
+class ParseFailure(ValueError):
+    """A CV file could not be parsed; reason is a short machine-readable code."""
+    reason = "unreadable"
+
+class ParseTimeout(ParseFailure):
+    reason = "timeout"
+
+class ParseMemoryExceeded(ParseFailure):
+    reason = "memory_limit"
+
+class ParserCrashed(ParseFailure):
+    reason = "crashed"
+
+def _address_space_bytes() -> int:
+    """Virtual memory of this process (Linux; 0 elsewhere)."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmSize:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+def _limit_memory(memory_mb: int):
+    """
+    Caps the address space of the sandbox process at its size after start-up
+    plus memory_mb; allocations beyond it raise MemoryError. Relative, because
+    spawn re-imports the parent's main module (models included, when the API
+    is started as a script) before this runs.
+    """
+    if resource is not None and memory_mb > 0:
+        limit = _address_space_bytes() + memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def _init_sandbox(memory_mb: int):
+    """
+    Runs first in each sandbox process. The process leads its own process group,
+    so the PDF page workers it starts are killed along with it.
+    """
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    _limit_memory(memory_mb)
+
+def _kill(process):
+    """Kills a sandbox process and everything it started (its process group)."""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except OSError:
+            # Not a group leader yet (its initializer has not run) or already gone
+            pass
+    process.kill()
+
+class ParserSandbox:
+    """
+    Runs parse tasks in a separate process with a memory cap (RLIMIT_AS) and a
+    hard wall-clock timeout. A task that hangs, runs out of memory or crashes
+    the process is reported as a ParseFailure and the process (with any page
+    workers it started) is replaced; the
+    calling process (and its loaded models) is never affected. The process is
+    also recycled after max_tasks files, so fragmentation from large documents
+    does not accumulate.
+    """
+
+    def __init__(
+        self,
+        memory_mb: int = settings.PARSER_SANDBOX_MEMORY_MB,
+        timeout: float = settings.PARSER_SANDBOX_TIMEOUT_SECONDS,
+        max_tasks: int = settings.PARSER_SANDBOX_MAX_TASKS
+    ):
+        """
+        Args:
+            memory_mb: Address space a task may add to the sandbox process (0 = no cap)
+            timeout: Seconds a task may run before the process is killed
+            max_tasks: Tasks per process before it is replaced (0 = never)
+        """
+        self.memory_mb = memory_mb
+        self.timeout = timeout
+        self.max_tasks = max_tasks
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tasks_in_process = 0
+
+        # Counters, e.g. for diagnostics or a metrics endpoint
+        self.tasks = 0
+        self.restarts = 0
+        self.failures: Dict[str, int] = {}
+
+        # A process pool worker joins its child processes before executors are shut down
+        # on exit; without this, an analysis worker would wait forever on its idle sandbox
+        multiprocessing.util.Finalize(self, self.close, exitpriority=10)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: the sandbox must not inherit the models (and their memory) of its parent
+            self._executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_sandbox,
+                initargs=(self.memory_mb,)
+            )
+            self._tasks_in_process = 0
+        return self._executor
+
+    def run(self, task: Callable, *args):
+        """
+        Runs task(*args) in the sandbox and returns its result.
+
+        Raises:
+            ParseTimeout, ParseMemoryExceeded, ParserCrashed: The sandbox gave up on the task
+            Whatever the task raised otherwise
+        """
+        if self.max_tasks and self._tasks_in_process >= self.max_tasks:
+            self._restart()
+        try:
+            future = self._get_executor().submit(task, *args)
+        except BrokenProcessPool:
+            self._restart()
+            future = self._get_executor().submit(task, *args)
+        self.tasks += 1
+        self._tasks_in_process += 1
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            self._fail(ParseTimeout.reason)
+            raise ParseTimeout(f"Could not read the file within {self.timeout:g} seconds. Please upload a simpler file.")
+        except MemoryError:
+            self._fail(ParseMemoryExceeded.reason)
+            raise ParseMemoryExceeded(f"The file needs more than {self.memory_mb} MB to read. Please upload a simpler file.")
+        except BrokenProcessPool:
+            self._fail(ParserCrashed.reason)
+            raise ParserCrashed("The file crashed the document parser. Please upload it in another format.")
+
+    def _fail(self, reason: str):
+        self.failures[reason] = self.failures.get(reason, 0) + 1
+        print(f"Parser sandbox failure ({reason}); restarting the sandbox process")
+        self._restart()
+
+    def _restart(self):
+        self.close()
+        self.restarts += 1
+
+    def close(self):
+        """Kills the sandbox process, if any; the next task starts a fresh one."""
+        if self._executor is not None:
+            # A stuck task cannot be cancelled: kill the process itself (the executor has no public API for it)
+            for process in list((self._executor._processes or {}).values()):
+                _kill(process)
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -1,5 +1,26 @@
 from typing import List, Optional, Dict
 from pydantic import BaseModel
+from datetime import datetime
+from enum import Enum
+
+class CVSection(BaseModel):
+    """A CV section found by its heading; offsets refer to raw_text"""
+    name: str  # experience, skills, projects, education, ..., or header (text before the first heading)
+    heading: Optional[str] = None
+    start: int
+    end: int
+
+class ResumeValidation(BaseModel):
+    """Outcome of the "does this look like a CV" check, with the signals behind its score"""
+    is_resume: bool
+    score: int
+    threshold: int
+    char_count: int
+    markers: Dict[str, int] = {}  # Resume marker -> occurrences in the text
+    has_email: bool = False
+    has_phone: bool = False
+    has_years: bool = False
+    reason: Optional[str] = None  # Why the text was rejected or penalised
 
 class CVAnalysisResult(BaseModel):
     raw_text: str
@@ -8,3 +29,59 @@ class CVAnalysisResult(BaseModel):
     experience_years: Optional[float] = None
     confidence: Dict[str, float] = {}
     cv_path: Optional[str] = None
+    extraction_mode: Optional[str] = None  # Candidate generator used: "parser" or "fast"
+    language: Optional[str] = None  # Detected CV language: "en", "ru" or "uz"
+    sections: List[CVSection] = []
+    validation: Optional[ResumeValidation] = None
+
+class AnalysisJobStatus(str, Enum):
+    """Lifecycle of a background CV analysis job"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+class AnalysisJob(BaseModel):
+    """Background CV analysis job"""
+    job_id: str
+    status: AnalysisJobStatus
+    cv_path: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    result: Optional[CVAnalysisResult] = None
+    error: Optional[str] = None
+    error_reason: Optional[str] = None  # Parser failures: timeout, memory_limit, crashed, unreadable
+
+class AnalysisMetrics(BaseModel):
+    """Counters of the analysis worker pool since start-up"""
+    pending: int
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancel_requests: int = 0
+    cancelled_queued: int = 0   # Dropped before a worker picked them up
+    cancelled_running: int = 0  # Stopped by the worker between pipeline stages
+
+class BatchItemResult(BaseModel):
+    """Outcome of one file in a batch CV import (one NDJSON line)"""
+    index: int
+    filename: str
+    status: AnalysisJobStatus
+    cv_path: Optional[str] = None
+    result: Optional[CVAnalysisResult] = None
+    error: Optional[str] = None
+    error_reason: Optional[str] = None  # Parser failures: timeout, memory_limit, crashed, unreadable
+
+class ComponentState(str, Enum):
+    """Load state of a model-backed component"""
+    PENDING = "pending"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+class ComponentHealth(BaseModel):
+    name: str
+    state: ComponentState
+    load_seconds: Optional[float] = None
+    error: Optional[str] = None
@@ -0,0 +1,88 @@
+import re
+from typing import Dict, Iterable, List, Optional
+from app.cv_intelligence.schemas import CVSection
+
+# Essential resume section markers (RU, UZ, EN), counted by validation.validate_resume
+RESUME_MARKERS = [
+    "experience", "work history", "employment", "projects", "education", "skills", "technologies", "certificates", "languages", "summary", "profile", "cv", "resume", "curriculum vitae", "university", "college", "job", "career", "training",
+    "опыт работы", "образование", "навыки", "технологии", "проекты", "курсы", "сертификаты", "о себе", "контакты", "личные данные", "резюме", "телефон", "почта", "разработка", "работа",
+    "ish tajribasi", "ma'lumoti", "ko'nikmalar", "loyihalar", "kurslar", "sertifikatlar", "til", "aloqa", "rabota", "telefon", "manzil"
+]
+
+# Section headings: the section markers above that name a section, their common
+# qualified forms, plus a few headings of sections that carry no skills (hobbies, references).
+# A line is a heading only if it is one of these as a whole (before an optional colon).
+SECTION_MARKERS: Dict[str, List[str]] = {
+    "experience": [
+        "experience", "work experience", "professional experience", "relevant experience", "work history",
+        "employment", "employment history", "опыт работы", "опыт", "ish tajribasi", "tajriba"
+    ],
+    "skills": [
+        "skills", "technical skills", "key skills", "core skills", "hard skills", "professional skills", "key technical skills",
+        "skills summary", "technologies", "tech stack", "programming languages", "technical languages", "core competencies",
+        "навыки", "ключевые навыки", "профессиональные навыки", "технологии", "языки программирования",
+        "ko'nikmalar", "bilimlar", "dasturlash tillari"
+    ],
+    "projects": ["projects", "personal projects", "key projects", "проекты", "loyihalar"],
+    "education": ["education", "training", "courses", "образование", "курсы", "ma'lumoti", "kurslar", "ta'lim"],
+    "certificates": ["certificates", "certifications", "сертификаты", "sertifikatlar"],
+    # Spoken languages; "Programming Languages" is a skills heading above
+    "languages": ["languages", "foreign languages", "language skills", "языки", "иностранные языки", "tillar", "til bilish"],
+    "summary": ["summary", "professional summary", "career summary", "profile", "professional profile", "about me", "objective", "о себе"],
+    "contacts": ["contacts", "contact", "контакты", "личные данные", "aloqa"],
+    "other": ["hobbies", "interests", "references", "хобби", "интересы", "рекомендации", "qiziqishlar", "other"],
+}
+
+# Text before the first heading (name, title, contact lines)
+HEADER_SECTION = "header"
+
+_WORD = re.compile(r"[^\W\d_]+")
+_MAX_HEADING_CHARS = 50
+
+def _words(text: str) -> List[str]:
+    # Apostrophes are dropped so ko'nikmalar / ko‘nikmalar / konikmalar compare equal
+    return _WORD.findall(re.sub(r"['‘’ʻ`]", "", text.lower()))
+
+# Heading words -> section; PDF extraction sometimes drops the spaces ("WORKEXPERIENCE", "HardSkills"),
+# so each marker is also keyed by its words run together
+_HEADINGS: Dict[str, str] = {
+    sep.join(_words(marker)): name
+    for name, markers in SECTION_MARKERS.items() for marker in markers for sep in (" ", "")
+}
+
+def _heading_section(line: str) -> Optional[str]:
+    """Section named by a heading line ("Work Experience", "НАВЫКИ:", "WORKEXPERIENCE"), else None."""
+    head = line.split(":", 1)[0].strip()
+    if not head or len(head) > _MAX_HEADING_CHARS:
+        return None
+    return _HEADINGS.get(" ".join(_words(head)))
+
+def segment_sections(text: str) -> List[CVSection]:
+    """
+    Splits a CV into sections at heading lines. Offsets refer to text;
+    consecutive headings of the same section are merged.
+    """
+    sections: List[CVSection] = []
+    current = CVSection(name=HEADER_SECTION, heading=None, start=0, end=0)
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        name = _heading_section(line)
+        if name and name != current.name:
+            current.end = offset
+            if current.end > current.start:
+                sections.append(current)
+            current = CVSection(name=name, heading=line.strip(), start=offset, end=offset)
+        offset += len(line)
+    current.end = offset
+    if current.end > current.start:
+        sections.append(current)
+    return sections
+
+def section_text(text: str, sections: List[CVSection], names: Iterable[str]) -> str:
+    """
+    Text of the sections with the given names, in document order.
+    The whole text if none of them was found (e.g. a CV without headings).
+    """
+    wanted = set(names)
+    parts = [text[s.start:s.end] for s in sections if s.name in wanted]
+    return "".join(parts) if parts else text
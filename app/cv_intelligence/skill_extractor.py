@@ -1,58 +1,136 @@
-import spacy
-import re
-from typing import List, Set, Dict
+from typing import Iterable, Iterator, List, Set, Dict, Optional
+from app.cv_intelligence.skill_matcher import SkillMatcher, DEFAULT_VOCABULARY_PATH
+from app.cv_intelligence.nlp_models import NLPModelPool
+from app.cv_intelligence.language import DEFAULT_LANGUAGE
+from app.config import settings
+
+# Candidate generators: "parser" = noun chunks (dependency parse), "fast" = tokenizer-only
+# n-grams between stop words and punctuation, for when the analysis queue is deep
+EXTRACTION_MODES = ("parser", "fast")
+MAX_CANDIDATE_WORDS = 5
+
+# Pipeline components noun-chunk extraction does not use (doc.noun_chunks needs only
+# the tagger/attribute_ruler POS tags and the dependency parser); they are never loaded
+UNUSED_COMPONENTS = ["ner", "lemmatizer", "senter", "entity_ruler", "entity_linker", "textcat", "textcat_multilabel", "spancat"]
 
 class SkillExtractor:
-    def __init__(self, model: str = "en_core_web_sm"):
-        # Auto-download model if missing
-        if not spacy.util.is_package(model):
-            print(f"Downloading Spacy model '{model}'...")
-            spacy.cli.download(model)
-        
-        print(f"Loading Spacy model '{model}'...")
-        self.nlp = spacy.load(model)
-
-        # Extended explicit skills list (Common Tech Stack) - Multilingual
-        self.common_skills = {
-            # Languages
-            "python", "пайтон", "питон", "piton", "payton",
-            "javascript", "джаваскрипт", "js", "typescript", "тайпскрипт", "ts",
-            "java", "джава", "c++", "c#", "go", "golang", "rust", "раст", "php", "ruby", "swift", "kotlin",
-            # Frontend
-            "react", "реактор", "реакт", "vue", "angular", "ангуляр", "svelte", "next.js", "nuxt.js", "html", "css", "sass", "less", "tailwind",
-            # Backend
-            "node.js", "express", "nest.js", "django", "джанго", "flask", "фласк", "fastapi", "фастапи", "spring boot", "laravel", "rails", ".net",
-            # Data / AI
-            "sql", "postgresql", "mysql", "mongodb", "redis", "elasticsearch", "cassandra",
-            "machine learning", "ml", "deep learning", "dl", "nlp", "computer vision", "tensorflow", "pytorch",
-            "scikit-learn", "pandas", "numpy", "opencv", "llm", "transformers", "hugging face",
-            # DevOps / Cloud
-            "docker", "докер", "kubernetes", "k8s", "aws", "azure", "gcp", "terraform", "ansible", "jenkins", "gitlab ci", "circleci",
-            "git", "linux", "bash", "powershell",
-            # Architecture / Concepts
-            "rest api", "graphql", "grpc", "microservices", "event-driven architecture", "tdd", "bdd",
-            "agile", "scrum", "kanban", "jira", "confluence"
-        }
+    def __init__(
+        self,
+        model: str = "en_core_web_sm",
+        vocabulary_path: Optional[str] = None,
+        batch_size: int = settings.SPACY_BATCH_SIZE,
+        n_process: int = settings.SPACY_N_PROCESS,
+        language_models: Optional[Dict[str, str]] = None,
+        memory_budget_mb: float = settings.SPACY_MEMORY_BUDGET_MB
+    ):
+        """
+        Args:
+            model: spaCy package for English, the default language
+            language_models: Packages for other languages, loaded on first use;
+                languages without one are tokenized only (n-gram candidates)
+            memory_budget_mb: RSS all loaded packages may use together (0 = unlimited)
+        """
+        self.models = NLPModelPool(
+            {**(language_models or {}), DEFAULT_LANGUAGE: model},
+            exclude=UNUSED_COMPONENTS,
+            memory_budget_mb=memory_budget_mb
+        )
+        # Loaded up front (and reloaded if evicted): fallback for every text of unknown language
+        self.models.get(DEFAULT_LANGUAGE, required=True)
+        self.batch_size = batch_size
+        self.n_process = n_process
+
+        # Explicit skills vocabulary (Common Tech Stack, multilingual aliases) lives in a data file
+        # and is compiled once into a single-pass matcher
+        self.matcher = SkillMatcher(vocabulary_path or DEFAULT_VOCABULARY_PATH)
+        self.common_skills = self.matcher.vocabulary
+
+    @property
+    def nlp(self):
+        """English pipeline."""
+        return self.models.get(DEFAULT_LANGUAGE, required=True)[0]
 
-    def extract(self, text: str) -> Dict[str, List[str]]:
+    def extract(
+        self,
+        text: str,
+        mode: str = "parser",
+        language: str = DEFAULT_LANGUAGE,
+        candidate_text: Optional[str] = None
+    ) -> Dict[str, List[str]]:
         """
-        Extracts explicit skills and candidate noun chunks for semantic analysis.
+        Extracts explicit skills and candidate phrases for semantic analysis.
         """
-        if not text:
-            return {"explicit": [], "candidates": []}
+        return self.extract_many(
+            [text], mode=mode, languages=[language],
+            candidate_texts=[candidate_text] if candidate_text is not None else None
+        )[0]
+
+    def extract_many(
+        self,
+        texts: Iterable[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+        mode: str = "parser",
+        languages: Optional[List[str]] = None,
+        candidate_texts: Optional[List[str]] = None
+    ) -> List[Dict[str, List[str]]]:
+        """
+        Same as extract() for many documents; spaCy processes them in batches
+        (nlp.pipe), which is much faster per document than one call each.
+
+        Args:
+            batch_size: Documents per spaCy batch (default: SPACY_BATCH_SIZE)
+            n_process: spaCy worker processes (default: SPACY_N_PROCESS)
+            mode: "parser" (noun chunks) or "fast" (n-grams, no pipeline components run)
+            languages: Language of each text (default: all English); each is processed
+                by its own language's pipeline, never by another language's model
+            candidate_texts: Part of each text to take candidate phrases from (e.g. its
+                skill sections); explicit skills are always matched in the whole text
+        """
+        if mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode '{mode}'. Use one of: {', '.join(EXTRACTION_MODES)}")
 
         # Normalize text for better extraction
-        text_clean = text.lower()
-        doc = self.nlp(text_clean)
-        
+        texts_clean = [(text or "").lower() for text in texts]
+        results: List[Dict[str, List[str]]] = [{"explicit": [], "candidates": []} for _ in texts_clean]
+        languages = languages or [DEFAULT_LANGUAGE] * len(texts_clean)
+        nlp_texts = [(text or "").lower() for text in candidate_texts] if candidate_texts is not None else texts_clean
+
+        by_language: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts_clean):
+            if text:
+                by_language.setdefault(languages[i], []).append(i)
+
+        for language, indices in by_language.items():
+            if mode == "fast":
+                nlp, parsed = self.models.tokenizer(language), False
+            else:
+                nlp, parsed = self.models.get(language)
+
+            if parsed:
+                docs = nlp.pipe(
+                    (nlp_texts[i] for i in indices),
+                    batch_size=batch_size or self.batch_size,
+                    n_process=n_process or self.n_process
+                )
+                phrases_of = self._noun_chunk_phrases
+            else:
+                docs = (nlp.make_doc(nlp_texts[i]) for i in indices)
+                phrases_of = self._ngram_phrases
+
+            for i, doc in zip(indices, docs):
+                results[i] = self._build_extraction(texts_clean[i], phrases_of(doc))
+        return results
+
+    def _build_extraction(self, text_clean: str, phrases: Iterable[str]) -> Dict[str, List[str]]:
         explicit_skills = self._find_explicit_skills(text_clean)
-        
+
         candidates = []
-        for chunk in doc.noun_chunks:
-            clean_chunk = chunk.text.strip()
+        for phrase in phrases:
+            clean_chunk = phrase.strip()
             word_count = len(clean_chunk.split())
-            
-            if 1 <= word_count <= 5 and clean_chunk not in explicit_skills:
+
+            if 1 <= word_count <= MAX_CANDIDATE_WORDS and clean_chunk not in explicit_skills:
                 candidates.append(clean_chunk)
 
         # Return skills, ensuring they are always in their canonical form
@@ -61,41 +139,31 @@ class SkillExtractor:
             "candidates": list(set(candidates))
         }
 
+    @staticmethod
+    def _noun_chunk_phrases(doc) -> Iterator[str]:
+        for chunk in doc.noun_chunks:
+            yield chunk.text
+
+    @staticmethod
+    def _ngram_phrases(doc) -> Iterator[str]:
+        """
+        Every 1-5 token window inside runs of content tokens; stop words,
+        line breaks and tokens without letters (punctuation, numbers, bullets)
+        end a run, much like they bound noun chunks.
+        """
+        run_start = 0
+        for end in range(len(doc) + 1):
+            if end < len(doc):
+                token = doc[end]
+                if not (token.is_stop or token.is_space or not any(c.isalpha() for c in token.text)):
+                    continue
+            # doc[run_start:end] is a run of content tokens
+            for start in range(run_start, end):
+                for stop in range(start + 1, min(start + MAX_CANDIDATE_WORDS, end) + 1):
+                    yield doc[start:stop].text
+            run_start = end + 1
+
     def _find_explicit_skills(self, text: str) -> Set[str]:
-        found = set()
-        text_lower = text.lower()
-        
-        # Mapping for normalization - Standard Tech Names (Canonical English)
-        # Using explicit strings to avoid any encoding mixup
-        normalization_map = {
-            "пайтон": "python", "питон": "python", "piton": "python", "payton": "python",
-            "джаваскрипт": "javascript", "js": "javascript",
-            "тайпскрипт": "typescript", "ts": "typescript",
-            "джава": "java", "ячми": "java", # accidental RU layout for 'java'
-            "раст": "rust",
-            "реактор": "react", "реакт": "react",
-            "ангуляр": "angular",
-            "джанго": "django", "джанго": "django",
-            "фласк": "flask",
-            "фастапи": "fastapi",
-            "докер": "docker", "контейнеризация": "docker",
-            "k8s": "kubernetes", "кубернетес": "kubernetes",
-            "ml": "machine learning", "дл": "deep learning", "dl": "deep learning",
-            "с++": "c++", "с#": "c#", # Cyrillic 'c'
-            "гит": "git", "гитхаб": "git"
-        }
-        
-        for skill in self.common_skills:
-            pattern = None
-            if any(c in skill for c in "+#."):
-                pattern = re.escape(skill)
-            else:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-            
-            if re.search(pattern, text_lower):
-                # Standardize to canonical name if it exists in map, else use skill itself
-                # CRITICAL: We look up the 'skill' as defined in self.common_skills
-                canonical = normalization_map.get(skill.lower(), skill)
-                found.add(canonical)
-                
-        return found
+        # Single scan of the text; aliases (RU/UZ spellings, abbreviations) come back
+        # in their canonical English form
+        return self.matcher.find(text)
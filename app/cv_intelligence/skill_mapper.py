@@ -1,69 +1,79 @@
 import os
 import logging
-from sentence_transformers import SentenceTransformer, util
-import torch
+import numpy as np
+from app.cv_intelligence.embedding_cache import EmbeddingCache
+from app.cv_intelligence.embedding_backends import create_embedding_backend, backend_namespace
+from app.cv_intelligence.ontology import OntologyStore, DEFAULT_ONTOLOGY_PATH
+from app.config import settings
 
 # Suppress noisy transformers logging
 logging.getLogger("transformers").setLevel(logging.ERROR)
 
+# Threshold: How close must the phrase be?
+# "modern javascript" vs "modern javascript" = 1.0
+# "modern js features" vs "modern javascript" ~ 0.8
+# "java" vs "modern javascript" ~ low
+THRESHOLD = 0.65
+
 class SkillMapper:
     def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
         # Check if we can run offline or need to download
         # SentenceTransformer handles downloading automatically to cache
-        print(f"Loading Semantic Model '{model_name}'...")
-        self.model = SentenceTransformer(model_name)
+        print(f"Loading Semantic Model '{model_name}' ({settings.EMBEDDING_BACKEND} backend)...")
+        self.backend = create_embedding_backend(
+            settings.EMBEDDING_BACKEND,
+            model_name,
+            export_dir=settings.EMBEDDING_ONNX_DIR,
+            batch_size=settings.EMBEDDING_BATCH_SIZE,
+            num_threads=settings.EMBEDDING_THREADS,
+            min_parity_cosine=settings.EMBEDDING_PARITY_MIN_COSINE
+        )
+        # Vectors of different backends differ slightly; keep their caches apart
+        namespace = backend_namespace(model_name, settings.EMBEDDING_BACKEND)
         
         # Knowledge Base: Abstract/Vague term -> Concrete Skills
-        # This acts as the "AI Interpretation" layer
-        self.ontology = {
-            "modern javascript": ["ES6+", "Async/Await", "React", "Vue", "Angular", "TypeScript"],
-            "modern js": ["ES6+", "React", "Vue", "Angular"],
-            "modern frontend frameworks": ["React", "Vue", "Angular", "Svelte"],
-            "modern backend frameworks": ["Django", "FastAPI", "NestJS", "Spring Boot"],
-            "full stack": ["Frontend Development", "Backend Development", "Database Management", "API Integration"],
-            "fullstack": ["Frontend Development", "Backend Development", "Database Management"],
-            "backend experience": ["Rest API", "Database Design", "Authentication", "System Architecture", "Caching"],
-            "frontend experience": ["UI/UX Implementation", "Responsive Design", "State Management", "Component Architecture"],
-            "cloud native": ["Microservices", "Docker", "Kubernetes", "AWS", "CI/CD"],
-            "data science stack": ["Python", "Pandas", "NumPy", "Scikit-Learn", "Jupyter"],
-            "big data": ["Hadoop", "Spark", "Kafka", "Data Lakes"]
-        }
-        
-        # Pre-compute embeddings for ontology keys for speed
-        self.ontology_keys = list(self.ontology.keys())
-        self.ontology_embeddings = self.model.encode(self.ontology_keys, convert_to_tensor=True)
+        # This acts as the "AI Interpretation" layer. Loaded from a data file; key embeddings
+        # are precomputed on disk and memory-mapped, so startup encodes nothing
+        self.ontology = OntologyStore(
+            encode_fn=self.backend.encode,
+            namespace=namespace,
+            cache_dir=settings.ONTOLOGY_CACHE_DIR,
+            path=settings.ONTOLOGY_PATH or DEFAULT_ONTOLOGY_PATH,
+            reload_interval=settings.ONTOLOGY_RELOAD_INTERVAL
+        )
+
+        # Resumes share most of their phrases; cache their embeddings across CVs, restarts and workers
+        self.embedding_cache = None
+        if settings.EMBEDDING_CACHE_ENABLED:
+            self.embedding_cache = EmbeddingCache(
+                namespace=namespace,
+                dim=self.backend.dimension(),
+                cache_dir=settings.EMBEDDING_CACHE_DIR,
+                memory_size=settings.EMBEDDING_CACHE_MEMORY_ITEMS,
+                disk_capacity=settings.EMBEDDING_CACHE_DISK_ITEMS
+            )
 
-    def map_skills(self, candidates: list[str]) -> list[str]:
+    def _encode_candidates(self, candidates: list[str]) -> np.ndarray:
+        # Cached phrases skip the model; the rest are batch encoded in one call
+        if self.embedding_cache is not None:
+            return self.embedding_cache.get_many(candidates, self.backend.encode)
+        return self.backend.encode(candidates)
+
+    def map_skills(self, candidates: list[str], top_k: int = 1) -> list[str]:
         """
         Maps candidate phrases (e.g., "experienced in modern js") to concrete skills.
+        With top_k > 1, skills of every close concept are included, not just the best one.
         """
-        inferred = set()
-        
         if not candidates:
             return []
 
-        # Encode candidates
-        # Batch encode is efficient
-        candidate_embeddings = self.model.encode(candidates, convert_to_tensor=True)
-        
-        # Compute Cosine Similarity
-        cosine_scores = util.cos_sim(candidate_embeddings, self.ontology_embeddings)
-        
-        # Threshold: How close must the phrase be? 
-        # "modern javascript" vs "modern javascript" = 1.0
-        # "modern js features" vs "modern javascript" ~ 0.8
-        # "java" vs "modern javascript" ~ low
-        THRESHOLD = 0.65
-        
-        # cosine_scores is [num_candidates, num_ontology_keys]
-        for i in range(len(candidates)):
-            scores = cosine_scores[i]
-            best_score_idx = torch.argmax(scores).item()
-            best_score = scores[best_score_idx].item()
-            
-            if best_score >= THRESHOLD:
-                matched_concept = self.ontology_keys[best_score_idx]
-                # print(f"DEBUG: Mapped '{candidates[i]}' -> '{matched_concept}' ({best_score:.2f})")
-                inferred.update(self.ontology[matched_concept])
-                
+        # Capture once: a concurrent reload swaps keys and index together
+        ontology = self.ontology
+        keys, concepts, index = ontology.keys, ontology.concepts, ontology.index
+        indices, _ = index.search(self._encode_candidates(candidates), k=top_k, threshold=THRESHOLD)
+
+        inferred = set()
+        # Only distinct matched concepts reach Python
+        for concept_idx in np.unique(indices[indices >= 0]).tolist():
+            inferred.update(concepts[keys[concept_idx]])
         return list(inferred)
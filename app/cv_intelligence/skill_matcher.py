@@ -0,0 +1,85 @@
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Set
+
+DEFAULT_VOCABULARY_PATH = os.path.join(os.path.dirname(__file__), "data", "skills.json")
+
+# Skills containing these characters are matched without word boundaries (e.g. "c++", ".net")
+SYMBOL_CHARS = "+#."
+
+def build_trie_pattern(phrases: Iterable[str]) -> str:
+    """
+    Compiles a set of literal phrases into one trie-shaped regex alternation.
+    Shared prefixes are factored out ("py(?:thon|torch)"), so matching cost at a
+    text position depends on the phrase length, not on the vocabulary size.
+    Longer phrases are preferred over their prefixes.
+    """
+    trie: Dict = {}
+    for phrase in phrases:
+        if not phrase:
+            continue
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End-of-phrase marker
+
+    def _to_pattern(node: Dict) -> str:
+        is_terminal = "" in node
+        branches = [re.escape(char) + _to_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not is_terminal:
+            return branches[0]
+        pattern = "(?:" + "|".join(branches) + ")"
+        return pattern + "?" if is_terminal else pattern
+
+    return _to_pattern(trie)
+
+class SkillMatcher:
+    """
+    Single-pass explicit skill matcher.
+    Loads the skill vocabulary (canonical name -> aliases in RU/UZ/EN spellings)
+    from a data file and compiles it once into a trie-shaped regex, so one scan
+    of the text finds every skill and returns canonical names.
+    """
+
+    def __init__(self, vocabulary_path: str = DEFAULT_VOCABULARY_PATH):
+        self.vocabulary_path = vocabulary_path
+        with open(vocabulary_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        self.version = data.get("version", 1)
+
+        # Surface form -> canonical name
+        self.canonical: Dict[str, str] = {}
+        for skill, aliases in data.get("skills", {}).items():
+            skill = skill.lower()
+            self.canonical[skill] = skill
+            for alias in aliases:
+                self.canonical[alias.lower()] = skill
+
+        word_forms = [s for s in self.canonical if not any(c in s for c in SYMBOL_CHARS)]
+        symbol_forms = [s for s in self.canonical if any(c in s for c in SYMBOL_CHARS)]
+
+        alternatives: List[str] = []
+        if word_forms:
+            alternatives.append(r"\b(?:" + build_trie_pattern(word_forms) + r")\b")
+        if symbol_forms:
+            alternatives.append("(?:" + build_trie_pattern(symbol_forms) + ")")
+
+        # Zero-width lookahead lets matches overlap (e.g. "node.js" and "js"),
+        # while the scan itself stays a single pass over the text
+        self.pattern = re.compile("(?=(" + "|".join(alternatives) + "))") if alternatives else None
+
+    @property
+    def vocabulary(self) -> Set[str]:
+        """All surface forms the matcher recognizes."""
+        return set(self.canonical)
+
+    def find(self, text: str) -> Set[str]:
+        """Returns the canonical names of all skills mentioned in the text."""
+        if not text or self.pattern is None:
+            return set()
+        canonical = self.canonical
+        return {canonical[m.group(1)] for m in self.pattern.finditer(text.lower())}
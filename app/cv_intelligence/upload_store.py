@@ -0,0 +1,66 @@
+import hashlib
+import os
+import re
+import uuid
+from typing import BinaryIO, Optional, Tuple
+from app.cv_intelligence.batch_import import copy_limited
+
+_HASH_NAME = re.compile(r"^[0-9a-f]{64}$")
+
+class UploadStore:
+    """
+    Content-addressed storage for uploaded CVs.
+
+    Files are hashed (SHA-256) while they stream to disk and stored as
+    uploads/<sha256><ext>, so byte-identical uploads share one file. The hash is
+    also the key of CVAnalysisStore, which lets a known CV skip analysis entirely.
+    """
+
+    def __init__(self, directory: str, url_prefix: str = "uploads"):
+        self.directory = directory
+        self.url_prefix = url_prefix
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, stream: BinaryIO, ext: str, max_bytes: Optional[int] = None) -> Tuple[str, str]:
+        """
+        Stream a file into the store.
+
+        Returns:
+            (cv_path, content_hash): cv_path is relative to the project root (stored in DB)
+        """
+        # Unique temporary name in the same directory, so the final rename is atomic
+        tmp_path = os.path.join(self.directory, f".upload-{uuid.uuid4().hex}{ext}.tmp")
+        digest = hashlib.sha256()
+        try:
+            with open(tmp_path, "wb") as buffer:
+                copy_limited(stream, buffer, max_bytes, digest=digest)
+            content_hash = digest.hexdigest()
+            final_path = os.path.join(self.directory, f"{content_hash}{ext}")
+            if os.path.exists(final_path):
+                # Same bytes already stored: keep the existing file
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, final_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return f"{self.url_prefix}/{content_hash}{ext}", content_hash
+
+    def abs_path(self, cv_path: str) -> str:
+        return os.path.join(self.directory, os.path.basename(cv_path))
+
+    def content_hash(self, cv_path: str) -> str:
+        """
+        Content hash of a stored CV: read from the file name for content-addressed
+        files, computed for files stored before (uploads/<uuid><ext>).
+        """
+        name = os.path.splitext(os.path.basename(cv_path))[0]
+        if _HASH_NAME.match(name):
+            return name
+        digest = hashlib.sha256()
+        with open(self.abs_path(cv_path), "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
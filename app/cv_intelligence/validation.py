@@ -0,0 +1,133 @@
+import json
+import logging
+import re
+from app.cv_intelligence.schemas import ResumeValidation
+from app.cv_intelligence.sections import RESUME_MARKERS
+from app.cv_intelligence.skill_matcher import build_trie_pattern
+from app.config import settings
+
+# Scoring heuristics
+VALIDATION_THRESHOLD = 20
+MIN_RESUME_CHARS = 50
+LONG_DOCUMENT_CHARS = 3000  # Longer texts need at least 3 markers ("fairy tales" otherwise)
+
+# All markers in one trie-shaped alternation, matched as plain substrings of the
+# lowercased text (like "marker in text"). Occurrences glued into each other
+# ("projectskills") count for the first marker only.
+_MARKERS = re.compile(build_trie_pattern(RESUME_MARKERS))
+_EMAIL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE = re.compile(r'\+?\d{9,15}')
+_YEARS = re.compile(r'\b(19|20)\d{2}\b')
+
+logger = logging.getLogger(__name__)
+
+def configure_logger(level: str = settings.CV_VALIDATION_LOG_LEVEL):
+    """
+    Diagnostics go to stderr at the given level; "OFF" (the default) disables them.
+    Runs at import, so every analysis worker process picks up the setting.
+    """
+    level = (level or "OFF").upper()
+    logger.handlers.clear()
+    logger.propagate = False
+    if level == "OFF":
+        logger.disabled = True
+        return
+    logger.disabled = False
+    logger.setLevel(level)
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+    logger.addHandler(handler)
+
+configure_logger()
+
+def count_markers(text_lower: str) -> dict:
+    """Resume marker -> occurrences, in one pass over the (lowercased) text."""
+    counts = {}
+    for marker in _MARKERS.findall(text_lower):
+        counts[marker] = counts.get(marker, 0) + 1
+    return counts
+
+class ResumeValidator:
+    """
+    Scores a document fed in parts (e.g. PDF pages as they are extracted), so
+    validation keeps up with extraction instead of waiting for the whole text.
+    Parts are the pieces of the final text joined with newlines; none of the
+    signals can span a line break, so the result equals validate_resume() of
+    the joined text.
+    """
+
+    def __init__(self):
+        self.char_count = 0
+        self.markers = {}
+        self.has_email = False
+        self.has_phone = False
+        self.has_years = False
+
+    def feed(self, text: str):
+        """Adds the next part of the document (empty parts are skipped, like empty lines)."""
+        if not text:
+            return
+        self.char_count += len(text) + (1 if self.char_count else 0)
+        for marker, count in count_markers(text.lower()).items():
+            self.markers[marker] = self.markers.get(marker, 0) + count
+        self.has_email = self.has_email or bool(_EMAIL.search(text))
+        self.has_phone = self.has_phone or bool(_PHONE.search(text))
+        self.has_years = self.has_years or bool(_YEARS.search(text))
+
+    def result(self) -> ResumeValidation:
+        """The validation of everything fed so far; is_resume is score >= VALIDATION_THRESHOLD."""
+        char_count = self.char_count
+        if char_count < MIN_RESUME_CHARS:
+            validation = ResumeValidation(
+                is_resume=False, score=0, threshold=VALIDATION_THRESHOLD, char_count=char_count,
+                reason="empty text" if not char_count else f"too short ({char_count} chars)"
+            )
+            _log(validation)
+            return validation
+
+        markers = self.markers
+        score = 0
+        reason = None
+        # Contact info is a very strong signal
+        if self.has_email or self.has_phone:
+            score += 20
+        if len(markers) >= 2:
+            score += 20
+        elif len(markers) >= 1:
+            score += 10
+        if self.has_years:
+            score += 10
+        # Long text with few markers: a story or an article rather than a CV
+        if char_count > LONG_DOCUMENT_CHARS and len(markers) < 3:
+            score -= 15
+            reason = f"long document ({char_count} chars) with {len(markers)} markers"
+
+        validation = ResumeValidation(
+            is_resume=score >= VALIDATION_THRESHOLD,
+            score=score,
+            threshold=VALIDATION_THRESHOLD,
+            char_count=char_count,
+            markers=dict(markers),
+            has_email=self.has_email,
+            has_phone=self.has_phone,
+            has_years=self.has_years,
+            reason=reason
+        )
+        _log(validation)
+        return validation
+
+def validate_resume(text: str) -> ResumeValidation:
+    """
+    Scores how much a text looks like a resume: contact info, section markers
+    and years. Returns the score with the signals behind it, so callers can log
+    or store the decision; is_resume is score >= VALIDATION_THRESHOLD.
+    """
+    validator = ResumeValidator()
+    validator.feed(text.strip() if text else "")
+    return validator.result()
+
+def _log(validation: ResumeValidation):
+    # Rejections at INFO, accepted CVs at DEBUG; nothing is formatted while logging is off
+    level = logging.DEBUG if validation.is_resume else logging.INFO
+    if logger.isEnabledFor(level):
+        logger.log(level, "resume_validation %s", json.dumps(validation.dict(), ensure_ascii=False))
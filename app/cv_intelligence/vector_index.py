@@ -0,0 +1,81 @@
+from typing import Optional, Tuple
+import numpy as np
+
+QUERY_BLOCK_SIZE = 1024  # Queries scored per matrix product; bounds the temporary score block
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row as float32; zero rows stay zero."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+class FlatIndex:
+    """
+    Exact nearest-neighbour index over L2-normalized vectors.
+
+    Cosine similarity is a single matrix product against the stored rows, and the
+    best/top-k selection and thresholding are array operations over the whole
+    score block, so cost does not depend on a Python loop over queries. This stays
+    fast well past 10k keys (one BLAS call per block of queries).
+    """
+
+    def __init__(self, vectors: np.ndarray, normalized: bool = False):
+        """
+        Args:
+            vectors: (n_keys, dim) matrix; may be a read-only memmap
+            normalized: Rows are already unit length (used as-is, never copied)
+        """
+        self.vectors = vectors if normalized else normalize_rows(vectors)
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int = 1,
+        threshold: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k most similar keys for every query.
+
+        Args:
+            queries: (n_queries, dim) matrix, normalized here
+            k: Neighbours per query
+            threshold: Minimum cosine similarity; weaker neighbours are reported as -1
+
+        Returns:
+            (indices, scores), both (n_queries, k), each row ordered by descending
+            score. Missing neighbours have index -1 and score -inf.
+        """
+        n_queries = queries.shape[0]
+        k = max(1, min(k, len(self)))
+        indices = np.full((n_queries, k), -1, dtype=np.int64)
+        scores = np.full((n_queries, k), -np.inf, dtype=np.float32)
+        if n_queries == 0 or len(self) == 0:
+            return indices, scores
+
+        queries = normalize_rows(queries)
+        for start in range(0, n_queries, QUERY_BLOCK_SIZE):
+            block = queries[start:start + QUERY_BLOCK_SIZE] @ self.vectors.T
+            rows = np.arange(block.shape[0])[:, None]
+
+            if k == 1:
+                top = np.argmax(block, axis=1)[:, None]
+            else:
+                # Unordered top-k in O(n_keys), then sort only those k
+                top = np.argpartition(block, -k, axis=1)[:, -k:]
+                order = np.argsort(-block[rows, top], axis=1)
+                top = top[rows, order]
+
+            top_scores = block[rows, top]
+            if threshold is not None:
+                weak = top_scores < threshold
+                top = np.where(weak, -1, top)
+                top_scores = np.where(weak, -np.inf, top_scores)
+
+            indices[start:start + block.shape[0]] = top
+            scores[start:start + block.shape[0]] = top_scores
+
+        return indices, scores
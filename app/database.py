@@ -1,7 +1,9 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from app.config import settings
 
 # Use SQLite for development, PostgreSQL can be configured via ENV
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./hr_system.db")
@@ -10,11 +12,86 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./hr_system.db")
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+def is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+def sqlite_pragmas(read_only: bool = False) -> list:
+    """PRAGMA statements run on every new SQLite connection (the SQLite profile in settings)."""
+    pragmas = [
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024}",
+        f"PRAGMA cache_size={-settings.SQLITE_CACHE_SIZE_MB * 1024}"  # Negative = KiB, not pages
+    ]
+    if read_only:
+        # WAL is a property of the file and set by the writing engines; this connection can't change it
+        pragmas.append("PRAGMA query_only=ON")
+    else:
+        pragmas.insert(0, "PRAGMA journal_mode=WAL")
+    return pragmas
+
+def engine_options(url: str, read_only: bool = False) -> dict:
+    """
+    create_engine / create_async_engine arguments for a database URL. Every engine gets an
+    explicitly sized queue pool; a connection is used by one thread or task at a time, so
+    SQLite connections may move between the threads of the pool.
+    """
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT
+    }
+    if is_sqlite(url):
+        options["connect_args"] = {"check_same_thread": False}
+    elif read_only and "+asyncpg" in url:
+        options["connect_args"] = {"server_settings": {"default_transaction_read_only": "on"}}
+    elif read_only:
+        options["connect_args"] = {"options": "-c default_transaction_read_only=on"}
+    return options
+
+def apply_sqlite_profile(sync_engine, read_only: bool = False):
+    """Runs sqlite_pragmas() on each connection the engine opens (no-op for other databases)."""
+    if not is_sqlite(str(sync_engine.url)):
+        return
+    pragmas = sqlite_pragmas(read_only)
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+apply_sqlite_profile(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async drivers for the same database, used by request handlers so queries never block the event loop
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+def async_database_url(url: str) -> str:
+    """The same database URL with its async driver (sqlite -> aiosqlite, postgresql -> asyncpg)."""
+    scheme, rest = url.split("://", 1)
+    dialect = scheme.split("+", 1)[0]
+    if dialect not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver known for '{dialect}' databases; set ASYNC_DATABASE_URL")
+    return f"{dialect}+{ASYNC_DRIVERS[dialect]}://{rest}"
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or async_database_url(DATABASE_URL)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL))
+apply_sqlite_profile(async_engine.sync_engine)
+# Objects stay usable after commit (handlers read them after the session is closed)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Admin/reporting reads: a replica when READ_DATABASE_URL is set, else the main database through
+# read-only connections of their own, so dashboards never hold connections or locks candidates need
+READ_DATABASE_URL = async_database_url(settings.READ_DATABASE_URL) if settings.READ_DATABASE_URL else ASYNC_DATABASE_URL
+
+async_read_engine = create_async_engine(READ_DATABASE_URL, **engine_options(READ_DATABASE_URL, read_only=True))
+apply_sqlite_profile(async_read_engine.sync_engine, read_only=True)
+AsyncReadSessionLocal = async_sessionmaker(bind=async_read_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -23,3 +100,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_async_read_db():
+    async with AsyncReadSessionLocal() as db:
+        yield db
@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import select, update
+from app.database import AsyncSessionLocal
+from app.models import AnswerRecord, SessionModel
+from app.interview_flow.schemas import Answer
+
+SQL_MAX_VARIABLES = 500  # Chunk size for IN (...) queries
+
+def parse_legacy_answers(answers_raw: Optional[List[dict]]) -> List[Answer]:
+    """Answers from the legacy interview_sessions.answers JSON list."""
+    parsed_answers = []
+    for a in answers_raw or []:
+        try:
+            parsed_answers.append(Answer(**a))
+        except Exception:
+            # Keep compatibility with older shapes if any
+            parsed_answers.append(Answer(
+                question_id=a.get("question_id", -1),
+                answer_text=a.get("answer_text", ""),
+                time_spent=int(a.get("time_spent", 0) or 0),
+                submitted_at=a.get("submitted_at") or datetime.utcnow(),
+                is_timeout=bool(a.get("is_timeout", False)),
+                ai_score=float(a.get("ai_score", 0.0) or 0.0),
+                ai_explanation=a.get("ai_explanation", "") or ""
+            ))
+    return parsed_answers
+
+class AnswerStore:
+    """
+    Interview answers, one row each in interview_answers. Submitting an answer
+    is a single-row insert (no rewrite of the session's answers so far), and
+    reads are indexed queries by session. All methods use the async engine.
+    """
+
+    def __init__(self, session_factory=AsyncSessionLocal):
+        self.session_factory = session_factory
+
+    async def append(self, session_id: str, ordinal: int, answer: Answer):
+        """
+        Stores the answer to question number ordinal and moves the session's
+        question index past it, in one transaction.
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: That question already has an answer
+        """
+        db = self.session_factory()
+        try:
+            db.add(AnswerRecord(
+                session_id=session_id,
+                ordinal=ordinal,
+                question_id=answer.question_id,
+                answer_text=answer.answer_text,
+                time_spent=answer.time_spent,
+                submitted_at=answer.submitted_at,
+                is_timeout=answer.is_timeout,
+                ai_score=answer.ai_score,
+                ai_explanation=answer.ai_explanation
+            ))
+            await db.execute(
+                update(SessionModel).where(SessionModel.id == session_id).values(current_question_index=ordinal + 1)
+            )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        finally:
+            await db.close()
+
+    async def get(self, session_id: str) -> List[Answer]:
+        """Answers of a session, in interview order."""
+        return (await self.get_many([session_id])).get(session_id, [])
+
+    async def get_many(self, session_ids: Iterable[str]) -> Dict[str, List[Answer]]:
+        """Session ID -> its answers in interview order (one query per SQL_MAX_VARIABLES sessions)."""
+        session_ids = list(session_ids)
+        if not session_ids:
+            return {}
+        db = self.session_factory()
+        try:
+            answers: Dict[str, List[Answer]] = {}
+            for start in range(0, len(session_ids), SQL_MAX_VARIABLES):
+                records = (await db.execute(
+                    select(AnswerRecord)
+                    .where(AnswerRecord.session_id.in_(session_ids[start:start + SQL_MAX_VARIABLES]))
+                    .order_by(AnswerRecord.session_id, AnswerRecord.ordinal)
+                )).scalars().all()
+                for record in records:
+                    answers.setdefault(record.session_id, []).append(self._to_answer(record))
+            return answers
+        finally:
+            await db.close()
+
+    @staticmethod
+    def _to_answer(record: AnswerRecord) -> Answer:
+        return Answer(
+            question_id=record.question_id if record.question_id is not None else -1,
+            answer_text=record.answer_text or "",
+            time_spent=record.time_spent or 0,
+            submitted_at=record.submitted_at,
+            is_timeout=bool(record.is_timeout),
+            ai_score=record.ai_score or 0.0,
+            ai_explanation=record.ai_explanation or ""
+        )
@@ -51,6 +51,13 @@ class InterviewSession(BaseModel):
     status_internal: str = "PENDING" 
     status_public: str = "UNDER_REVIEW"
 
+class QuestionState(BaseModel):
+    """Live part of an interview, kept in the session state backend"""
+    session_id: str
+    question_index: int
+    started_at: float  # Unix time the question was shown
+    deadline: float    # Unix time its time limit runs out
+
 class SessionSummary(BaseModel):
     """Summary of completed interview session"""
     session_id: str
@@ -60,3 +67,15 @@ class SessionSummary(BaseModel):
     total_time_spent: int  # seconds
     status: SessionStatus
     answers: List[Answer]
+
+class SessionCacheStats(BaseModel):
+    """In-memory session cache counters (SessionManager)"""
+    size: int
+    pinned: int  # Sessions with a running question; never evicted for room
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int  # Absent or expired; the session is reloaded from the database
+    hit_rate: float
+    evictions: int
+    expirations: int
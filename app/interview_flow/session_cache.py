@@ -0,0 +1,154 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+from app.interview_flow.schemas import InterviewSession, SessionCacheStats
+from app.interview_flow.answer_handler import AnswerHandler
+
+class _CacheEntry:
+    def __init__(self, session: InterviewSession, now: float):
+        self.session = session
+        self.answer_handler: Optional[AnswerHandler] = None
+        self.last_access = now
+
+    @property
+    def pinned(self) -> bool:
+        # An interview in progress: read on every candidate request
+        return self.session.current_question is not None
+
+class SessionCache:
+    """
+    In-memory interview sessions (with their answer handlers), bounded in size
+    and age so memory stays flat over long uptimes.
+
+    Sessions with a running question are pinned: candidates poll them on every
+    request. Everything else - finished sessions, sessions hydrated
+    from the database for admin/report endpoints - is evicted least recently used
+    once the cache holds more than max_size sessions, or once it has not been
+    used for ttl seconds; SessionManager reloads it from the database on demand.
+    A pinned session untouched for abandoned_after seconds (the candidate left)
+    is unpinned, so abandoned interviews do not pile up either.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 500,
+        ttl: float = 1800,
+        abandoned_after: float = 86400,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_size: Sessions kept in memory (pinned ones may exceed it)
+            ttl: Seconds an unpinned session is kept since its last use (0 = no TTL)
+            abandoned_after: Seconds after which a pinned session is dropped anyway (0 = never)
+            clock: Monotonic time source, in seconds
+        """
+        self.max_size = max(1, max_size)
+        self.ttl = ttl
+        self.abandoned_after = abandoned_after
+        self.clock = clock
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0    # Dropped for room (LRU)
+        self.expirations = 0  # Dropped for age (TTL / abandoned)
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, session_id: str) -> Optional[InterviewSession]:
+        """Cached session, or None on a miss (absent or expired)."""
+        entry = self._entry(session_id, count=True)
+        return entry.session if entry else None
+
+    def put(self, session: InterviewSession):
+        """Caches a session (replacing any cached copy) and makes room if needed."""
+        with self._lock:
+            now = self.clock()
+            entry = self._entries.get(session.session_id)
+            if entry is None:
+                entry = _CacheEntry(session, now)
+                self._entries[session.session_id] = entry
+            else:
+                entry.session = session
+                entry.last_access = now
+                self._entries.move_to_end(session.session_id)
+            self._evict(now)
+
+    def get_answer_handler(self, session_id: str) -> Optional[AnswerHandler]:
+        entry = self._entry(session_id)
+        return entry.answer_handler if entry else None
+
+    def set_answer_handler(self, session_id: str, handler: AnswerHandler):
+        entry = self._entry(session_id)
+        if entry is None:
+            raise KeyError(session_id)
+        entry.answer_handler = handler
+
+    def stats(self) -> SessionCacheStats:
+        with self._lock:
+            self._evict(self.clock())
+            lookups = self.hits + self.misses
+            return SessionCacheStats(
+                size=len(self._entries),
+                pinned=sum(1 for entry in self._entries.values() if entry.pinned),
+                max_size=self.max_size,
+                ttl_seconds=self.ttl,
+                hits=self.hits,
+                misses=self.misses,
+                hit_rate=round(self.hits / lookups, 4) if lookups else 0.0,
+                evictions=self.evictions,
+                expirations=self.expirations
+            )
+
+    def _entry(self, session_id: str, count: bool = False) -> Optional[_CacheEntry]:
+        with self._lock:
+            now = self.clock()
+            entry = self._entries.get(session_id)
+            if entry is not None and self._expired(entry, now):
+                del self._entries[session_id]
+                self.expirations += 1
+                entry = None
+            if count:
+                if entry is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+            if entry is not None:
+                entry.last_access = now
+                self._entries.move_to_end(session_id)
+            return entry
+
+    def _expired(self, entry: _CacheEntry, now: float) -> bool:
+        age = now - entry.last_access
+        if entry.pinned:
+            return bool(self.abandoned_after) and age > self.abandoned_after
+        return bool(self.ttl) and age > self.ttl
+
+    def _evict(self, now: float):
+        # Entries are in last-use order, so expired and least recently used ones are at the front
+        limits = [t for t in (self.ttl, self.abandoned_after) if t]
+        if limits:
+            shortest = min(limits)
+            for session_id, entry in list(self._entries.items()):
+                if now - entry.last_access <= shortest:
+                    break
+                if self._expired(entry, now):
+                    del self._entries[session_id]
+                    self.expirations += 1
+
+        if len(self._entries) <= self.max_size:
+            return
+        for session_id, entry in list(self._entries.items()):
+            if len(self._entries) <= self.max_size:
+                break
+            if not entry.pinned:
+                del self._entries[session_id]
+                self.evictions += 1
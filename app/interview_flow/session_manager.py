@@ -3,39 +3,64 @@ from app.interview_flow.schemas import (
     SessionStatus,
     QuestionProgress,
     Answer,
-    SessionSummary
+    SessionSummary,
+    SessionCacheStats,
+    QuestionState
 )
 from app.interview_flow.timer import Timer
 from app.interview_flow.answer_handler import AnswerHandler
+from app.interview_flow.session_cache import SessionCache
+from app.interview_flow.session_state import SessionStateBackend, create_session_state_backend
+from app.interview_flow.answer_store import AnswerStore, parse_legacy_answers
 from app.question_engine.schemas import QuestionSet
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import List, Optional
 import uuid
 import json
+import time
+import asyncio
 from app.notifications.dispatcher import NotificationDispatcher
 from app.notifications.logger import NotificationLogger
-from app.database import SessionLocal
+from sqlalchemy import select
+from sqlalchemy.orm import defer, selectinload
+from app.database import AsyncSessionLocal
 from app.models import Candidate, SessionModel
 from app.answer_analysis.ai_detector import AIDetector
 from app.interview_flow.schemas import SessionStatus as SessionStatusEnum
+from app.config import settings
 
 class SessionManager:
     """
     Manages interview sessions from start to finish.
     Orchestrates question flow, timing, and answer collection.
+
+    The running question of each interview (index and deadline) lives in a
+    session state backend, everything else in the database; with a shared
+    backend, any API worker process can serve any session. Database access
+    goes through the async engine and blocking state backend calls run in a
+    thread, so requests never block the event loop.
     """
     
-    def __init__(self):
-        # Store active sessions in memory
-        # In production, this would be a database
-        self.sessions: Dict[str, InterviewSession] = {}
-        self.timers: Dict[str, Timer] = {}
-        self.answer_handlers: Dict[str, AnswerHandler] = {}
+    def __init__(self, state: Optional[SessionStateBackend] = None):
+        self.state = state or create_session_state_backend(
+            settings.SESSION_STATE_BACKEND,
+            settings.SESSION_STATE_PATH,
+            settings.SESSION_STATE_BUSY_TIMEOUT_MS,
+            settings.SESSION_CACHE_ABANDONED_SECONDS
+        )
+        # Sessions in memory (with their answer handlers); the database is the source
+        # of truth, so anything but a running interview may be evicted and reloaded
+        self.cache = SessionCache(
+            max_size=settings.SESSION_CACHE_MAX_SIZE,
+            ttl=settings.SESSION_CACHE_TTL_SECONDS,
+            abandoned_after=settings.SESSION_CACHE_ABANDONED_SECONDS
+        )
+        self.answer_store = AnswerStore()
         self.notification_dispatcher = NotificationDispatcher()
         self.audit_logger = NotificationLogger()
         self.ai_detector = AIDetector()
     
-    def create_session(
+    async def create_session(
         self,
         candidate_id: str,
         candidate_name: str,
@@ -83,10 +108,10 @@ class SessionManager:
         )
         
         # Database Persistence
-        db = SessionLocal()
+        db = AsyncSessionLocal()
         try:
             # 1. Find or create candidate
-            db_candidate = db.query(Candidate).filter(Candidate.email == candidate_email).first()
+            db_candidate = (await db.execute(select(Candidate).where(Candidate.email == candidate_email))).scalars().first()
             if not db_candidate:
                 db_candidate = Candidate(
                     name=candidate_name,
@@ -103,7 +128,7 @@ class SessionManager:
                 db_candidate.cv_path = cv_path
                 db_candidate.language = candidate_lang
             
-            db.flush() # Get ID / Commit updates
+            await db.flush() # Get ID / Commit updates
             
             # 2. Create DB Session
             db_session = SessionModel(
@@ -124,23 +149,23 @@ class SessionManager:
                 answers=[]
             )
             db.add(db_session)
-            db.commit()
+            await db.commit()
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             print(f"DB Error while creating session: {e}")
         finally:
-            db.close()
+            await db.close()
 
-        # Store session in memory for active tracking (optional, but keep for compatibility)
-        self.sessions[session_id] = session
-        self.answer_handlers[session_id] = AnswerHandler()
+        # Store session in memory for active tracking (pinned while a question runs)
+        self.cache.put(session)
+        self.cache.set_answer_handler(session_id, AnswerHandler())
         
         # Start first question
-        self._start_next_question(session_id)
+        await self._start_first_question(session)
         
         return session
     
-    def get_current_question(self, session_id: str) -> Optional[QuestionProgress]:
+    async def get_current_question(self, session_id: str) -> Optional[QuestionProgress]:
         """
         Get the current question for a session.
         
@@ -150,22 +175,21 @@ class SessionManager:
         Returns:
             QuestionProgress or None
         """
-        session = self.sessions.get(session_id)
-        if not session:
-            # Only active sessions have a current question. For historical sessions, return None.
+        state = await self._state_call(self.state.get, session_id)
+        if not state:
+            # Only running interviews have a current question. For historical sessions, return None.
             return None
         
-        if session.status != SessionStatus.ACTIVE:
+        session = await self._sync_session(session_id, state)
+        if not session:
             return None
         
         # Update time remaining
-        if session.current_question and session_id in self.timers:
-            timer = self.timers[session_id]
-            session.current_question.time_remaining = timer.get_time_remaining()
+        session.current_question.time_remaining = self._time_remaining(state)
         
         return session.current_question
     
-    def submit_answer(
+    async def submit_answer(
         self,
         session_id: str,
         answer_text: str
@@ -180,23 +204,21 @@ class SessionManager:
         Returns:
             Answer object
         """
-        session = self.sessions.get(session_id)
+        state = await self._state_call(self.state.get, session_id)
+        if not state:
+            session = await self._get_session(session_id)
+            if session.status != SessionStatus.ACTIVE:
+                raise ValueError(f"Session {session_id} is not active")
+            raise ValueError("No active question")
+        
+        session = await self._sync_session(session_id, state)
         if not session:
             raise ValueError(f"Session {session_id} not found")
         
-        if session.status != SessionStatus.ACTIVE:
-            raise ValueError(f"Session {session_id} is not active")
-        
-        if not session.current_question:
-            raise ValueError("No active question")
-        
         # Stop timer
-        timer = self.timers.get(session_id)
-        if not timer:
-            raise ValueError("Timer not found")
-        
-        time_spent = timer.stop()
-        is_timeout = timer.is_timeout()
+        now = time.time()
+        time_spent = int(now - state.started_at)
+        is_timeout = self._time_remaining(state, now) == 0
         
         # Submit answer
         # 3. Analyze for AI / Cheating
@@ -212,40 +234,33 @@ class SessionManager:
             ai_explanation=", ".join(ai_result.flags)
         )
         
+        # Move the interview on; only one of several concurrent submissions (on any worker) gets here
+        next_index = state.question_index + 1
+        next_state = self._question_state(session, next_index, now) if next_index < session.total_questions else None
+        if not await self._state_call(self.state.advance, session_id, state.question_index, next_state):
+            raise ValueError("This question has already been answered")
+        
         # Add to session
         session.answers.append(answer)
         
-        # Database Persistence
-        db = SessionLocal()
+        # Database Persistence (one row; earlier answers are not rewritten)
         try:
-            db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
-            if db_session:
-                # Append answer to JSON field (serialize datetime)
-                current_answers = list(db_session.answers) if db_session.answers else []
-                answer_dict = json.loads(answer.json())
-                current_answers.append(answer_dict)
-                db_session.answers = current_answers
-                db_session.current_question_index += 1
-                db.commit()
+            await self.answer_store.append(session_id, state.question_index, answer)
         except Exception as e:
-            db.rollback()
             print(f"DB Error while submitting answer: {e}")
-        finally:
-            db.close()
 
         # Move to next question in memory
-        session.current_question_index += 1
-        
-        if session.current_question_index >= session.total_questions:
+        if next_state is None:
             # Interview finished
-            self._finish_session(session_id)
+            session.current_question_index = next_index
+            await self._finish_session(session)
         else:
             # Start next question
-            self._start_next_question(session_id)
+            self._apply_state(session, next_state)
         
         return answer
     
-    def get_session_status(self, session_id: str) -> InterviewSession:
+    async def get_session_status(self, session_id: str) -> InterviewSession:
         """
         Get current session status.
         
@@ -255,22 +270,17 @@ class SessionManager:
         Returns:
             InterviewSession object
         """
-        session = self.sessions.get(session_id)
-        if not session:
-            # Fallback: hydrate from DB for completed/historical sessions (admin + AI analysis)
-            session = self._load_session_from_db(session_id)
-            if not session:
-                raise ValueError(f"Session {session_id} not found")
+        session = await self._get_session(session_id)
         
         # Update current question time if active
         if session.status == SessionStatus.ACTIVE and session.current_question:
-            timer = self.timers.get(session_id)
-            if timer:
-                session.current_question.time_remaining = timer.get_time_remaining()
+            state = await self._state_call(self.state.get, session_id)
+            if state:
+                session.current_question.time_remaining = self._time_remaining(state)
         
         return session
     
-    def get_session_summary(self, session_id: str) -> SessionSummary:
+    async def get_session_summary(self, session_id: str) -> SessionSummary:
         """
         Get summary of completed session.
         
@@ -280,11 +290,7 @@ class SessionManager:
         Returns:
             SessionSummary object
         """
-        session = self.sessions.get(session_id)
-        if not session:
-            session = self._load_session_from_db(session_id)
-            if not session:
-                raise ValueError(f"Session {session_id} not found")
+        session = await self._get_session(session_id)
 
         # Compute total time from answers (AnswerHandler is not a reliable source for historical sessions)
         total_time = sum(a.time_spent for a in (session.answers or []))
@@ -299,14 +305,51 @@ class SessionManager:
             answers=session.answers
         )
 
-    def _load_session_from_db(self, session_id: str) -> Optional[InterviewSession]:
+    def cache_stats(self) -> SessionCacheStats:
+        """Size and hit/miss/eviction counters of the in-memory session cache."""
+        return self.cache.stats()
+
+    async def _get_session(self, session_id: str) -> InterviewSession:
+        """Session from memory, else hydrated from the DB (completed/historical sessions, admin + AI analysis)."""
+        state = await self._state_call(self.state.get, session_id)
+        if state:
+            session = await self._sync_session(session_id, state)
+        else:
+            # With a shared backend, another worker may have finished or updated the session since it was cached
+            session = None if self.state.shared else self.cache.get(session_id)
+            if not session:
+                session = await self._load_session_from_db(session_id)
+                # Cache it for subsequent admin/report requests (evictable: it has no running question)
+                if session and not self.state.shared:
+                    self.cache.put(session)
+        if not session:
+            raise ValueError(f"Session {session_id} not found")
+        return session
+
+    async def _sync_session(self, session_id: str, state: QuestionState) -> Optional[InterviewSession]:
+        """The running session, brought up to date with its state (another worker may have moved it on)."""
+        session = self.cache.get(session_id)
+        if not session or len(session.answers) != state.question_index:
+            session = await self._load_session_from_db(session_id)
+            if not session:
+                return None
+            self.cache.put(session)
+        self._apply_state(session, state)
+        return session
+
+    async def _load_session_from_db(self, session_id: str) -> Optional[InterviewSession]:
         """
         Hydrate an InterviewSession from the database for admin/reporting endpoints.
         This preserves the existing DB structure and avoids rewriting session flow.
         """
-        db = SessionLocal()
+        db = AsyncSessionLocal()
         try:
-            db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
+            # The legacy answers JSON is only loaded if the session has no answer rows
+            db_session = (await db.execute(
+                select(SessionModel)
+                .options(defer(SessionModel.answers), selectinload(SessionModel.candidate))
+                .where(SessionModel.id == session_id)
+            )).scalars().first()
             if not db_session:
                 return None
 
@@ -316,23 +359,11 @@ class SessionManager:
             candidate_phone = db_session.candidate_phone or (candidate.phone if candidate else "")
             candidate_lang = getattr(db_session, "candidate_lang", None) or (candidate.language if candidate else "en")
 
-            # Parse answers into Pydantic Answer objects (handles datetime parsing)
-            answers_raw = list(db_session.answers) if db_session.answers else []
-            parsed_answers = []
-            for a in answers_raw:
-                try:
-                    parsed_answers.append(Answer(**a))
-                except Exception:
-                    # Keep compatibility with older shapes if any
-                    parsed_answers.append(Answer(
-                        question_id=a.get("question_id", -1),
-                        answer_text=a.get("answer_text", ""),
-                        time_spent=int(a.get("time_spent", 0) or 0),
-                        submitted_at=a.get("submitted_at") or datetime.utcnow(),
-                        is_timeout=bool(a.get("is_timeout", False)),
-                        ai_score=float(a.get("ai_score", 0.0) or 0.0),
-                        ai_explanation=a.get("ai_explanation", "") or ""
-                    ))
+            # Answers rows (indexed by session); sessions not yet migrated still have the legacy JSON list
+            parsed_answers = await self.answer_store.get(session_id)
+            if not parsed_answers:
+                answers_raw = (await db.execute(select(SessionModel.answers).where(SessionModel.id == session_id))).scalar()
+                parsed_answers = parse_legacy_answers(answers_raw)
 
             status_val = db_session.status or SessionStatus.ACTIVE.value
             status_enum = SessionStatusEnum.FINISHED if status_val == SessionStatus.FINISHED.value else SessionStatusEnum.ACTIVE
@@ -356,74 +387,83 @@ class SessionManager:
                 current_question=None
             )
 
-            # Cache it for subsequent admin/report requests
-            self.sessions[session_id] = session
             return session
         finally:
-            db.close()
+            await db.close()
     
-    def _start_next_question(self, session_id: str):
-        """Start the next question in the session"""
-        session = self.sessions[session_id]
-        
-        if session.current_question_index >= len(session.questions):
+    async def _start_first_question(self, session: InterviewSession):
+        """Start the first question of a new session"""
+        if not session.questions:
             return
-        
-        # Get next question
-        question_data = session.questions[session.current_question_index]
-        
-        # Create question progress
-        question_progress = QuestionProgress(
+        state = self._question_state(session, 0, time.time())
+        await self._state_call(self.state.start, state)
+        self._apply_state(session, state)
+
+    async def _state_call(self, method, *args):
+        """Calls a session state backend method; blocking backends (SQLite) run in a thread, off the event loop."""
+        if self.state.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    def _question_state(self, session: InterviewSession, index: int, now: float) -> QuestionState:
+        difficulty = session.questions[index]["difficulty"]
+        return QuestionState(
+            session_id=session.session_id,
+            question_index=index,
+            started_at=now,
+            deadline=now + Timer.get_time_limit(difficulty)
+        )
+
+    def _apply_state(self, session: InterviewSession, state: QuestionState):
+        """Points the session at the question its state says is running"""
+        question_data = session.questions[state.question_index]
+        session.status = SessionStatus.ACTIVE
+        session.current_question_index = state.question_index
+        session.current_question = QuestionProgress(
             question_id=question_data["id"],
             question_text=question_data["question"],
             skill=question_data["skill"],
             difficulty=question_data["difficulty"],
             time_limit=Timer.get_time_limit(question_data["difficulty"]),
-            started_at=datetime.now()
+            started_at=datetime.fromtimestamp(state.started_at)
         )
-        
-        # Start timer
-        timer = Timer(question_data["difficulty"])
-        timer.start()
-        self.timers[session_id] = timer
-        
-        # Update session
-        session.current_question = question_progress
+
+    @staticmethod
+    def _time_remaining(state: QuestionState, now: Optional[float] = None) -> int:
+        # Same rounding as Timer: whole seconds spent against the limit
+        time_spent = int((now or time.time()) - state.started_at)
+        return max(0, int(round(state.deadline - state.started_at)) - time_spent)
     
-    def _finish_session(self, session_id: str):
+    async def _finish_session(self, session: InterviewSession):
         """Mark session as finished"""
-        session = self.sessions[session_id]
+        session_id = session.session_id
         session.status = SessionStatus.FINISHED
         session.end_time = datetime.now()
-        session.current_question = None
+        session.current_question = None  # No longer pinned in the session cache
         
         # Database Persistence
-        db = SessionLocal()
+        db = AsyncSessionLocal()
         try:
-            db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
+            db_session = await db.get(SessionModel, session_id)
             if db_session:
                 db_session.status = SessionStatus.FINISHED.value
                 db_session.end_time = session.end_time
-                db.commit()
+                await db.commit()
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             print(f"DB Error while finishing session: {e}")
         finally:
-            db.close()
-
-        # Clean up timer
-        if session_id in self.timers:
-            del self.timers[session_id]
+            await db.close()
 
     async def update_status(self, session_id: str, new_internal: str, new_public: Optional[str] = None, actor: str = "HR_SYSTEM"):
         """
         Update internal and/or public status.
         If public status changes, trigger notification.
         """
-        session = self.sessions.get(session_id)
-        db = SessionLocal()
+        session = self.cache.get(session_id)
+        db = AsyncSessionLocal()
         try:
-            db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
+            db_session = await db.get(SessionModel, session_id, options=[selectinload(SessionModel.candidate)])
             if not session and not db_session:
                 raise ValueError(f"Session {session_id} not found")
 
@@ -436,7 +476,7 @@ class SessionManager:
                 db_session.status_internal = new_internal
                 if new_public:
                     db_session.status_public = new_public
-                db.commit()
+                await db.commit()
             
             # Update memory
             if session:
@@ -469,8 +509,8 @@ class SessionManager:
             else:
                 print(f"DEBUG: Notification skipped. new_public({new_public}) == old_public({old_public})")
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             print(f"Error in update_status: {e}")
             raise
         finally:
-            db.close()
+            await db.close()
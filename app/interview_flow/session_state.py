@@ -0,0 +1,198 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Callable, Dict, Optional
+from app.interview_flow.schemas import QuestionState
+
+BACKENDS = ("memory", "sqlite")
+
+class SessionStateBackend:
+    """
+    Where the live part of each interview is kept: the running question and its
+    deadline. Everything else about a session is in the database, so with a
+    shared backend any API worker process can serve any session.
+    Selected by Settings.SESSION_STATE_BACKEND; another store (e.g. Redis) only
+    needs these methods.
+    """
+    name = "base"
+    shared = False  # True: all processes see the same state
+    blocking = False  # True: calls wait on I/O, so SessionManager runs them in a thread
+
+    def get(self, session_id: str) -> Optional[QuestionState]:
+        """State of a running interview; None once it is over (or unknown)."""
+        raise NotImplementedError
+
+    def start(self, state: QuestionState):
+        """Stores the state of a new interview (replacing any previous one)."""
+        raise NotImplementedError
+
+    def advance(self, session_id: str, from_index: int, next_state: Optional[QuestionState]) -> Optional[QuestionState]:
+        """
+        Atomically replaces the state of a session that is at question from_index
+        with next_state (None: the interview is over) and returns the replaced state.
+        Returns None if the session is not at that question, e.g. because a
+        concurrent request already answered it.
+        """
+        raise NotImplementedError
+
+    def running(self) -> int:
+        """Number of running interviews."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class InProcessSessionState(SessionStateBackend):
+    """
+    State in this process only: the API must run as a single worker.
+    An interview left unfinished is dropped abandoned_after seconds past its
+    question's deadline, like its session in the session cache, so abandoned
+    interviews do not pile up.
+    """
+    name = "memory"
+
+    def __init__(self, abandoned_after: float = 0, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            abandoned_after: Seconds past the deadline after which an interview is dropped (0 = never)
+            clock: Wall-clock time source (deadlines are time.time() values)
+        """
+        self.abandoned_after = abandoned_after
+        self.clock = clock
+        self._states: Dict[str, QuestionState] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[QuestionState]:
+        with self._lock:
+            return self._current(session_id)
+
+    def start(self, state: QuestionState):
+        with self._lock:
+            self._expire()
+            self._states[state.session_id] = state
+
+    def advance(self, session_id: str, from_index: int, next_state: Optional[QuestionState]) -> Optional[QuestionState]:
+        with self._lock:
+            current = self._current(session_id)
+            if current is None or current.question_index != from_index:
+                return None
+            if next_state is None:
+                del self._states[session_id]
+            else:
+                self._states[session_id] = next_state
+            return current
+
+    def running(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._states)
+
+    def _abandoned(self, state: QuestionState, now: float) -> bool:
+        return bool(self.abandoned_after) and now - state.deadline > self.abandoned_after
+
+    def _current(self, session_id: str) -> Optional[QuestionState]:
+        state = self._states.get(session_id)
+        if state is not None and self._abandoned(state, self.clock()):
+            del self._states[session_id]
+            return None
+        return state
+
+    def _expire(self):
+        # Runs when an interview starts, so the dict is bounded by the interviews of one abandoned_after window
+        now = self.clock()
+        for session_id, state in list(self._states.items()):
+            if self._abandoned(state, now):
+                del self._states[session_id]
+
+class SQLiteSessionState(SessionStateBackend):
+    """
+    State in a local SQLite file shared by all API worker processes on the host
+    (WAL mode, so readers never wait for a writer). A writer waits at most
+    busy_timeout_ms for another worker's write lock, then fails with
+    sqlite3.OperationalError ("database is locked").
+    """
+    name = "sqlite"
+    shared = True
+    blocking = True
+
+    def __init__(self, path: str, busy_timeout_ms: int = 1000):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        # Autocommit mode; the compare-and-set in advance() runs in an explicit transaction
+        self._db = sqlite3.connect(path, timeout=busy_timeout_ms / 1000, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS question_state (
+                session_id TEXT PRIMARY KEY,
+                question_index INTEGER NOT NULL,
+                started_at REAL NOT NULL,
+                deadline REAL NOT NULL
+            )
+        """)
+
+    def get(self, session_id: str) -> Optional[QuestionState]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT session_id, question_index, started_at, deadline FROM question_state WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+        return self._to_state(row)
+
+    def start(self, state: QuestionState):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO question_state (session_id, question_index, started_at, deadline) VALUES (?, ?, ?, ?)",
+                (state.session_id, state.question_index, state.started_at, state.deadline)
+            )
+
+    def advance(self, session_id: str, from_index: int, next_state: Optional[QuestionState]) -> Optional[QuestionState]:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT session_id, question_index, started_at, deadline FROM question_state "
+                    "WHERE session_id = ? AND question_index = ?",
+                    (session_id, from_index)
+                ).fetchone()
+                if row is not None:
+                    if next_state is None:
+                        self._db.execute("DELETE FROM question_state WHERE session_id = ?", (session_id,))
+                    else:
+                        self._db.execute(
+                            "UPDATE question_state SET question_index = ?, started_at = ?, deadline = ? WHERE session_id = ?",
+                            (next_state.question_index, next_state.started_at, next_state.deadline, session_id)
+                        )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return self._to_state(row)
+
+    def running(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM question_state").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def _to_state(row) -> Optional[QuestionState]:
+        if row is None:
+            return None
+        return QuestionState(session_id=row[0], question_index=row[1], started_at=row[2], deadline=row[3])
+
+def create_session_state_backend(
+    name: str, path: str = "", busy_timeout_ms: int = 1000, abandoned_after: float = 0
+) -> SessionStateBackend:
+    """Build the session state backend selected in Settings.SESSION_STATE_BACKEND."""
+    if name == "memory":
+        return InProcessSessionState(abandoned_after)
+    if name == "sqlite":
+        if not path:
+            raise ValueError("The sqlite session state backend needs a file path")
+        return SQLiteSessionState(path, busy_timeout_ms)
+    raise ValueError(f"Unknown session state backend '{name}'. Choose one of: {', '.join(BACKENDS)}")
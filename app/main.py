@@ -1,18 +1,24 @@
 # -----------------------------------------
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, Body, Form, Depends
-from sqlalchemy.orm import Session
-from app.database import engine, Base, get_db, SessionLocal
+from fastapi import FastAPI, UploadFile, File, HTTPException, Body, Form, Depends, Request
+from sqlalchemy.orm import Session, defer, selectinload
+from app.database import engine, Base, get_db, async_engine, AsyncSessionLocal, async_read_engine, AsyncReadSessionLocal
 from app import models
 from contextlib import asynccontextmanager
 import os
-import uuid
-import shutil
 
 from app.cv_intelligence.cv_analyzer import CVAnalyzer
+from app.cv_intelligence.analysis_store import CVAnalysisStore
+from app.cv_intelligence.analysis_jobs import AnalysisJobManager, AnalysisQueueFull
 from aiogram import Bot
 from app.bot.notifications import BotNotificationManager
-from app.cv_intelligence.schemas import CVAnalysisResult
+from app.cv_intelligence.schemas import CVAnalysisResult, AnalysisJob, AnalysisJobStatus, AnalysisMetrics, BatchItemResult, ComponentHealth, ComponentState
+from app.cv_intelligence.batch_import import expand_batch
+from app.cv_intelligence.skill_extractor import EXTRACTION_MODES
+from app.cv_intelligence.upload_store import UploadStore
+from app.cv_intelligence.embedding_cache import EmbeddingCache
+from app.cv_intelligence.embedding_backends import backend_namespace
+from app.utils.single_flight import SingleFlight
 from app.summary_engine.ai_summarizer import AISummarizer
 from app.summary_engine.top_candidates import TopCandidatesRanker
 from app.summary_engine.schemas import CandidateSummary, TopCandidatesResponse
@@ -22,7 +28,8 @@ from app.candidate_level.schemas import LevelDetectionResult, InterviewPlan
 from app.question_engine.question_selector import QuestionSelector
 from app.question_engine.schemas import QuestionSet
 from app.interview_flow.session_manager import SessionManager
-from app.interview_flow.schemas import InterviewSession, QuestionProgress, SessionStatus, SessionSummary
+from app.interview_flow.answer_store import AnswerStore, parse_legacy_answers
+from app.interview_flow.schemas import InterviewSession, QuestionProgress, SessionStatus, SessionSummary, SessionCacheStats
 from app.answer_analysis.final_analyzer import FinalAnalyzer
 from app.answer_analysis.schemas import FullIntegrityReport
 from app.scoring.score_engine import ScoreEngine
@@ -32,16 +39,20 @@ from app.scoring.schemas import FinalRecommendation
 from app.config import settings
 from typing import List, Optional
 import uvicorn
-import shutil
 import os
 import tempfile
+import asyncio
+import time
+import json
+from collections import deque
+from sqlalchemy import text, select, exists
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan event handler for FastAPI (Startup and Shutdown).
     """
-    global analyzer, summarizer, ranker, level_detector, difficulty_mapper, question_selector, session_manager, integrity_analyzer, score_engine, recommendation_engine, confidence_analyzer, bot, notifier
+    global analysis_jobs, warm_up_task, cv_store, summarizer, ranker, level_detector, difficulty_mapper, question_selector, session_manager, integrity_analyzer, score_engine, recommendation_engine, confidence_analyzer, bot, notifier
     
     # Initialize Database
     models.Base.metadata.create_all(bind=engine)
@@ -51,7 +62,11 @@ async def lifespan(app: FastAPI):
     bot = Bot(token=token)
     notifier = BotNotificationManager(bot)
     
-    analyzer = CVAnalyzer()
+    # CV models live in the analysis worker processes, not in the API process.
+    # They load in the background; CV endpoints answer 503 until they are ready
+    analysis_jobs = AnalysisJobManager()
+    warm_up_task = asyncio.create_task(analysis_jobs.warm_up())
+    cv_store = CVAnalysisStore(CVAnalyzer.version_tag())
     summarizer = AISummarizer()
     ranker = TopCandidatesRanker()
     level_detector = LevelDetector()
@@ -64,11 +79,17 @@ async def lifespan(app: FastAPI):
     confidence_analyzer = ConfidenceAnalyzer()
     yield
     # Shutdown logic
+    if warm_up_task and not warm_up_task.done():
+        warm_up_task.cancel()
+    if analysis_jobs:
+        analysis_jobs.shutdown()
     if bot:
         await bot.session.close()
+    await async_engine.dispose()
+    await async_read_engine.dispose()
 
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 app = FastAPI(title="AI HR System - Complete", version="6.0", lifespan=lifespan)
@@ -94,6 +115,9 @@ if not os.path.exists(uploads_dir):
     os.makedirs(uploads_dir)
 app.mount("/uploads", StaticFiles(directory=uploads_dir), name="uploads")
 
+# Uploaded CVs are stored once per distinct content
+upload_store = UploadStore(uploads_dir)
+
 @app.get("/")
 async def read_index():
     return FileResponse(os.path.join(static_dir, "index.html"))
@@ -103,7 +127,10 @@ async def read_admin():
     return FileResponse(os.path.join(static_dir, "admin.html"))
 
 # Global Instances
-analyzer = None
+started_at = time.monotonic()
+analysis_jobs = None
+warm_up_task = None
+cv_store = None
 summarizer = None
 ranker = None
 level_detector = None
@@ -116,57 +143,314 @@ recommendation_engine = None
 confidence_analyzer = None
 bot = None
 notifier = None
+# Identical expensive calls in flight at the same time (double clicks, candidate + HR page) share one run
+single_flight = SingleFlight()
+# Interview answers (one row each), read by the admin session list without loading any model;
+# it reads through the read-only reporting engine, like the rest of the admin listing
+answer_store = AnswerStore(AsyncReadSessionLocal)
 
 # The startup event is now handled by the lifespan context manager above.
 
-@app.post("/analyze", response_model=CVAnalysisResult)
-async def analyze_cv(
+def _save_cv_stream(stream, ext: str, max_bytes: Optional[int] = None) -> str:
+    """
+    Saves a CV stream permanently under uploads/, named by its content hash.
+    Returns the path relative to the project root (stored in DB as cv_path).
+    """
+    cv_path, _ = upload_store.save(stream, ext, max_bytes)
+    return cv_path
+
+def _save_upload(file: UploadFile) -> str:
+    """
+    Validates the extension and saves an uploaded CV permanently.
+    """
+    filename = file.filename
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in ['.pdf', '.docx']:
+        raise HTTPException(status_code=400, detail="Unsupported file format. Please upload .pdf or .docx")
+
+    return _save_cv_stream(file.file, ext)
+
+def _upload_abs_path(cv_path: str) -> str:
+    return upload_store.abs_path(cv_path)
+
+def _check_extraction_mode(extraction_mode: str):
+    """400 for anything but auto/parser/fast (see SKILL_EXTRACTION_MODE)."""
+    if extraction_mode != "auto" and extraction_mode not in EXTRACTION_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown extraction_mode '{extraction_mode}'. Use auto, {', '.join(EXTRACTION_MODES)}"
+        )
+
+def _lookup_stored_analysis(cv_path: str) -> Optional[CVAnalysisResult]:
+    # The analysis workers reload an edited ontology and store under its new tag;
+    # re-reading the tag (a digest of the ontology file) keeps lookups in step with them
+    cv_store.version_tag = CVAnalyzer.version_tag()
+    return cv_store.get(upload_store.content_hash(cv_path))
+
+async def _stored_analysis(cv_path: str) -> Optional[CVAnalysisResult]:
+    """
+    Returns the stored analysis of a CV with the same bytes, if any.
+    Repeat uploads are answered from here without parsing or model inference.
+    Hashing the file and the store lookup are blocking I/O, so they run in a thread.
+    """
+    if not cv_store:
+        return None
+    try:
+        result = await asyncio.to_thread(_lookup_stored_analysis, cv_path)
+    except Exception as e:
+        print(f"CV analysis store lookup failed: {e}")
+        return None
+    if result:
+        result.cv_path = cv_path
+    return result
+
+def _require_analysis_ready():
+    """
+    Rejects CV requests with 503 + Retry-After while the analysis models are loading.
+    """
+    if not analysis_jobs:
+        raise HTTPException(status_code=500, detail="Analyzer not initialized")
+    if analysis_jobs.is_ready():
+        return
+    if analysis_jobs.state == ComponentState.FAILED:
+        raise HTTPException(status_code=503, detail=f"CV analysis is unavailable: {analysis_jobs.error}")
+    raise HTTPException(
+        status_code=503,
+        detail="CV analysis models are still loading, please retry shortly",
+        headers={"Retry-After": str(settings.ANALYSIS_WARMUP_RETRY_AFTER)}
+    )
+
+async def _unless_disconnected(request: Request, coro):
+    """
+    Awaits coro while polling the client connection. If the client goes away
+    (closed tab, re-upload), coro is cancelled, which cancels its analysis job,
+    and 499 is raised.
+    """
+    task = asyncio.ensure_future(coro)
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=settings.ANALYSIS_DISCONNECT_POLL_SECONDS)
+        if done:
+            return task.result()
+        if await request.is_disconnected():
+            task.cancel()
+            print("Client disconnected, analysis cancelled")
+            raise HTTPException(status_code=499, detail="Client closed request")
+
+@app.get("/health/live")
+async def health_live():
+    """
+    Liveness probe: the API process is up and serving requests.
+    """
+    return {"status": "alive", "uptime_seconds": round(time.monotonic() - started_at, 1)}
+
+@app.get("/health/ready")
+async def health_ready():
+    """
+    Readiness probe with per-component load state and load duration.
+    Returns 503 until the database and the CV analysis models are ready.
+    """
+    components: List[ComponentHealth] = []
+
+    db_start = time.perf_counter()
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        components.append(ComponentHealth(name="database", state=ComponentState.READY, load_seconds=round(time.perf_counter() - db_start, 3)))
+    except Exception as e:
+        components.append(ComponentHealth(name="database", state=ComponentState.FAILED, error=str(e)))
+
+    if analysis_jobs:
+        components.extend(analysis_jobs.health())
+    else:
+        components.append(ComponentHealth(name="analysis_workers", state=ComponentState.PENDING))
+
+    ready = all(c.state == ComponentState.READY for c in components)
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "ready": ready,
+            "uptime_seconds": round(time.monotonic() - started_at, 1),
+            "components": [c.dict() for c in components]
+        }
+    )
+
+@app.get("/analyze/metrics", response_model=AnalysisMetrics)
+async def analysis_metrics():
+    """
+    Analysis pool counters: submitted, completed, failed and cancelled jobs
+    (cancelled while queued vs. stopped while running).
+    """
+    if not analysis_jobs:
+        raise HTTPException(status_code=500, detail="Analyzer not initialized")
+    return analysis_jobs.metrics()
+
+@app.post("/analyze/jobs", response_model=AnalysisJob, status_code=202)
+async def submit_analysis_job(
     name: str = Form(...),
     phone: str = Form(...),
     email: str = Form(...),
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    extraction_mode: str = Form("auto")
 ):
     """
-    Endpoint to analyze a CV file (PDF or DOCX).
+    Queue a CV (PDF or DOCX) for background analysis.
+    Returns a job ID immediately; poll /analyze/jobs/{job_id} for the result.
+    extraction_mode: "parser", "fast" or "auto" (fast while the queue is deep).
     """
-    if not analyzer:
+    _check_extraction_mode(extraction_mode)
+    cv_path = _save_upload(file)
+    stored = await _stored_analysis(cv_path)
+    if stored:
+        return analysis_jobs.add_completed(stored, cv_path=cv_path)
+
+    _require_analysis_ready()
+    try:
+        return analysis_jobs.submit(_upload_abs_path(cv_path), cv_path=cv_path, extraction_mode=extraction_mode)
+    except AnalysisQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
+@app.get("/analyze/jobs/{job_id}", response_model=AnalysisJob)
+async def get_analysis_job(job_id: str):
+    """
+    Get status (and, once done, the result) of a background CV analysis job.
+    """
+    if not analysis_jobs:
         raise HTTPException(status_code=500, detail="Analyzer not initialized")
-        
-    # Validate file extension
-    filename = file.filename
-    ext = os.path.splitext(filename)[1].lower()
-    if ext not in ['.pdf', '.docx']:
-        raise HTTPException(status_code=400, detail="Unsupported file format. Please upload .pdf or .docx")
 
-    # Create uploads directory if it doesn't exist
-    uploads_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "uploads")
-    if not os.path.exists(uploads_dir):
-        os.makedirs(uploads_dir)
+    job = analysis_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
 
-    # Save to a permanent file to store in DB
-    perm_filename = f"{uuid.uuid4()}{ext}"
-    perm_path = os.path.join(uploads_dir, perm_filename)
-    
-    with open(perm_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
+@app.post("/analyze", response_model=CVAnalysisResult)
+async def analyze_cv(
+    request: Request,
+    name: str = Form(...),
+    phone: str = Form(...),
+    email: str = Form(...),
+    file: UploadFile = File(...),
+    extraction_mode: str = Form("auto")
+):
+    """
+    Endpoint to analyze a CV file (PDF or DOCX).
+    Runs as a background job and awaits it without blocking the event loop;
+    the job is cancelled if the client disconnects first.
+    extraction_mode: "parser", "fast" or "auto" (fast while the queue is deep).
+    """
+    _check_extraction_mode(extraction_mode)
+    cv_path = _save_upload(file)
+    # Known CV (same bytes): no parsing, no inference
+    stored = await _stored_analysis(cv_path)
+    if stored:
+        return stored
+
+    _require_analysis_ready()
     try:
-        result = analyzer.analyze(perm_path)
-        # Add the permanent path to result so frontend can pass it to start-interview
-        result_dict = result.dict()
-        result_dict["cv_path"] = f"uploads/{perm_filename}"
-        return result_dict
+        # The permanent path is added to the result so frontend can pass it to start-interview
+        # Same bytes uploaded again while the first analysis runs: wait for that one
+        key = ("analyze", upload_store.content_hash(cv_path), extraction_mode)
+        return await _unless_disconnected(request, single_flight.do(
+            key,
+            lambda: analysis_jobs.run(_upload_abs_path(cv_path), cv_path=cv_path, extraction_mode=extraction_mode)
+        ))
+    except HTTPException:
+        raise
+    except AnalysisQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
     except ValueError as ve:
-        # Expected validation error
-        raise HTTPException(status_code=400, detail=str(ve))
+        # Expected validation error; parser failures also say why (timeout, memory_limit, ...)
+        reason = getattr(ve, "reason", None)
+        raise HTTPException(status_code=400, detail=str(ve), headers={"X-Failure-Reason": reason} if reason else None)
     except Exception as e:
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
-    
-    finally:
-        # We don't delete it because we want to keep it in uploads
-        pass
+
+@app.post("/analyze-batch")
+async def analyze_batch(files: List[UploadFile] = File(...), extraction_mode: str = Form("auto")):
+    """
+    Bulk CV import: accepts PDF/DOCX files and/or ZIP archives of them.
+    Files are analyzed in parallel on the analysis worker pool, BATCH_CHUNK_SIZE
+    CVs per worker job, and results are streamed back as NDJSON, one
+    BatchItemResult per line in completion order.
+    A failing file is reported on its own line and never aborts the batch.
+    """
+    _check_extraction_mode(extraction_mode)
+    _require_analysis_ready()
+
+    # Spool everything to disk before responding: upload streams are closed once the request ends
+    accepted, rejected = await asyncio.to_thread(
+        expand_batch,
+        [(f.filename, f.file) for f in files],
+        _save_cv_stream,
+        settings.BATCH_MAX_FILES,
+        settings.BATCH_MAX_FILE_MB * 1024 * 1024
+    )
+
+    def _submit_chunk(chunk):
+        # One worker job per chunk: spaCy processes the chunk's CVs as one batch.
+        # Submitted before the caller yields, so its queue slot is taken right away
+        try:
+            submission = analysis_jobs.submit_many(
+                [_upload_abs_path(cv_path) for _, _, cv_path in chunk],
+                extraction_mode=extraction_mode
+            )
+        except Exception as e:
+            submission = e
+        return asyncio.create_task(_analyze_chunk(chunk, submission))
+
+    async def _analyze_chunk(chunk, submission) -> List[BatchItemResult]:
+        if isinstance(submission, Exception):
+            outcomes = [submission] * len(chunk)
+        else:
+            try:
+                outcomes = await analysis_jobs.wait_many(*submission)
+            except Exception as e:
+                outcomes = [e] * len(chunk)
+        items = []
+        for (index, filename, cv_path), outcome in zip(chunk, outcomes):
+            if isinstance(outcome, Exception):
+                items.append(BatchItemResult(
+                    index=index, filename=filename, status=AnalysisJobStatus.FAILED, cv_path=cv_path,
+                    error=str(outcome), error_reason=getattr(outcome, "reason", None)
+                ))
+            else:
+                outcome.cv_path = cv_path
+                items.append(BatchItemResult(index=index, filename=filename, status=AnalysisJobStatus.DONE, cv_path=cv_path, result=outcome))
+        return items
+
+    async def _stream_results():
+        for item in rejected:
+            yield item.json() + "\n"
+
+        # Known CVs are answered from the analysis store right away
+        to_analyze = []
+        for index, filename, cv_path in accepted:
+            stored = await _stored_analysis(cv_path)
+            if stored:
+                yield BatchItemResult(index=index, filename=filename, status=AnalysisJobStatus.DONE, cv_path=cv_path, result=stored).json() + "\n"
+            else:
+                to_analyze.append((index, filename, cv_path))
+
+        chunk_size = max(1, settings.BATCH_CHUNK_SIZE)
+        pending = deque(to_analyze[i:i + chunk_size] for i in range(0, len(to_analyze), chunk_size))
+        in_flight = set()
+        try:
+            while pending or in_flight:
+                # Keep at most BATCH_MAX_IN_FLIGHT jobs queued so interactive /analyze calls still get slots
+                while pending and len(in_flight) < settings.BATCH_MAX_IN_FLIGHT:
+                    await analysis_jobs.wait_for_slot()
+                    in_flight.add(_submit_chunk(pending.popleft()))
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for item in task.result():
+                        yield item.json() + "\n"
+        finally:
+            # Client disconnected mid-stream: the remaining chunks' jobs are cancelled
+            for task in in_flight:
+                task.cancel()
+
+    return StreamingResponse(_stream_results(), media_type="application/x-ndjson")
 
 @app.post("/summarize", response_model=CandidateSummary)
 async def summarize_candidate(
@@ -310,7 +594,7 @@ async def start_interview(
         raise HTTPException(status_code=500, detail="Session manager not initialized")
     
     try:
-        session = session_manager.create_session(
+        session = await session_manager.create_session(
             candidate_id=candidate_id,
             candidate_name=candidate_name,
             candidate_phone=candidate_phone,
@@ -335,7 +619,7 @@ async def get_current_question(session_id: str):
         raise HTTPException(status_code=500, detail="Session manager not initialized")
     
     try:
-        question = session_manager.get_current_question(session_id)
+        question = await session_manager.get_current_question(session_id)
         if not question:
             raise HTTPException(status_code=404, detail="No active question")
         return question
@@ -359,7 +643,7 @@ async def submit_answer(
         raise HTTPException(status_code=500, detail="Session manager not initialized")
     
     try:
-        answer = session_manager.submit_answer(
+        answer = await session_manager.submit_answer(
             session_id=session_id,
             answer_text=answer_text
         )
@@ -384,7 +668,7 @@ async def get_session_status(session_id: str):
         raise HTTPException(status_code=500, detail="Session manager not initialized")
     
     try:
-        session = session_manager.get_session_status(session_id)
+        session = await session_manager.get_session_status(session_id)
         return session
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -402,7 +686,7 @@ async def get_session_summary(session_id: str):
         raise HTTPException(status_code=500, detail="Session manager not initialized")
     
     try:
-        summary = session_manager.get_session_summary(session_id)
+        summary = await session_manager.get_session_summary(session_id)
         return summary
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -411,6 +695,16 @@ async def get_session_summary(session_id: str):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+def _integrity_report(session_id: str, summary: SessionSummary, questions: List[dict]):
+    """
+    FinalAnalyzer.analyze_session off the event loop; concurrent calls for the
+    same session (integrity page, recommendation, HR view) share one run.
+    """
+    return single_flight.do(
+        ("integrity", session_id),
+        lambda: asyncio.to_thread(integrity_analyzer.analyze_session, summary, questions)
+    )
+
 @app.post("/analyze-integrity/{session_id}", response_model=FullIntegrityReport)
 async def analyze_integrity(session_id: str):
     """
@@ -422,13 +716,13 @@ async def analyze_integrity(session_id: str):
     
     try:
         # 1. Get session summary
-        summary = session_manager.get_session_summary(session_id)
+        summary = await session_manager.get_session_summary(session_id)
         
         # 2. Get the session to access question data (difficulty, etc.)
-        session = session_manager.get_session_status(session_id)
+        session = await session_manager.get_session_status(session_id)
         
         # 3. Perform analysis
-        report = integrity_analyzer.analyze_session(summary, session.questions)
+        report = await _integrity_report(session_id, summary, session.questions)
         return report
         
     except ValueError as e:
@@ -443,32 +737,43 @@ async def generate_recommendation(session_id: str):
     """
     Generate the absolute final HR recommendation.
     Aggregates technical score, integrity flags, and behavior.
+    Concurrent calls for the same session share one computation (and one HR notification).
     """
+    return await single_flight.do(("recommendation", session_id), lambda: _generate_recommendation(session_id))
+
+async def _generate_recommendation(session_id: str) -> FinalRecommendation:
     if not all([session_manager, integrity_analyzer, score_engine, recommendation_engine, confidence_analyzer]):
         raise HTTPException(status_code=500, detail="Engines not initialized")
     
     try:
         # 1. Get session summary and technical data
-        summary = session_manager.get_session_summary(session_id)
-        session = session_manager.get_session_status(session_id)
+        summary = await session_manager.get_session_summary(session_id)
+        session = await session_manager.get_session_status(session_id)
         
         # 2. Get integrity report (Step 6)
-        integrity_report = integrity_analyzer.analyze_session(summary, session.questions)
+        integrity_report = await _integrity_report(session_id, summary, session.questions)
         
         # 3. Get CV Skills to calculate Skills Match
         cv_skills = []
-        db_fetch = SessionLocal()
+        db_fetch = AsyncSessionLocal()
         try:
-            db_session_fetch = db_fetch.query(models.SessionModel).filter(models.SessionModel.id == session_id).first()
-            candidate_ref = db_fetch.query(models.Candidate).filter(models.Candidate.id == db_session_fetch.candidate_id).first()
+            db_session_fetch = await db_fetch.get(models.SessionModel, session_id)
+            candidate_ref = await db_fetch.get(models.Candidate, db_session_fetch.candidate_id)
             if candidate_ref and candidate_ref.cv_path:
-                # Re-parse or use cached if we had it, but re-parse is safe
-                cv_analysis = analyzer.analyze(candidate_ref.cv_path)
+                # The analysis computed at upload time is stored by content hash;
+                # only fall back to a full re-analysis if it is missing
+                cv_analysis = await _stored_analysis(candidate_ref.cv_path)
+                if not cv_analysis:
+                    # 503 + Retry-After while the models load, rather than scoring without CV skills
+                    _require_analysis_ready()
+                    cv_analysis = await analysis_jobs.run(_upload_abs_path(candidate_ref.cv_path), cv_path=candidate_ref.cv_path)
                 cv_skills = cv_analysis.skills_detected + cv_analysis.inferred_skills
+        except HTTPException:
+            raise
         except Exception as e:
             print(f"Error fetching CV skills for scoring: {e}")
         finally:
-            db_fetch.close()
+            await db_fetch.close()
 
         # 4. Calculate Confidence early to include in score
         ans_lengths = [len(a.answer_text) for a in summary.answers]
@@ -522,10 +827,10 @@ async def generate_recommendation(session_id: str):
         )
         
         # 7. Database Persistence
-        db = SessionLocal()
+        db = AsyncSessionLocal()
         try:
-            db_session = db.query(models.SessionModel).filter(models.SessionModel.id == session_id).first()
-            candidate = db.query(models.Candidate).filter(models.Candidate.id == db_session.candidate_id).first() if db_session else None
+            db_session = await db.get(models.SessionModel, session_id)
+            candidate = await db.get(models.Candidate, db_session.candidate_id) if db_session and db_session.candidate_id else None
             
             if db_session:
                 db_session.score = recommendation.final_score
@@ -544,12 +849,12 @@ async def generate_recommendation(session_id: str):
                     # For now, let's just pass the filename and let the bot/keyboard handle it if needed
                     recommendation.metadata["cv_filename"] = cv_filename
 
-                db.commit()
+                await db.commit()
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             print(f"DB Error while saving recommendation: {e}")
         finally:
-            db.close()
+            await db.close()
 
         # 8. Notify HR via Telegram (Step 8 Integration)
         if notifier:
@@ -560,6 +865,8 @@ async def generate_recommendation(session_id: str):
 
         return recommendation
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -595,48 +902,85 @@ async def update_session_status(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/admin/embedding-cache")
+async def embedding_cache_stats():
+    """
+    Shared phrase-embedding cache statistics (all analysis workers): size, hit rate, evictions.
+    """
+    namespace = backend_namespace(settings.TRANSFORMER_MODEL, settings.EMBEDDING_BACKEND)
+    stats = EmbeddingCache.read_shared_stats(settings.EMBEDDING_CACHE_DIR, namespace)
+    return stats or {"namespace": namespace, "disk_items": 0, "hit_rate": 0.0}
+
+@app.get("/admin/session-cache", response_model=SessionCacheStats)
+async def session_cache_stats():
+    """
+    In-memory interview session cache: size, pinned (running) sessions, hit/miss/eviction counters.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    return session_manager.cache_stats()
+
+def _admin_session_rows(db_sessions, answers_by_session: dict, legacy_answers: dict) -> list:
+    """Rows of the admin session listing, already JSON-native (questions and flags come from JSON columns)."""
+    results = []
+    for session in db_sessions:
+        candidate = session.candidate
+        
+        # Use snapshot if available, else fallback to current candidate profile
+        c_name = session.candidate_name if session.candidate_name else (candidate.name if candidate else "Unknown")
+        c_email = session.candidate_email if session.candidate_email else (candidate.email if candidate else "")
+        c_phone = session.candidate_phone if session.candidate_phone else (candidate.phone if candidate else "")
+        
+        results.append({
+            "session_id": session.id,
+            "candidate_name": c_name,
+            "candidate_email": c_email,
+            "candidate_phone": c_phone,
+            "candidate_lang": getattr(session, 'candidate_lang', None) or (candidate.language if candidate else "en"),
+            "status_public": session.status_public,
+            "status_internal": session.status_internal,
+            "score": session.score,
+            "decision": session.decision,
+            "cv_path": candidate.cv_path if candidate else "",
+            "questions": session.questions,
+            "answers": [
+                json.loads(a.json())
+                for a in answers_by_session.get(session.id) or parse_legacy_answers(legacy_answers.get(session.id))
+            ],
+            "hr_comment": session.hr_comment or "",
+            "flags": session.flags or [],
+            "start_time": session.start_time.isoformat() if session.start_time else ""
+        })
+    return results
+
 @app.get("/admin/sessions")
 async def list_sessions():
     """
     Endpoint for admin to see all sessions from the database.
+    Reads through the read-only reporting engine, so it never competes with interview writes.
     """
-    db = SessionLocal()
+    db = AsyncReadSessionLocal()
     try:
-        # Sort by start_time descending (newest first)
-        db_sessions = db.query(models.SessionModel).order_by(models.SessionModel.start_time.desc()).all()
+        # Sort by start_time descending (newest first); candidates in one extra query, not one per session
+        db_sessions = (await db.execute(
+            select(models.SessionModel)
+            .options(defer(models.SessionModel.answers), selectinload(models.SessionModel.candidate))
+            .order_by(models.SessionModel.start_time.desc())
+        )).scalars().all()
+        answers_by_session = await answer_store.get_many(s.id for s in db_sessions)
+        # Sessions without answer rows (not migrated yet) still have the legacy JSON list
+        legacy_answers = dict((await db.execute(
+            select(models.SessionModel.id, models.SessionModel.answers)
+            .where(~exists().where(models.AnswerRecord.session_id == models.SessionModel.id))
+        )).all())
         
-        results = []
-        for session in db_sessions:
-            candidate = db.query(models.Candidate).filter(models.Candidate.id == session.candidate_id).first()
-            
-            # Use snapshot if available, else fallback to current candidate profile
-            c_name = session.candidate_name if session.candidate_name else (candidate.name if candidate else "Unknown")
-            c_email = session.candidate_email if session.candidate_email else (candidate.email if candidate else "")
-            c_phone = session.candidate_phone if session.candidate_phone else (candidate.phone if candidate else "")
-            
-            results.append({
-                "session_id": session.id,
-                "candidate_name": c_name,
-                "candidate_email": c_email,
-                "candidate_phone": c_phone,
-                "candidate_lang": getattr(session, 'candidate_lang', None) or (candidate.language if candidate else "en"),
-                "status_public": session.status_public,
-                "status_internal": session.status_internal,
-                "score": session.score,
-                "decision": session.decision,
-                "cv_path": candidate.cv_path if candidate else "",
-                "questions": session.questions,
-                "answers": session.answers,
-                "hr_comment": session.hr_comment or "",
-                "flags": session.flags or [],
-                "start_time": session.start_time.isoformat() if session.start_time else ""
-            })
-        return results
+        # Building and encoding the listing is CPU work; keep it off the event loop
+        return JSONResponse(await asyncio.to_thread(_admin_session_rows, db_sessions, answers_by_session, legacy_answers))
     except Exception as e:
         print(f"DB Error while listing sessions: {e}")
         return []
     finally:
-        db.close()
+        await db.close()
 
 if __name__ == "__main__":
     print(f"SMTP Config Loaded: User={settings.SMTP_USER}, Server={settings.SMTP_SERVER}:{settings.SMTP_PORT}")
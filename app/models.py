@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Text, Boolean, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from .database import Base
 from datetime import datetime
@@ -40,7 +40,7 @@ class SessionModel(Base):
     current_question_index = Column(Integer, default=0)
     
     questions = Column(JSON) # List of dicts
-    answers = Column(JSON)   # List of dicts
+    answers = Column(JSON)   # Legacy: answers are stored in interview_answers (see answers_table_migration.py)
     
     # Analysis results
     ai_summary = Column(Text, nullable=True)
@@ -51,3 +51,31 @@ class SessionModel(Base):
     flags = Column(JSON, nullable=True)  # List of flags from AI analysis
     
     candidate = relationship("Candidate", back_populates="sessions")
+
+class AnswerRecord(Base):
+    __tablename__ = "interview_answers"
+
+    id = Column(Integer, primary_key=True)
+    session_id = Column(String, ForeignKey("interview_sessions.id"), nullable=False)
+    ordinal = Column(Integer, nullable=False)  # Position in the interview (question index), from 0
+    question_id = Column(Integer)
+    answer_text = Column(Text)
+    time_spent = Column(Integer)  # seconds
+    submitted_at = Column(DateTime)
+    is_timeout = Column(Boolean, default=False)
+    ai_score = Column(Float, default=0.0)
+    ai_explanation = Column(Text, default="")
+
+    # One answer per question; also the index behind per-session reads (session_id first)
+    __table_args__ = (UniqueConstraint("session_id", "ordinal", name="uq_interview_answer_ordinal"),)
+
+class CVAnalysisRecord(Base):
+    __tablename__ = "cv_analysis_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String, index=True)  # SHA-256 of the uploaded file bytes
+    analyzer_version = Column(String)          # Analyzer + model versions that produced the result
+    result = Column(JSON)                      # Serialized CVAnalysisResult
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (UniqueConstraint("content_hash", "analyzer_version", name="uq_cv_analysis_hash_version"),)
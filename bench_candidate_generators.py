@@ -0,0 +1,77 @@
+import sys
+import os
+import time
+import argparse
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.config import settings
+from bench_skill_extractor import _load_texts
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if (a or b) else 1.0
+
+def bench(pattern: str, copies: int, map_skills: bool):
+    from app.cv_intelligence.skill_extractor import SkillExtractor, EXTRACTION_MODES
+
+    texts = _load_texts(pattern, copies)
+    if not texts:
+        print(f"No CVs match {pattern}")
+        return
+    print(f"Benchmarking candidate generators on {len(texts)} CVs (model: {settings.SPACY_MODEL})\n")
+
+    extractor = SkillExtractor(model=settings.SPACY_MODEL)
+    mapper = None
+    if map_skills:
+        # No phrase cache: the second mode would otherwise reuse the first one's embeddings
+        settings.EMBEDDING_CACHE_ENABLED = False
+        from app.cv_intelligence.skill_mapper import SkillMapper
+        mapper = SkillMapper(model_name=settings.TRANSFORMER_MODEL)
+
+    stats = {}
+    for mode in EXTRACTION_MODES:
+        extractor.extract_many(texts[:2], mode=mode)  # Warm-up
+        start = time.perf_counter()
+        extractions = extractor.extract_many(texts, mode=mode)
+        extract_seconds = time.perf_counter() - start
+
+        inferred, map_seconds = [], 0.0
+        if mapper is not None:
+            start = time.perf_counter()
+            inferred = [set(mapper.map_skills(e["candidates"], top_k=settings.SKILL_MAPPER_TOP_K)) for e in extractions]
+            map_seconds = time.perf_counter() - start
+
+        stats[mode] = {
+            "extract_seconds": extract_seconds,
+            "map_seconds": map_seconds,
+            "candidates": sum(len(e["candidates"]) for e in extractions) / len(texts),
+            "candidate_sets": [set(e["candidates"]) for e in extractions],
+            "inferred": inferred
+        }
+
+    print(f"\n{'mode':<8}{'extract CVs/s':>15}{'extract+map CVs/s':>19}{'candidates/CV':>15}")
+    for mode, s in stats.items():
+        total = s["extract_seconds"] + s["map_seconds"]
+        print(f"{mode:<8}{len(texts) / s['extract_seconds']:>15.1f}"
+              f"{(len(texts) / total if mapper else float('nan')):>19.1f}{s['candidates']:>15.1f}")
+
+    parser_stats, fast_stats = stats["parser"], stats["fast"]
+    print(f"\nExtraction speedup (fast vs parser): {parser_stats['extract_seconds'] / fast_stats['extract_seconds']:.1f}x")
+    covered = [len(p & f) / len(p) for p, f in zip(parser_stats["candidate_sets"], fast_stats["candidate_sets"]) if p]
+    if covered:
+        print(f"Parser candidates also generated by fast path: {sum(covered) / len(covered):.1%}")
+    if mapper is not None:
+        overlap = [_jaccard(p, f) for p, f in zip(parser_stats["inferred"], fast_stats["inferred"])]
+        recall = [len(p & f) / len(p) for p, f in zip(parser_stats["inferred"], fast_stats["inferred"]) if p]
+        print(f"Inferred-skill overlap (Jaccard, mean per CV): {sum(overlap) / len(overlap):.1%}")
+        if recall:
+            print(f"Parser-path inferred skills also found by fast path: {sum(recall) / len(recall):.1%}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Noun-chunk vs n-gram candidate generation: throughput and inferred-skill overlap")
+    parser.add_argument("--files", default=os.path.join("uploads", "*"))
+    parser.add_argument("--copies", type=int, default=5, help="Repeat the corpus to simulate a bulk import")
+    parser.add_argument("--no-map", action="store_true", help="Only time candidate extraction")
+    args = parser.parse_args()
+    bench(args.files, args.copies, not args.no_map)
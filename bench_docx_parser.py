@@ -0,0 +1,90 @@
+import sys
+import os
+import glob
+import time
+import hashlib
+import json
+import argparse
+import subprocess
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.parser import CVParser
+
+def _unique_files(pattern: str):
+    """DOCX files matching the pattern, byte-identical copies counted once."""
+    files = {}
+    for path in sorted(glob.glob(pattern)):
+        with open(path, "rb") as f:
+            files.setdefault(hashlib.sha256(f.read()).hexdigest(), path)
+    return list(files.values())
+
+def _parse_fn(method: str):
+    # No character budget: both paths read the whole document
+    parser = CVParser(pdf_workers=0, max_chars=sys.maxsize)
+    return parser._parse_docx_python_docx if method == "python-docx" else parser._parse_docx
+
+def _peak_rss_growth_kb(method: str, path: str) -> int:
+    """Peak RSS growth of one parse, in a fresh process (lxml memory is invisible to tracemalloc)."""
+    output = subprocess.run(
+        [sys.executable, __file__, "--single", method, "--files", path],
+        capture_output=True, text=True, cwd=os.getcwd()
+    )
+    lines = [l for l in output.stdout.splitlines() if l.startswith("{")]
+    return json.loads(lines[-1])["peak_rss_growth_kb"] if lines else -1
+
+def _peak_rss_kb() -> int:
+    """Peak resident set size of this process (Linux; unlike ru_maxrss, not inherited from the parent)."""
+    with open("/proc/self/status", "r") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    return 0
+
+def run_single(method: str, path: str) -> dict:
+    parse = _parse_fn(method)
+    before = _peak_rss_kb()
+    parse(path)
+    return {"peak_rss_growth_kb": _peak_rss_kb() - before}
+
+def _measure(method: str, path: str, repeat: int):
+    parse = _parse_fn(method)
+    parse(path)  # Warm-up (imports, zip directory cache)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        text = parse(path)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+    return elapsed_ms, _peak_rss_growth_kb(method, path), text
+
+def bench(pattern: str, repeat: int):
+    paths = _unique_files(pattern)
+    if not paths:
+        print(f"No DOCX files match {pattern}")
+        return
+    print(f"Benchmarking DOCX extraction on {len(paths)} unique files ({repeat} runs each)\n")
+    print(f"{'file':<20}{'KB':>8}{'python-docx ms':>16}{'stream ms':>11}{'speedup':>9}"
+          f"{'py-docx +RSS KB':>17}{'stream +RSS KB':>16}{'chars old/new':>16}")
+
+    totals = [0.0, 0.0]
+    for path in paths:
+        old_ms, old_peak, old_text = _measure("python-docx", path, repeat)
+        new_ms, new_peak, new_text = _measure("stream", path, repeat)
+        totals[0] += old_ms
+        totals[1] += new_ms
+        print(f"{os.path.basename(path)[:18]:<20}{os.path.getsize(path) / 1024:>8.0f}{old_ms:>16.2f}{new_ms:>11.2f}"
+              f"{old_ms / new_ms:>8.1f}x{old_peak:>17}{new_peak:>16}{len(old_text):>8}/{len(new_text)}")
+
+    print(f"\nTotal: python-docx {totals[0]:.2f} ms, stream {totals[1]:.2f} ms ({totals[0] / totals[1]:.1f}x)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="python-docx vs streaming DOCX extraction")
+    parser.add_argument("--files", default=os.path.join("uploads", "*.docx"))
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--single", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_single(args.single, args.files)))
+    else:
+        bench(args.files, args.repeat)
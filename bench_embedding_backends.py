@@ -0,0 +1,93 @@
+import sys
+import os
+import json
+import time
+import argparse
+import subprocess
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+def _rss_mb() -> float:
+    """Current resident set size of this process (Linux)."""
+    with open("/proc/self/status", "r") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+def _make_phrases(count: int):
+    from app.cv_intelligence.embedding_backends import PARITY_PHRASES
+    # Vary the phrases so nothing is trivially repeated
+    return [f"{PARITY_PHRASES[i % len(PARITY_PHRASES)]} {i // len(PARITY_PHRASES)}" for i in range(count)]
+
+def run_single(backend_name: str, model_name: str, phrases_count: int, batch_size: int, threads: int) -> dict:
+    """Measures one backend in the current (fresh) process."""
+    from app.config import settings
+    from app.cv_intelligence.embedding_backends import create_embedding_backend
+
+    rss_start = _rss_mb()
+    start = time.perf_counter()
+    backend = create_embedding_backend(
+        backend_name, model_name,
+        export_dir=settings.EMBEDDING_ONNX_DIR,
+        batch_size=batch_size,
+        num_threads=threads
+    )
+    load_seconds = time.perf_counter() - start
+    rss_loaded = _rss_mb()
+
+    phrases = _make_phrases(phrases_count)
+    backend.encode(phrases[:batch_size])  # Warm-up
+
+    start = time.perf_counter()
+    backend.encode(phrases)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "backend": backend_name,
+        "load_seconds": round(load_seconds, 2),
+        "phrases_per_second": round(len(phrases) / elapsed, 1),
+        "rss_before_mb": round(rss_start, 1),
+        "rss_loaded_mb": round(rss_loaded, 1),
+        "rss_peak_after_encode_mb": round(_rss_mb(), 1)
+    }
+
+def bench(backends, model_name: str, phrases_count: int, batch_size: int, threads: int):
+    print(f"Benchmarking embedding backends on {phrases_count} phrases (model: {model_name})")
+    results = []
+    for backend_name in backends:
+        # One fresh process per backend, so RSS is not polluted by the other backend
+        output = subprocess.run(
+            [sys.executable, __file__, "--single", backend_name, "--model", model_name,
+             "--phrases", str(phrases_count), "--batch-size", str(batch_size), "--threads", str(threads)],
+            capture_output=True, text=True, cwd=os.getcwd()
+        )
+        lines = [l for l in output.stdout.splitlines() if l.startswith("{")]
+        if output.returncode != 0 or not lines:
+            print(f"  {backend_name}: FAILED\n{output.stderr[-2000:]}")
+            continue
+        results.append(json.loads(lines[-1]))
+
+    print(f"\n{'backend':<12}{'phrases/s':>12}{'load s':>10}{'RSS loaded MB':>16}{'RSS after MB':>15}")
+    for r in results:
+        print(f"{r['backend']:<12}{r['phrases_per_second']:>12}{r['load_seconds']:>10}"
+              f"{r['rss_loaded_mb']:>16}{r['rss_peak_after_encode_mb']:>15}")
+    return results
+
+if __name__ == "__main__":
+    from app.config import settings
+
+    parser = argparse.ArgumentParser(description="Throughput and memory of the SkillMapper embedding backends")
+    parser.add_argument("--model", default=settings.TRANSFORMER_MODEL)
+    parser.add_argument("--backends", default="torch,onnx-int8")
+    parser.add_argument("--phrases", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=settings.EMBEDDING_BATCH_SIZE)
+    parser.add_argument("--threads", type=int, default=settings.EMBEDDING_THREADS)
+    parser.add_argument("--single", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_single(args.single, args.model, args.phrases, args.batch_size, args.threads)))
+    else:
+        bench(args.backends.split(","), args.model, args.phrases, args.batch_size, args.threads)
@@ -0,0 +1,61 @@
+import sys
+import os
+import time
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.validation import validate_resume
+from bench_skill_extractor import _load_texts
+from test_resume_validation import legacy_score
+
+def _legacy_validate(text: str, out) -> bool:
+    """The substring scans plus the diagnostic block the old validator printed for every upload."""
+    is_resume, score, found = legacy_score(text)
+    print("--- [CV VALIDATION DIAGNOSTICS] ---", file=out)
+    print(f"Length: {len(text.strip())} chars", file=out)
+    print(f"Markers Found ({len(found)}): {sorted(found)[:10]}", file=out)
+    print(f"Final Validation Score: {score} (Needed: 20)", file=out)
+    print("-----------------------------------", file=out)
+    out.flush()
+    return is_resume
+
+def bench(pattern: str, copies: int, threads: int):
+    texts = _load_texts(pattern, copies)
+    if not texts:
+        print(f"No CVs match {pattern}")
+        return
+    chars = sum(len(t) for t in texts)
+    print(f"Validating {len(texts)} CVs ({chars / 1000:.0f}k chars) on {threads} threads\n")
+
+    # Diagnostics go to a real file, as they would to a container log
+    with tempfile.TemporaryFile("w+") as out:
+        runs = {
+            "scans + print": lambda t: _legacy_validate(t, out),
+            "scans only": lambda t: legacy_score(t)[0],
+            "compiled": lambda t: validate_resume(t).is_resume,
+        }
+        timings = {}
+        decisions = {}
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            for label, validate in runs.items():
+                start = time.perf_counter()
+                decisions[label] = list(pool.map(validate, texts))
+                timings[label] = time.perf_counter() - start
+
+    assert decisions["compiled"] == decisions["scans only"], "Compiled matcher changed a decision"
+    print(f"{'validator':<16}{'seconds':>10}{'CVs/s':>12}")
+    for label, seconds in timings.items():
+        print(f"{label:<16}{seconds:>10.3f}{len(texts) / seconds:>12.0f}")
+    print(f"\nSpeed-up over the printing validator: {timings['scans + print'] / timings['compiled']:.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resume validation: substring scans with diagnostics vs the compiled matcher")
+    parser.add_argument("--files", default=os.path.join("uploads", "*"))
+    parser.add_argument("--copies", type=int, default=50, help="Repeat the corpus to simulate many uploads")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent validations (uploads)")
+    args = parser.parse_args()
+    bench(args.files, args.copies, args.threads)
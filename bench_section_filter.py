@@ -0,0 +1,58 @@
+import sys
+import os
+import time
+import argparse
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.config import settings
+from app.cv_intelligence.sections import segment_sections, section_text
+from bench_skill_extractor import _load_texts
+
+def bench(pattern: str, copies: int, mode: str, map_skills: bool):
+    from app.cv_intelligence.skill_extractor import SkillExtractor
+
+    texts = _load_texts(pattern, copies)
+    if not texts:
+        print(f"No CVs match {pattern}")
+        return
+    skill_sections = settings.CV_SKILL_SECTIONS.split(",")
+    skill_texts = [section_text(t, segment_sections(t), skill_sections) for t in texts]
+
+    print(f"Section filter on {len(texts) // copies} unique CVs (sections: {settings.CV_SKILL_SECTIONS})\n")
+    for text, skill_text in list(zip(texts, skill_texts))[:len(texts) // copies]:
+        names = [s.name for s in segment_sections(text)]
+        print(f"  {len(skill_text):>6}/{len(text):<6} chars kept  {names}")
+
+    extractor = SkillExtractor(model=settings.SPACY_MODEL)
+    mapper = None
+    if map_skills:
+        # No phrase cache: the second run would otherwise reuse the first one's embeddings
+        settings.EMBEDDING_CACHE_ENABLED = False
+        from app.cv_intelligence.skill_mapper import SkillMapper
+        mapper = SkillMapper(model_name=settings.TRANSFORMER_MODEL)
+
+    timings = {}
+    for label, candidate_texts in (("full text", None), ("skill sections", skill_texts)):
+        start = time.perf_counter()
+        extractions = extractor.extract_many(texts, mode=mode, candidate_texts=candidate_texts)
+        if mapper is not None:
+            for extraction in extractions:
+                mapper.map_skills(extraction["candidates"], top_k=settings.SKILL_MAPPER_TOP_K)
+        timings[label] = (time.perf_counter() - start, sum(len(e["candidates"]) for e in extractions) / len(texts))
+
+    kept = sum(len(t) for t in skill_texts) / sum(len(t) for t in texts)
+    print(f"\n{'input':<16}{'seconds':>10}{'CVs/s':>10}{'candidates/CV':>15}")
+    for label, (seconds, candidates) in timings.items():
+        print(f"{label:<16}{seconds:>10.2f}{len(texts) / seconds:>10.1f}{candidates:>15.1f}")
+    print(f"\nText kept: {kept:.0%}; time: {timings['skill sections'][0] / timings['full text'][0]:.0%} of full text ({mode} mode)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NLP cost with and without the CV section filter")
+    parser.add_argument("--files", default=os.path.join("uploads", "*"))
+    parser.add_argument("--copies", type=int, default=5, help="Repeat the corpus to simulate a bulk import")
+    parser.add_argument("--mode", default="parser", choices=["parser", "fast"])
+    parser.add_argument("--no-map", action="store_true", help="Only time candidate extraction")
+    args = parser.parse_args()
+    bench(args.files, args.copies, args.mode, not args.no_map)
@@ -0,0 +1,102 @@
+import sys
+import os
+import time
+import asyncio
+import argparse
+import statistics
+
+import httpx
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+def _question_set(count: int) -> dict:
+    questions = [
+        {"id": i, "skill": "python", "difficulty": "medium", "type": "theory", "question": f"Benchmark question {i}?"}
+        for i in range(1, count + 1)
+    ]
+    return {"candidate_name": "Bench Candidate", "candidate_level": "Middle", "questions": questions, "total_questions": count}
+
+async def _start(client: httpx.AsyncClient, n: int) -> str:
+    response = await client.post("/start-interview", json={
+        "candidate_id": f"bench_{n}",
+        "candidate_name": f"Bench Candidate {n}",
+        "candidate_phone": "+998900000000",
+        "candidate_email": f"bench.{n}.{time.time_ns()}@example.com",
+        "question_set": _question_set(3)
+    })
+    response.raise_for_status()
+    return response.json()["session_id"]
+
+async def _seed(client: httpx.AsyncClient, active: int, finished: int):
+    """Sessions waiting on a question, and finished sessions to write recommendations for."""
+    active_ids = [await _start(client, n) for n in range(active)]
+    finished_ids = []
+    for n in range(finished):
+        session_id = await _start(client, active + n)
+        for q in range(3):
+            (await client.post(f"/submit-answer/{session_id}", json=f"Answer {q} with some detail.")).raise_for_status()
+        finished_ids.append(session_id)
+    return active_ids, finished_ids
+
+async def _poll_questions(client: httpx.AsyncClient, session_ids, latencies: list, stop: asyncio.Event, worker: int):
+    i = worker
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get(f"/current-question/{session_ids[i % len(session_ids)]}")
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+        i += 1
+
+async def _background(client: httpx.AsyncClient, path: str, method: str, counts: dict, stop: asyncio.Event):
+    while not stop.is_set():
+        response = await client.request(method, path)
+        response.raise_for_status()
+        counts[path.split("/")[1]] = counts.get(path.split("/")[1], 0) + 1
+
+def _percentiles(latencies: list) -> dict:
+    ms = sorted(l * 1000 for l in latencies)
+    q = statistics.quantiles(ms, n=100)
+    return {"n": len(ms), "p50": q[49], "p95": q[94], "p99": q[98]}
+
+async def _phase(client, active_ids, finished_ids, seconds: float, pollers: int, admin: int, recommend: int):
+    latencies, counts = [], {}
+    stop = asyncio.Event()
+    tasks = [asyncio.create_task(_poll_questions(client, active_ids, latencies, stop, w)) for w in range(pollers)]
+    tasks += [asyncio.create_task(_background(client, "/admin/sessions", "GET", counts, stop)) for _ in range(admin)]
+    tasks += [
+        asyncio.create_task(_background(client, f"/generate-recommendation/{finished_ids[w % len(finished_ids)]}", "POST", counts, stop))
+        for w in range(recommend)
+    ]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    return _percentiles(latencies), counts
+
+async def bench(url: str, seconds: float, pollers: int, admin: int, recommend: int, active: int, finished: int):
+    limits = httpx.Limits(max_connections=pollers + admin + recommend)
+    async with httpx.AsyncClient(base_url=url, timeout=60, limits=limits) as client:
+        print(f"Seeding {active} active and {finished} finished sessions on {url}...")
+        active_ids, finished_ids = await _seed(client, active, finished)
+
+        print(f"\n/current-question with {pollers} pollers, {seconds:.0f}s per phase")
+        alone, _ = await _phase(client, active_ids, finished_ids, seconds, pollers, 0, 0)
+        loaded, counts = await _phase(client, active_ids, finished_ids, seconds, pollers, admin, recommend)
+
+    print(f"\n{'phase':<34}{'requests':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for label, s in (("alone", alone), (f"+{admin} admin, +{recommend} recommendation", loaded)):
+        print(f"{label:<34}{s['n']:>10}{s['p50']:>10.1f}{s['p95']:>10.1f}{s['p99']:>10.1f}")
+    print(f"\nBackground requests completed: {counts}")
+    print(f"p99 under load / alone: {loaded['p99'] / alone['p99']:.2f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="/current-question latency while /admin/sessions and recommendation writes run concurrently")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="A running server (uvicorn app.main:app)")
+    parser.add_argument("--seconds", type=float, default=15.0, help="Duration of each phase")
+    parser.add_argument("--pollers", type=int, default=8, help="Concurrent /current-question clients")
+    parser.add_argument("--admin", type=int, default=2, help="Concurrent /admin/sessions clients")
+    parser.add_argument("--recommend", type=int, default=2, help="Concurrent /generate-recommendation clients")
+    parser.add_argument("--active", type=int, default=50, help="Active sessions to poll")
+    parser.add_argument("--finished", type=int, default=10, help="Finished sessions to write recommendations for")
+    args = parser.parse_args()
+    asyncio.run(bench(args.url, args.seconds, args.pollers, args.admin, args.recommend, args.active, args.finished))
@@ -0,0 +1,78 @@
+import sys
+import os
+import glob
+import time
+import hashlib
+import argparse
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.config import settings
+from app.cv_intelligence.parser import CVParser
+from app.cv_intelligence.skill_extractor import SkillExtractor
+
+def _load_texts(pattern: str, copies: int):
+    """Text of each unique CV in uploads/, repeated to get a bulk-import sized corpus."""
+    parser = CVParser(pdf_workers=0)
+    texts, seen = [], set()
+    for path in sorted(glob.glob(pattern)):
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if digest in seen or os.path.splitext(path)[1].lower() not in (".pdf", ".docx"):
+            continue
+        seen.add(digest)
+        try:
+            texts.append(parser.parse(path))
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+    parser.close()
+    return texts * copies
+
+def bench(pattern: str, copies: int, batch_size: int, n_process: int):
+    import spacy
+
+    texts = _load_texts(pattern, copies)
+    if not texts:
+        print(f"No CVs match {pattern}")
+        return
+    chars = sum(len(t) for t in texts)
+    print(f"Benchmarking noun-chunk extraction on {len(texts)} CVs ({chars / 1000:.0f}k chars, model: {settings.SPACY_MODEL})\n")
+
+    extractor = SkillExtractor(model=settings.SPACY_MODEL, batch_size=batch_size, n_process=n_process)
+    full_nlp = spacy.load(settings.SPACY_MODEL)
+    print(f"Full pipeline: {full_nlp.pipe_names}")
+
+    # Previous behaviour: full pipeline, one document per call
+    start = time.perf_counter()
+    for text in texts:
+        list(full_nlp(text.lower()).noun_chunks)
+    full_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in texts:
+        extractor.extract(text)
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = extractor.extract_many(texts)
+    batched_seconds = time.perf_counter() - start
+
+    assert batched == [extractor.extract(t) for t in texts[:len(texts) // copies]] * copies, "Batched output differs"
+
+    print(f"\n{'path':<58}{'seconds':>10}{'CVs/s':>10}{'speedup':>10}")
+    for name, seconds in (
+        ("full pipeline, one CV per call", full_seconds),
+        ("slim pipeline, extract() per CV", single_seconds),
+        (f"slim pipeline, extract_many (batch {batch_size}, n_process {n_process})", batched_seconds),
+    ):
+        print(f"{name:<58}{seconds:>10.2f}{len(texts) / seconds:>10.1f}{full_seconds / seconds:>9.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-document vs batched spaCy noun-chunk extraction")
+    parser.add_argument("--files", default=os.path.join("uploads", "*"))
+    parser.add_argument("--copies", type=int, default=10, help="Repeat the corpus to simulate a bulk import")
+    parser.add_argument("--batch-size", type=int, default=settings.SPACY_BATCH_SIZE)
+    parser.add_argument("--n-process", type=int, default=settings.SPACY_N_PROCESS)
+    args = parser.parse_args()
+    bench(args.files, args.copies, args.batch_size, args.n_process)
@@ -0,0 +1,91 @@
+"""
+Migration: Content-addressed uploads
+
+Renames every CV in uploads/ to <sha256><ext> (the name new uploads get), removes
+byte-identical duplicates and points candidates.cv_path at the remaining file.
+
+Old files are removed only after the new paths are committed, so an interrupted
+run leaves every candidate with a readable CV and can simply be run again.
+
+Run this script once after deploying content-addressed uploads.
+Use --dry-run to only report what would change.
+"""
+
+import os
+import sys
+import shutil
+import hashlib
+from sqlalchemy import text
+from app.database import engine
+
+UPLOADS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads")
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _place(path: str, target_path: str):
+    """Makes the file available under target_path too (hard link, else an atomic copy)."""
+    try:
+        os.link(path, target_path)
+    except OSError:
+        tmp_path = f"{target_path}.tmp"
+        shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, target_path)
+
+def run_migration(dry_run: bool = False):
+    """Deduplicate uploads/ and update candidate CV paths"""
+    try:
+        print(f"Starting migration: content-addressed uploads{' (dry run)' if dry_run else ''}...")
+
+        renames = {}  # old cv_path -> new cv_path
+        stored = set(os.listdir(UPLOADS_DIR))  # Names present once the migration is done
+        old_files = []  # Removed once candidates point at the new names
+        freed_bytes = 0
+        for name in sorted(os.listdir(UPLOADS_DIR)):
+            path = os.path.join(UPLOADS_DIR, name)
+            ext = os.path.splitext(name)[1]
+            if not os.path.isfile(path) or ext.lower() not in (".pdf", ".docx") or name.startswith("."):
+                continue
+
+            content_hash = _sha256(path)
+            target_name = f"{content_hash}{ext.lower()}"
+            if name == target_name:
+                continue
+
+            if target_name in stored:
+                freed_bytes += os.path.getsize(path)
+            elif not dry_run:
+                _place(path, os.path.join(UPLOADS_DIR, target_name))
+            stored.add(target_name)
+            renames[f"uploads/{name}"] = f"uploads/{target_name}"
+            old_files.append(path)
+
+        if renames and not dry_run:
+            with engine.connect() as conn:
+                updated = 0
+                for old_path, new_path in renames.items():
+                    result = conn.execute(
+                        text("UPDATE candidates SET cv_path = :new WHERE cv_path = :old"),
+                        {"new": new_path, "old": old_path}
+                    )
+                    updated += result.rowcount
+                conn.commit()
+            print(f"✓ {updated} candidate CV paths updated")
+
+            for path in old_files:
+                os.remove(path)
+
+        print(f"✓ {len(renames)} files renamed or merged, {freed_bytes / (1024 * 1024):.1f} MB of duplicates removed")
+
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration(dry_run="--dry-run" in sys.argv)
@@ -0,0 +1,185 @@
+import sys
+import os
+import asyncio
+import time
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.analysis_jobs import AnalysisJobManager, AnalysisQueueFull, is_cancelled
+from app.cv_intelligence.cv_analyzer import AnalysisCancelled
+from app.cv_intelligence.schemas import AnalysisJobStatus, CVAnalysisResult, ComponentState
+
+def fake_analyze(file_path: str, extraction_mode: str = "parser", cancel_slot=None) -> CVAnalysisResult:
+    """Stands in for the model-backed analyzer inside the worker process."""
+    # "slow" CVs take many stages, checking for cancellation between them like CVAnalyzer
+    for _ in range(50 if "slow" in file_path else 1):
+        if is_cancelled(cancel_slot):
+            raise AnalysisCancelled("Analysis cancelled before skill mapping")
+        time.sleep(0.2)
+    if "not_a_cv" in file_path:
+        raise ValueError("The uploaded file does not look like a professional resume.")
+    return CVAnalysisResult(
+        raw_text=f"CV from {file_path}", skills_detected=["python"], inferred_skills=[], extraction_mode=extraction_mode
+    )
+
+def fake_analyze_many(file_paths, extraction_mode: str = "parser", cancel_slot=None):
+    """Stands in for the batched analyzer: one outcome per file, failures as exceptions."""
+    outcomes = []
+    for file_path in file_paths:
+        try:
+            outcomes.append(fake_analyze(file_path, extraction_mode, cancel_slot))
+        except ValueError as e:
+            outcomes.append(e)
+    return outcomes
+
+def fake_warm_up():
+    """Stands in for the worker's model loading report."""
+    return {"parser": 0.01, "spacy": 0.2, "sentence_transformer": 0.3}
+
+async def _run_checks():
+    manager = AnalysisJobManager(
+        max_workers=2,
+        max_queue=2,
+        history_size=10,
+        worker_initializer=None,
+        worker_task=fake_analyze,
+        warm_up_task=fake_warm_up,
+        worker_batch_task=fake_analyze_many,
+        extraction_mode="auto",
+        fast_queue_depth=1
+    )
+    try:
+        print("\n=== Test 0: Warm-up reports per-component load state ===")
+        assert not manager.is_ready()
+        assert manager.health()[0].state == ComponentState.PENDING
+        await manager.warm_up()
+        assert manager.is_ready() and manager.load_seconds is not None
+        health = {c.name: c for c in manager.health()}
+        assert health["sentence_transformer"].state == ComponentState.READY
+        assert health["sentence_transformer"].load_seconds == 0.3
+
+        print("\n=== Test 1: Job returns immediately, result after completion ===")
+        job = manager.submit("resume_1.pdf", cv_path="uploads/resume_1.pdf")
+        print(f"Job: {job.job_id} -> {job.status}")
+        assert job.status == AnalysisJobStatus.QUEUED
+
+        print("\n=== Test 2: Bounded queue ===")
+        manager.submit("resume_2.pdf")
+        try:
+            manager.submit("resume_3.pdf")
+            assert False, "Third job should be rejected while two are pending"
+        except AnalysisQueueFull as e:
+            print(f"Rejected as expected: {e}")
+
+        result = await manager.wait(job.job_id)
+        assert result.cv_path == "uploads/resume_1.pdf", "Result should carry the permanent upload path"
+        assert manager.get(job.job_id).status == AnalysisJobStatus.DONE
+
+        print("\n=== Test 3: Worker errors surface to the caller ===")
+        try:
+            await manager.run("not_a_cv.pdf")
+            assert False, "Validation error should propagate"
+        except ValueError as e:
+            print(f"Propagated: {e}")
+
+        failed = [j for j in manager.jobs.values() if j.status == AnalysisJobStatus.FAILED]
+        assert len(failed) == 1 and "resume" in failed[0].error
+        # Waiting on a job that already finished re-raises the same exception type (400, not 500)
+        try:
+            await manager.wait(failed[0].job_id)
+            assert False, "Validation error should propagate"
+        except ValueError as e:
+            print(f"Propagated again: {e}")
+
+        print("\n=== Test 4: Several CVs in one worker job ===")
+        outcomes = await manager.run_many(["resume_4.pdf", "not_a_cv.pdf", "resume_5.pdf"])
+        assert [type(o).__name__ for o in outcomes] == ["CVAnalysisResult", "ValueError", "CVAnalysisResult"]
+        assert outcomes[2].raw_text == "CV from resume_5.pdf"
+        assert manager.pending_count() == 0, "Batch job should free its queue slot"
+        assert len(manager.jobs) == 3, "Batch jobs are not listed in the job history"
+
+        # The pool refuses the batch (e.g. it was shut down): its slot must be returned
+        free_before = len(manager._free_slots)
+        submit_to_pool = manager._submit_to_pool
+
+        def broken_pool(*args):
+            raise RuntimeError("cannot schedule new futures after shutdown")
+
+        manager._submit_to_pool = broken_pool
+        for _ in range(manager.max_queue + 1):
+            try:
+                await manager.run_many(["resume_4.pdf"])
+                assert False, "Submission should fail"
+            except RuntimeError:
+                pass
+        manager._submit_to_pool = submit_to_pool
+        assert len(manager._free_slots) == free_before and not manager._slots, "A failed submission keeps no slot"
+        assert len(await manager.run_many(["resume_4.pdf"])) == 1
+
+        # /analyze-batch: a slot is taken at submission, so waiting for a slot between
+        # submissions never overfills the queue
+        submissions = []
+        for n in range(manager.max_queue + 2):
+            await manager.wait_for_slot()
+            submissions.append(manager.submit_many([f"resume_batch_{n}.pdf"]))
+            assert manager.pending_count() <= manager.max_queue
+        outcomes = await asyncio.gather(*(manager.wait_many(*s) for s in submissions))
+        assert all(isinstance(o[0], CVAnalysisResult) for o in outcomes)
+
+        print("\n=== Test 5: Auto extraction mode switches to fast when the queue is deep ===")
+        assert (await manager.run("resume_6.pdf")).extraction_mode == "parser"
+        first = manager.submit("resume_7.pdf")
+        second = manager.submit("resume_8.pdf")  # One job already pending
+        assert (await manager.wait(first.job_id)).extraction_mode == "parser"
+        assert (await manager.wait(second.job_id)).extraction_mode == "fast"
+        assert (await manager.run("resume_9.pdf", extraction_mode="parser")).extraction_mode == "parser"
+        try:
+            manager.resolve_extraction_mode("slow")
+            assert False, "Unknown mode should be rejected"
+        except ValueError as e:
+            print(f"Rejected as expected: {e}")
+        jobs_before, free_before = len(manager.jobs), len(manager._free_slots)
+        try:
+            manager.submit("resume_bad_mode.pdf", extraction_mode="slow")
+            assert False, "Unknown mode should be rejected"
+        except ValueError:
+            pass
+        assert len(manager.jobs) == jobs_before, "A rejected submission leaves no queued job behind"
+        assert len(manager._free_slots) == free_before, "A rejected submission keeps no slot"
+
+        print("\n=== Test 6: Cancelled jobs stop between stages and are counted ===")
+        slow = manager.submit("slow_resume_1.pdf")
+        await asyncio.sleep(1.0)
+        assert manager.cancel(slow.job_id)
+        start = time.perf_counter()
+        try:
+            await manager.wait(slow.job_id)
+            assert False, "Cancelled job should not return a result"
+        except AnalysisCancelled as e:
+            print(f"Stopped as expected: {e}")
+        assert time.perf_counter() - start < 2, "Worker should stop at the next stage, not finish the CV"
+        assert manager.get(slow.job_id).status == AnalysisJobStatus.CANCELLED
+        assert not manager.cancel(slow.job_id), "Finished jobs cannot be cancelled"
+
+        # A caller that goes away (client disconnect) takes its job with it
+        caller = asyncio.create_task(manager.run("slow_resume_2.pdf"))
+        await asyncio.sleep(1.0)
+        caller.cancel()
+        while manager.pending_count():
+            await asyncio.sleep(0.1)
+        metrics = manager.metrics()
+        print(metrics)
+        assert metrics.cancel_requests == 2 and metrics.cancelled_running == 2
+        assert metrics.completed + metrics.failed + metrics.cancelled_running + metrics.cancelled_queued == metrics.submitted
+        assert (await manager.run("resume_10.pdf")).raw_text == "CV from resume_10.pdf", "Slots are reused after cancellation"
+    finally:
+        manager.shutdown()
+
+def test_analysis_jobs():
+    print("Testing Analysis Job Manager...")
+    asyncio.run(_run_checks())
+    print("\n[SUCCESS] Analysis Job Manager verified!")
+
+if __name__ == "__main__":
+    test_analysis_jobs()
@@ -0,0 +1,88 @@
+import sys
+import os
+import uuid
+import asyncio
+from datetime import datetime
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from sqlalchemy.exc import IntegrityError
+from app.interview_flow.answer_store import AnswerStore
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.session_state import InProcessSessionState
+from app.interview_flow.schemas import Answer
+from app.question_engine.schemas import Question, QuestionSet
+from app.database import engine, SessionLocal
+from app.models import SessionModel
+from app import models
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def make_answer(question_id: int, text: str) -> Answer:
+    return Answer(question_id=question_id, answer_text=text, time_spent=42, submitted_at=datetime.now(), ai_score=0.1, ai_explanation="")
+
+def test_answer_store():
+    print("Testing answer store...")
+    store = AnswerStore()
+
+    print("\n=== Test 1: Answers are appended as rows, in order ===")
+    session_id = str(uuid.uuid4())
+    db = SessionLocal()
+    db.add(SessionModel(id=session_id, status="active", total_questions=2, current_question_index=0, questions=[], answers=[]))
+    db.commit()
+    db.close()
+
+    asyncio.run(store.append(session_id, 0, make_answer(7, "First answer")))
+    asyncio.run(store.append(session_id, 1, make_answer(3, "Second answer")))
+    answers = asyncio.run(store.get(session_id))
+    assert [a.question_id for a in answers] == [7, 3]
+    assert answers[0].answer_text == "First answer" and answers[0].time_spent == 42
+
+    db = SessionLocal()
+    db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
+    assert db_session.current_question_index == 2, "The question index moves with the insert"
+    assert db_session.answers == [], "The legacy JSON column is no longer rewritten"
+    db.close()
+
+    print("\n=== Test 2: One answer per question ===")
+    try:
+        asyncio.run(store.append(session_id, 1, make_answer(3, "Lost update")))
+        assert False, "A second answer for the same question must be rejected"
+    except IntegrityError:
+        print("Duplicate rejected")
+    assert len(asyncio.run(store.get(session_id))) == 2
+
+    print("\n=== Test 3: Answers of several sessions in one call ===")
+    by_session = asyncio.run(store.get_many([session_id, "no-such-session"]))
+    assert list(by_session) == [session_id]
+    assert asyncio.run(store.get_many([])) == {}
+
+    print("\n=== Test 4: Interview flow writes rows; legacy sessions fall back to the JSON list ===")
+    manager = SessionManager(state=InProcessSessionState())
+    question_set = QuestionSet(
+        candidate_name="Answer Test", candidate_level="Junior", total_questions=2,
+        questions=[Question(id=i, skill="python", difficulty="easy", type="theory", question=f"Q{i}?") for i in (1, 2)]
+    )
+    session = asyncio.run(manager.create_session("answers_001", "Answer Test", "+998901234567", "answer.test@example.com", question_set))
+    asyncio.run(manager.submit_answer(session.session_id, "Answer one"))
+    asyncio.run(manager.submit_answer(session.session_id, "Answer two"))
+    assert [a.answer_text for a in asyncio.run(store.get(session.session_id))] == ["Answer one", "Answer two"]
+    assert [a.answer_text for a in asyncio.run(manager._load_session_from_db(session.session_id)).answers] == ["Answer one", "Answer two"]
+
+    legacy_id = str(uuid.uuid4())
+    db = SessionLocal()
+    db.add(SessionModel(
+        id=legacy_id, status="finished", total_questions=1, current_question_index=1, questions=[],
+        answers=[{"question_id": 5, "answer_text": "Legacy answer", "time_spent": 10, "submitted_at": "2025-01-01T10:00:00"}]
+    ))
+    db.commit()
+    db.close()
+    legacy = asyncio.run(manager._load_session_from_db(legacy_id))
+    assert [a.answer_text for a in legacy.answers] == ["Legacy answer"]
+
+    print("\n[SUCCESS] Answer store verified!")
+
+if __name__ == "__main__":
+    test_answer_store()
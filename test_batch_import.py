@@ -0,0 +1,91 @@
+import sys
+import os
+import io
+import uuid
+import zipfile
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.batch_import import expand_batch, copy_limited
+from app.cv_intelligence.schemas import AnalysisJobStatus
+
+def test_batch_import():
+    print("Testing Batch Import Expansion...")
+    out_dir = tempfile.mkdtemp()
+
+    def save_stream(stream, ext, max_bytes):
+        path = os.path.join(out_dir, f"{uuid.uuid4()}{ext}")
+        try:
+            with open(path, "wb") as f:
+                copy_limited(stream, f, max_bytes)
+        except Exception:
+            os.remove(path)
+            raise
+        return path
+
+    archive_bytes = io.BytesIO()
+    with zipfile.ZipFile(archive_bytes, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("cvs/", "")
+        zf.writestr("cvs/alice.pdf", b"%PDF-1.4 alice")
+        zf.writestr("cvs/bob.docx", b"PK docx bob")
+        zf.writestr("cvs/notes.txt", b"not a cv")
+        zf.writestr("cvs/huge.pdf", b"0" * 2048)
+        zf.writestr("__MACOSX/cvs/._alice.pdf", b"resource fork")
+    archive_bytes.seek(0)
+
+    uploads = [
+        ("batch.zip", archive_bytes),
+        ("carol.pdf", io.BytesIO(b"%PDF-1.4 carol")),
+        ("broken.zip", io.BytesIO(b"definitely not a zip")),
+    ]
+
+    accepted, rejected = expand_batch(uploads, save_stream, max_files=10, max_file_bytes=1024)
+
+    print(f"Accepted: {[(i, name) for i, name, _ in accepted]}")
+    print(f"Rejected: {[(r.filename, r.error) for r in rejected]}")
+
+    assert [name for _, name, _ in accepted] == ["cvs/alice.pdf", "cvs/bob.docx", "carol.pdf"]
+    assert sorted(r.filename for r in rejected) == ["broken.zip", "cvs/huge.pdf", "cvs/notes.txt"]
+    assert all(r.status == AnalysisJobStatus.FAILED and r.error for r in rejected)
+
+    # Every file gets a distinct index across accepted and rejected items
+    indexes = [i for i, _, _ in accepted] + [r.index for r in rejected]
+    assert sorted(indexes) == list(range(len(indexes)))
+
+    with open(accepted[0][2], "rb") as f:
+        assert f.read() == b"%PDF-1.4 alice", "Entry should be streamed to disk unchanged"
+    assert len(os.listdir(out_dir)) == 3, "Oversized entries must not leave files behind"
+
+    print("\n=== Batch limit ===")
+    archive_bytes.seek(0)
+    accepted, rejected = expand_batch([("batch.zip", archive_bytes)], save_stream, max_files=1, max_file_bytes=1024)
+    assert len(accepted) == 1
+    assert any("limit" in r.error for r in rejected)
+
+    print("\n=== Corrupt entries and failed saves only reject that file ===")
+    corrupt_bytes = io.BytesIO()
+    with zipfile.ZipFile(corrupt_bytes, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("dave.pdf", b"%PDF-1.4 dave " * 200)
+        zf.writestr("erin.pdf", b"%PDF-1.4 erin")
+    data = bytearray(corrupt_bytes.getvalue())
+    with zipfile.ZipFile(io.BytesIO(bytes(data))) as zf:
+        info = zf.getinfo("dave.pdf")
+    start = info.header_offset + 30 + len(info.filename) + len(info.extra)
+    data[start:start + 8] = b"\xff" * 8  # Invalid deflate block
+    accepted, rejected = expand_batch([("corrupt.zip", io.BytesIO(bytes(data)))], save_stream, max_files=10, max_file_bytes=1024 * 1024)
+    print(f"Rejected: {[(r.filename, r.error) for r in rejected]}")
+    assert [name for _, name, _ in accepted] == ["erin.pdf"]
+    assert [r.filename for r in rejected] == ["dave.pdf"]
+
+    def failing_save(stream, ext, max_bytes):
+        raise OSError("No space left on device")
+
+    accepted, rejected = expand_batch([("frank.pdf", io.BytesIO(b"%PDF-1.4 frank"))], failing_save, max_files=10, max_file_bytes=1024)
+    assert accepted == [] and "No space left" in rejected[0].error
+
+    print("\n[SUCCESS] Batch Import verified!")
+
+if __name__ == "__main__":
+    test_batch_import()
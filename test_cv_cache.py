@@ -0,0 +1,102 @@
+import sys
+import os
+import json
+import shutil
+import asyncio
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.schemas import CVAnalysisResult
+from app.cv_intelligence.analysis_store import CVAnalysisStore
+from app.database import engine
+from app import models
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def test_cv_analysis_store():
+    print("Testing CV Analysis Store...")
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        f.write(os.urandom(4096))
+        path = f.name
+
+    try:
+        store = CVAnalysisStore("test-version")
+        content_hash = store.hash_file(path)
+        assert len(content_hash) == 64, "Should be a SHA-256 hex digest"
+        assert store.get(content_hash) is None, "Unknown file should miss"
+
+        result = CVAnalysisResult(
+            raw_text="Python developer, 3 years experience",
+            skills_detected=["python"],
+            inferred_skills=["Django"],
+            experience_years=3.0,
+            cv_path="uploads/some-file.pdf"
+        )
+        store.put(content_hash, result)
+        # Storing the same key twice must not fail
+        store.put(content_hash, result)
+
+        cached = store.get_for_file(path)
+        print(f"Cached: {cached}")
+        assert cached is not None, "Stored analysis should be found"
+        assert cached.skills_detected == ["python"]
+        assert cached.inferred_skills == ["Django"]
+        assert cached.cv_path is None, "Upload path is not part of the content-addressed result"
+
+        # A different analyzer/model version must not reuse the result
+        assert CVAnalysisStore("other-version").get(content_hash) is None
+
+        print("\n[SUCCESS] CV Analysis Store verified!")
+    finally:
+        os.remove(path)
+
+def test_stored_analysis_follows_ontology():
+    print("Testing API lookups after an ontology edit...")
+    from app import main
+    from app.config import settings
+    from app.cv_intelligence.cv_analyzer import CVAnalyzer
+    from app.cv_intelligence.ontology import DEFAULT_ONTOLOGY_PATH
+    from app.cv_intelligence.upload_store import UploadStore
+
+    work_dir = tempfile.mkdtemp()
+    ontology_path = os.path.join(work_dir, "ontology.json")
+    shutil.copy(DEFAULT_ONTOLOGY_PATH, ontology_path)
+    # A CV stored before content-addressed names (uploads/<uuid><ext>), so the lookup hashes it
+    cv_path = "uploads/legacy-cv.pdf"
+    with open(os.path.join(work_dir, "legacy-cv.pdf"), "wb") as f:
+        f.write(os.urandom(4096))
+
+    previous = settings.ONTOLOGY_PATH, main.cv_store, main.upload_store
+    settings.ONTOLOGY_PATH = ontology_path
+    main.upload_store = UploadStore(work_dir)
+    try:
+        # The API process computes the tag at startup
+        main.cv_store = CVAnalysisStore(CVAnalyzer.version_tag())
+        main.cv_store.put(
+            main.upload_store.content_hash(cv_path),
+            CVAnalysisResult(raw_text="Python developer", skills_detected=["python"], inferred_skills=[], experience_years=1.0)
+        )
+        stored = asyncio.run(main._stored_analysis(cv_path))
+        assert stored is not None and stored.cv_path == cv_path
+
+        # Someone edits the ontology; workers now store under a new tag
+        with open(ontology_path, "r", encoding="utf-8") as f:
+            ontology = json.load(f)
+        ontology["concepts"]["test concept"] = ["Python"]
+        with open(ontology_path, "w", encoding="utf-8") as f:
+            json.dump(ontology, f)
+        assert asyncio.run(main._stored_analysis(cv_path)) is None, "Analyses of the old ontology must not be served"
+        assert main.cv_store.version_tag == CVAnalyzer.version_tag()
+    finally:
+        settings.ONTOLOGY_PATH, main.cv_store, main.upload_store = previous
+        shutil.rmtree(work_dir)
+
+    print("\n[SUCCESS] Stored analyses follow ontology edits!")
+
+if __name__ == "__main__":
+    test_cv_analysis_store()
+    test_stored_analysis_follows_ontology()
@@ -0,0 +1,99 @@
+import sys
+import os
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.parser import CVParser
+from app.cv_intelligence.validation import validate_resume
+
+def _write_pdf(path: str, pages_text):
+    """Writes a minimal multi-page PDF with one line of Helvetica text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages_text:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    body += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode("latin-1")
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    with open(path, "wb") as f:
+        f.write(body)
+
+def test_cv_parser_budget():
+    print("Testing budgeted PDF extraction...")
+    work_dir = tempfile.mkdtemp()
+    pdf_path = os.path.join(work_dir, "cv.pdf")
+    _write_pdf(pdf_path, [f"Page {i} Python developer experience" for i in range(1, 7)])
+
+    serial = CVParser(pdf_workers=0, max_pages=30, max_chars=200000, timeout=30)
+    parallel = CVParser(pdf_workers=2, max_pages=30, max_chars=200000, timeout=30)
+    try:
+        print("\n=== Test 1: Parallel pages come back in order, same text as serial ===")
+        expected = "\n".join(f"Page {i} Python developer experience" for i in range(1, 7))
+        assert serial.parse(pdf_path) == expected
+        assert parallel.parse(pdf_path) == expected
+
+        print("\n=== Test 2: Page cap ===")
+        capped = CVParser(pdf_workers=0, max_pages=2, max_chars=200000, timeout=30).parse(pdf_path)
+        assert capped.splitlines() == ["Page 1 Python developer experience", "Page 2 Python developer experience"]
+
+        print("\n=== Test 3: Character cap ===")
+        short = CVParser(pdf_workers=2, max_pages=30, max_chars=50, timeout=30)
+        try:
+            assert len(short.parse(pdf_path)) <= 50
+        finally:
+            short.close()
+
+        print("\n=== Test 4: Pages stream one at a time ===")
+        pages = parallel.iter_pdf_pages(pdf_path)
+        assert next(pages).strip() == "Page 1 Python developer experience"
+        pages.close()
+
+        print("\n=== Test 5: Timeout returns no text and a clear error ===")
+        try:
+            CVParser(pdf_workers=0, max_pages=30, max_chars=200000, timeout=-1).parse(pdf_path)
+            assert False, "Expired budget should fail"
+        except ValueError as e:
+            print(f"Rejected as expected: {e}")
+
+        print("\n=== Test 6: Pages are validated as they arrive, same result as the joined text ===")
+        cv_path = os.path.join(work_dir, "resume.pdf")
+        _write_pdf(cv_path, [
+            "Ivan Ivanov ivan@example.com",
+            "Work Experience 2019 - 2024 Python developer",
+            "Skills Python Django SQL",
+            "Education Tashkent University 2018"
+        ])
+        for pdf_parser in (serial, parallel):
+            text, validation = pdf_parser.parse_and_validate(cv_path)
+            assert text == pdf_parser.parse(cv_path)
+            assert validation == validate_resume(text), (validation, validate_resume(text))
+        print(f"Validation: score={validation.score} markers={validation.markers}")
+        assert validation.is_resume and validation.has_email and validation.has_years
+        _, validation = serial.parse_and_validate(pdf_path)
+        assert not validation.is_resume
+        os.remove(cv_path)
+    finally:
+        parallel.close()
+        os.remove(pdf_path)
+        os.rmdir(work_dir)
+
+    print("\n[SUCCESS] Budgeted PDF extraction verified!")
+
+if __name__ == "__main__":
+    test_cv_parser_budget()
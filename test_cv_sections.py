@@ -0,0 +1,62 @@
+import sys
+import os
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.sections import segment_sections, section_text
+
+CV_TEXT = """John Smith
+john.smith@example.com
++998901234567
+Professional Summary
+Backend developer building APIs with Python.
+WORK EXPERIENCE
+Acme Corp, 2019 - 2024: FastAPI microservices, PostgreSQL.
+Technical Skills: Python, Docker, Kubernetes
+Education
+TUIT, Computer Science, 2015 - 2019
+Hobbies
+Chess, hiking and photography.
+"""
+
+def test_cv_sections():
+    print("Testing CV section segmentation...")
+
+    print("\n=== Test 1: English headings ===")
+    sections = segment_sections(CV_TEXT)
+    print([(s.name, s.heading) for s in sections])
+    assert [s.name for s in sections] == ["header", "summary", "experience", "skills", "education", "other"]
+    assert sections[3].heading == "Technical Skills: Python, Docker, Kubernetes"
+    assert "".join(CV_TEXT[s.start:s.end] for s in sections) == CV_TEXT, "Sections should cover the text exactly"
+
+    print("\n=== Test 2: Only skill-bearing sections go to NLP ===")
+    text = section_text(CV_TEXT, sections, ["skills", "experience", "projects", "summary"])
+    assert "FastAPI microservices" in text and "Kubernetes" in text and "Backend developer" in text
+    assert "john.smith@example.com" not in text and "Chess" not in text and "TUIT" not in text
+
+    print("\n=== Test 3: RU/UZ headings, PDF text without spaces ===")
+    ru = segment_sections("Иван Петров\nОпыт работы\nРазработчик Python\nНАВЫКИ:\nDjango, Docker\nКурсы специализации в\nобласти ИИ\n")
+    assert [s.name for s in ru] == ["header", "experience", "skills"], [s.name for s in ru]
+    uz = segment_sections("Aziz\nIsh tajribasi\nPython dasturchi\nKo‘nikmalar:\n- Django\n")
+    assert [s.name for s in uz] == ["header", "experience", "skills"]
+    assert [s.name for s in segment_sections("Name\nWORKEXPERIENCE\nBackend\nHardSkills:\nSQL\n")] == ["header", "experience", "skills"]
+
+    print("\n=== Test 4: Ordinary lines are not headings ===")
+    plain = "Experienced Python developer\nI have skills in many areas of software engineering\n"
+    assert [s.name for s in segment_sections(plain)] == ["header"]
+    assert section_text(plain, segment_sections(plain), ["skills"]) == plain, "No skill section: keep the whole text"
+    body = "Jane Doe\nExperience\nLed client projects\nStrong communication skills\nMentored three juniors\n"
+    assert [s.name for s in segment_sections(body)] == ["header", "experience"], [s.name for s in segment_sections(body)]
+
+    print("\n=== Test 5: Programming languages are skills, spoken languages are not ===")
+    cv = "Jane Doe\nProgramming Languages\nPython, Go, Rust\nTechnical Languages: SQL, Bash\nLanguages\nEnglish, Uzbek\n"
+    sections = segment_sections(cv)
+    assert [s.name for s in sections] == ["header", "skills", "languages"], [s.name for s in sections]
+    text = section_text(cv, sections, ["skills", "experience", "projects", "summary"])
+    assert "Rust" in text and "SQL" in text and "Uzbek" not in text
+
+    print("\n[SUCCESS] CV section segmentation verified!")
+
+if __name__ == "__main__":
+    test_cv_sections()
@@ -0,0 +1,72 @@
+import sys
+import os
+import tempfile
+import docx
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.parser import CVParser
+
+def _write_docx(path: str):
+    """DOCX with a header, body paragraphs, a table and a footer."""
+    document = docx.Document()
+    section = document.sections[0]
+    section.header.paragraphs[0].text = "Jane Doe - Curriculum Vitae"
+    section.footer.paragraphs[0].text = "jane.doe@example.com"
+    document.add_paragraph("Senior Python developer")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Skills"
+    table.cell(0, 1).text = "FastAPI, PostgreSQL"
+    table.cell(1, 0).text = "Languages"
+    table.cell(1, 1).text = "English"
+    paragraph = document.add_paragraph("Docker")
+    paragraph.add_run().add_break()
+    paragraph.add_run("Kubernetes")
+    document.save(path)
+
+def test_docx_stream_parser():
+    print("Testing streaming DOCX extraction...")
+    work_dir = tempfile.mkdtemp()
+    docx_path = os.path.join(work_dir, "cv.docx")
+    _write_docx(docx_path)
+    parser = CVParser(pdf_workers=0)
+    try:
+        print("\n=== Test 1: Header, body, table rows and footer, in order ===")
+        lines = parser.parse(docx_path).splitlines()
+        print(lines)
+        assert lines == [
+            "Jane Doe - Curriculum Vitae",
+            "Senior Python developer",
+            "Skills | FastAPI, PostgreSQL",
+            "Languages | English",
+            "Docker",
+            "Kubernetes",
+            "jane.doe@example.com",
+        ]
+
+        print("\n=== Test 2: Body paragraphs match python-docx ===")
+        legacy = parser._parse_docx_python_docx(docx_path).splitlines()
+        assert all(line in lines for line in legacy)
+
+        print("\n=== Test 3: Character cap ===")
+        assert len(CVParser(pdf_workers=0, max_chars=30).parse(docx_path)) <= 30
+
+        print("\n=== Test 4: Broken file gives a clear error ===")
+        broken_path = os.path.join(work_dir, "broken.docx")
+        with open(broken_path, "wb") as f:
+            f.write(b"not a zip")
+        try:
+            parser.parse(broken_path)
+            assert False, "Broken DOCX should fail"
+        except ValueError as e:
+            print(f"Rejected as expected: {e}")
+        os.remove(broken_path)
+    finally:
+        os.remove(docx_path)
+        os.rmdir(work_dir)
+
+    print("\n[SUCCESS] Streaming DOCX extraction verified!")
+
+if __name__ == "__main__":
+    test_docx_stream_parser()
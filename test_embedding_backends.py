@@ -0,0 +1,35 @@
+import sys
+import os
+import numpy as np
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.embedding_backends import create_embedding_backend, backend_namespace, parity_report
+
+def test_embedding_backends():
+    print("Testing Embedding Backends...")
+
+    print("\n=== Test 1: Parity report ===")
+    rng = np.random.default_rng(0)
+    reference = rng.normal(size=(10, 16)).astype(np.float32)
+    report = parity_report(reference, reference * 3.0)
+    assert report["phrases"] == 10 and report["min_cosine"] == 1.0, "Scale must not affect cosine parity"
+    drifted = parity_report(reference, reference + rng.normal(scale=0.5, size=reference.shape))
+    assert drifted["min_cosine"] < 0.99 and drifted["mean_cosine"] <= 1.0
+
+    print("\n=== Test 2: Backends never share an embedding cache namespace ===")
+    assert backend_namespace("all-MiniLM-L6-v2", "torch") == "all-MiniLM-L6-v2"
+    assert backend_namespace("all-MiniLM-L6-v2", "onnx-int8") != backend_namespace("all-MiniLM-L6-v2", "torch")
+
+    print("\n=== Test 3: Unknown backend is rejected ===")
+    try:
+        create_embedding_backend("tensorrt", "all-MiniLM-L6-v2")
+        assert False, "Unknown backend should raise"
+    except ValueError as e:
+        print(f"Rejected as expected: {e}")
+
+    print("\n[SUCCESS] Embedding Backends verified!")
+
+if __name__ == "__main__":
+    test_embedding_backends()
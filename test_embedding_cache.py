@@ -0,0 +1,67 @@
+import sys
+import os
+import tempfile
+import shutil
+import numpy as np
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.embedding_cache import EmbeddingCache
+
+DIM = 8
+
+class CountingEncoder:
+    """Deterministic stand-in for the sentence transformer."""
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, phrases):
+        self.calls.append(list(phrases))
+        return np.stack([np.full(DIM, float(len(p)), dtype=np.float32) for p in phrases])
+
+def test_embedding_cache():
+    print("Testing Embedding Cache...")
+    cache_dir = tempfile.mkdtemp()
+    try:
+        encoder = CountingEncoder()
+        cache = EmbeddingCache("test-model", DIM, cache_dir, memory_size=2, disk_capacity=3)
+
+        print("\n=== Test 1: Misses go to the model in one batch ===")
+        vectors = cache.get_many(["Rest API", "team lead", "rest  api"], encoder)
+        assert vectors.shape == (3, DIM)
+        assert encoder.calls == [["rest api", "team lead"]] or encoder.calls == [["team lead", "rest api"]], \
+            "Normalized duplicates should be encoded once, in a single call"
+        assert np.allclose(vectors[0], vectors[2])
+
+        print("\n=== Test 2: Memory hits ===")
+        cache.get_many(["team lead"], encoder)
+        assert len(encoder.calls) == 1
+        assert cache.stats_local["memory_hits"] == 1
+
+        print("\n=== Test 3: Disk tier survives a restart ===")
+        cache.close()
+        reopened = EmbeddingCache("test-model", DIM, cache_dir, memory_size=2, disk_capacity=3)
+        vectors = reopened.get_many(["rest api"], encoder)
+        assert len(encoder.calls) == 1, "Disk hit must not call the model"
+        assert np.allclose(vectors[0], np.full(DIM, 8.0)), "float16 round-trip should preserve the vector"
+        assert reopened.stats_local["disk_hits"] == 1
+
+        print("\n=== Test 4: Capacity cap with LRU eviction ===")
+        reopened.get_many(["python", "docker"], encoder)
+        stats = reopened.stats()
+        print(f"Stats: {stats}")
+        assert stats["disk_items"] == 3, "Disk tier must stay within its capacity"
+        assert stats["evictions"] == 1
+        assert stats["misses"] == 4 and stats["hit_rate"] > 0
+
+        shared = EmbeddingCache.read_shared_stats(cache_dir, "test-model")
+        assert shared["disk_items"] == 3
+        reopened.close()
+
+        print("\n[SUCCESS] Embedding Cache verified!")
+    finally:
+        shutil.rmtree(cache_dir)
+
+if __name__ == "__main__":
+    test_embedding_cache()
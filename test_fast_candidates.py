@@ -0,0 +1,37 @@
+import sys
+import os
+import spacy
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.skill_extractor import SkillExtractor, MAX_CANDIDATE_WORDS
+
+def test_fast_candidates():
+    print("Testing parser-free candidate phrases...")
+    nlp = spacy.blank("en")  # Tokenizer only, as in the fast path
+
+    print("\n=== Test 1: Windows stay between stop words, punctuation and numbers ===")
+    doc = nlp.make_doc("experienced in building rest apis with fastapi and postgresql.\n• 5 years of machine learning, c++ and node.js")
+    phrases = list(SkillExtractor._ngram_phrases(doc))
+    print(phrases)
+    for phrase in ["building rest apis", "rest apis", "fastapi", "postgresql", "machine learning", "c++", "node.js"]:
+        assert phrase in phrases, f"Should generate '{phrase}'"
+    for phrase in ["in building", "apis with", "5 years", "learning, c++"]:
+        assert phrase not in phrases, f"'{phrase}' crosses a boundary"
+
+    print("\n=== Test 2: At most 5 tokens per phrase ===")
+    doc = nlp.make_doc("senior backend platform engineering team lead architect")
+    phrases = list(SkillExtractor._ngram_phrases(doc))
+    assert max(len(p.split()) for p in phrases) == MAX_CANDIDATE_WORDS
+    assert "senior backend platform engineering team" in phrases
+    assert "senior backend platform engineering team lead" not in phrases
+
+    print("\n=== Test 3: Empty and stop-word-only text ===")
+    assert list(SkillExtractor._ngram_phrases(nlp.make_doc(""))) == []
+    assert list(SkillExtractor._ngram_phrases(nlp.make_doc("and of the, 2020"))) == []
+
+    print("\n[SUCCESS] Parser-free candidate phrases verified!")
+
+if __name__ == "__main__":
+    test_fast_candidates()
@@ -1,6 +1,7 @@
 import sys
 import os
 import time
+import asyncio
 
 # Add current dir to path
 sys.path.append(os.getcwd())
@@ -42,13 +43,13 @@ def test_interview_flow():
     
     # Create session
     manager = SessionManager()
-    session = manager.create_session(
+    session = asyncio.run(manager.create_session(
         candidate_id="test_001",
         candidate_name="Test Candidate",
         candidate_phone="+998901234567",
         candidate_email="test@example.com",
         question_set=question_set
-    )
+    ))
     
     print(f"\n=== Test 1: Session Creation ===")
     print(f"Session ID: {session.session_id}")
@@ -67,7 +68,7 @@ def test_interview_flow():
     # Answer all questions
     for i in range(question_set.total_questions):
         # Get current question
-        current_q = manager.get_current_question(session.session_id)
+        current_q = asyncio.run(manager.get_current_question(session.session_id))
         
         print(f"\nQuestion {i+1}/{question_set.total_questions}:")
         print(f"  Skill: {current_q.skill}")
@@ -80,10 +81,10 @@ def test_interview_flow():
         
         # Submit answer
         answer_text = f"This is my answer to question {current_q.question_id}"
-        answer = manager.submit_answer(
+        answer = asyncio.run(manager.submit_answer(
             session_id=session.session_id,
             answer_text=answer_text
-        )
+        ))
         
         print(f"  Answer submitted: {answer.time_spent}s spent")
         print(f"  Timeout: {answer.is_timeout}")
@@ -96,7 +97,7 @@ def test_interview_flow():
     print(f"\n=== Test 3: Session Completion ===")
     
     # Get final status
-    final_session = manager.get_session_status(session.session_id)
+    final_session = asyncio.run(manager.get_session_status(session.session_id))
     
     print(f"Final Status: {final_session.status}")
     print(f"Answered Questions: {len(final_session.answers)}")
@@ -110,7 +111,7 @@ def test_interview_flow():
     print(f"\n=== Test 4: Session Summary ===")
     
     # Get summary
-    summary = manager.get_session_summary(session.session_id)
+    summary = asyncio.run(manager.get_session_summary(session.session_id))
     
     print(f"Candidate: {summary.candidate_name}")
     print(f"Total Questions: {summary.total_questions}")
@@ -131,16 +132,16 @@ def test_interview_flow():
     print(f"\n=== Test 5: Timer Functionality ===")
     
     # Create new session to test timer
-    session2 = manager.create_session(
+    session2 = asyncio.run(manager.create_session(
         candidate_id="test_002",
         candidate_name="Timer Test",
         candidate_phone="+998901112233",
         candidate_email="timer@example.com",
         question_set=question_set
-    )
+    ))
     
     # Get current question
-    q = manager.get_current_question(session2.session_id)
+    q = asyncio.run(manager.get_current_question(session2.session_id))
     initial_time = q.time_remaining
     
     print(f"Initial time remaining: {initial_time}s")
@@ -149,7 +150,7 @@ def test_interview_flow():
     time.sleep(1.2)
     
     # Check time again
-    q2 = manager.get_current_question(session2.session_id)
+    q2 = asyncio.run(manager.get_current_question(session2.session_id))
     updated_time = q2.time_remaining
     
     print(f"After 1.2s: {updated_time}s remaining")
@@ -0,0 +1,70 @@
+import sys
+import os
+import spacy
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.language import detect_language
+from app.cv_intelligence.nlp_models import NLPModelPool, parse_language_models
+
+def fake_loader(model: str, exclude):
+    """Stands in for spacy.load: a blank pipeline of the model's language, 200 MB each."""
+    fake_loader.calls.append(model)
+    return spacy.blank(model.split("_")[0]), 200.0
+fake_loader.calls = []
+
+def test_language_routing():
+    print("Testing language detection and model routing...")
+
+    print("\n=== Test 1: Language detection ===")
+    samples = {
+        "en": "Senior Python developer with 5 years of experience in Django and PostgreSQL. Education: TUIT",
+        "ru": "Опыт работы: Python разработчик, Django, PostgreSQL, 5 лет. Образование: ТУИТ, Ташкент",
+        "uz": "Ish tajribasi: Python dasturchi, 3 yil. Ma'lumoti: TATU, ko‘nikmalar: Django va PostgreSQL",
+    }
+    for expected, text in samples.items():
+        assert detect_language(text) == expected, f"Expected {expected}: {text}"
+    assert detect_language("Иш тажрибаси: ўқитувчи, қўшимча маълумот, ғайратли, Тошкент шаҳри") == "uz"
+    assert detect_language("") == "en"
+
+    print("\n=== Test 2: Models load on first use, LRU eviction over the budget ===")
+    pool = NLPModelPool(
+        parse_language_models("en:en_core_web_sm, de:de_core_news_sm, fr:fr_core_news_sm, ru:ru_core_news_sm"),
+        memory_budget_mb=450,
+        loader=fake_loader
+    )
+    assert "ru" not in pool.models, "Russian has no noun chunks; its model should never load"
+    assert fake_loader.calls == []
+
+    nlp, parsed = pool.get("en")
+    assert parsed and fake_loader.calls == ["en_core_web_sm"]
+    pool.get("de")
+    pool.get("en")  # en is now the most recently used
+    pool.get("fr")  # 600 MB > 450 MB: de goes
+    assert pool.loaded_languages() == ["en", "fr"]
+    assert pool.evictions == 1 and pool.memory_mb() == 400.0
+    pool.get("en")
+    assert fake_loader.calls == ["en_core_web_sm", "de_core_news_sm", "fr_core_news_sm"], "Cached models are not reloaded"
+
+    print("\n=== Test 3: Languages without a model get the tokenizer only ===")
+    nlp, parsed = pool.get("ru")
+    assert not parsed and nlp.pipe_names == []
+    assert nlp.vocab["и"].is_stop
+    uz_nlp, parsed = pool.get("uz")
+    assert not parsed and uz_nlp.vocab["bilan"].is_stop
+
+    print("\n=== Test 4: Unavailable model falls back to the tokenizer ===")
+    def failing_loader(model, exclude):
+        raise OSError(f"Can't find model '{model}'")
+    offline = NLPModelPool({"de": "de_core_news_sm"}, loader=failing_loader)
+    assert offline.get("de")[1] is False
+    try:
+        offline.get("de", required=True)
+    except OSError:
+        assert False, "A failed language is not retried"
+
+    print("\n[SUCCESS] Language detection and model routing verified!")
+
+if __name__ == "__main__":
+    test_language_routing()
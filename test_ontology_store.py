@@ -0,0 +1,85 @@
+import sys
+import os
+import json
+import tempfile
+import shutil
+import numpy as np
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.ontology import OntologyStore, read_ontology_version
+
+DIM = 8
+
+class CountingEncoder:
+    """Deterministic stand-in for the sentence transformer."""
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, phrases):
+        self.calls.append(list(phrases))
+        return np.stack([np.arange(1, DIM + 1, dtype=np.float32) * len(p) for p in phrases])
+
+def _write_ontology(path, version, concepts):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": version, "concepts": concepts}, f)
+    # Make sure the mtime changes even on coarse-grained filesystems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+def test_ontology_store():
+    print("Testing Ontology Store...")
+    work_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(work_dir, "ontology.json")
+        cache_dir = os.path.join(work_dir, "cache")
+        _write_ontology(path, 1, {
+            "Cloud Native": ["Docker", "Kubernetes"],
+            "big data": ["Spark", "Kafka"]
+        })
+
+        print("\n=== Test 1: Keys encoded once, stored normalized and memory-mapped ===")
+        encoder = CountingEncoder()
+        store = OntologyStore(encoder, "test-model", cache_dir, path=path, reload_interval=0)
+        assert encoder.calls == [["cloud native", "big data"]]
+        assert isinstance(store.embeddings, np.memmap), "Embeddings should be memory-mapped"
+        assert np.allclose(np.linalg.norm(store.embeddings, axis=1), 1.0)
+        assert store.concepts["cloud native"] == ["Docker", "Kubernetes"]
+        assert store.version == read_ontology_version(path)
+
+        print("\n=== Test 2: Another worker loads the precomputed file without encoding ===")
+        other_encoder = CountingEncoder()
+        OntologyStore(other_encoder, "test-model", cache_dir, path=path, reload_interval=0)
+        assert other_encoder.calls == []
+
+        print("\n=== Test 3: Unchanged file is not reloaded ===")
+        assert store.maybe_reload() is False
+
+        print("\n=== Test 4: Hot reload encodes only new keys ===")
+        old_version = store.version
+        _write_ontology(path, 2, {
+            "cloud native": ["Docker", "Kubernetes", "Helm"],
+            "big data": ["Spark", "Kafka"],
+            "mlops": ["MLflow", "Kubeflow"]
+        })
+        assert store.maybe_reload() is True
+        assert encoder.calls[-1] == ["mlops"], f"Only the new key should be encoded, got {encoder.calls[-1]}"
+        assert store.keys == ["cloud native", "big data", "mlops"]
+        assert store.concepts["cloud native"][-1] == "Helm"
+        assert store.version != old_version
+
+        print("\n=== Test 5: Invalid file keeps the previous ontology ===")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{ not json")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        assert store.maybe_reload() is False
+        assert len(store.keys) == 3
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print("\n[SUCCESS] Ontology Store verified!")
+
+if __name__ == "__main__":
+    test_ontology_store()
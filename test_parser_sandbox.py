@@ -0,0 +1,119 @@
+import sys
+import os
+import time
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.parser import CVParser
+from app.cv_intelligence.parser_sandbox import ParserSandbox, ParseFailure, ParseTimeout, ParseMemoryExceeded, ParserCrashed
+from test_cv_parser_budget import _write_pdf
+
+# Tasks run in the sandbox process; module-level so they can be pickled
+def _hang():
+    time.sleep(60)
+
+def _allocate_gigabytes():
+    return len(bytearray(2 * 1024 ** 3))
+
+def _crash():
+    os._exit(1)
+
+def _pid():
+    return os.getpid()
+
+def _page_worker_pids():
+    from app.cv_intelligence import parser as parser_module
+    return [p.pid for p in parser_module._sandbox_parser._pdf_pool._pool]
+
+def _running(pid: int) -> bool:
+    # Killed processes may linger as zombies until reaped
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+def test_parser_sandbox():
+    print("Testing parser sandbox...")
+    work_dir = tempfile.mkdtemp()
+    pdf_path = os.path.join(work_dir, "cv.pdf")
+    broken_path = os.path.join(work_dir, "broken.pdf")
+    _write_pdf(pdf_path, [f"Page {i} Python developer experience" for i in range(1, 4)])
+    with open(broken_path, "wb") as f:
+        f.write(b"%PDF-1.4\nnot really a pdf")
+
+    sandbox = ParserSandbox(memory_mb=512, timeout=10, max_tasks=2)
+    parser = CVParser(pdf_workers=0, max_pages=30, max_chars=200000, timeout=30, sandbox=sandbox)
+    try:
+        print("\n=== Test 1: Same text as in-process parsing ===")
+        expected = CVParser(pdf_workers=0, max_pages=30, max_chars=200000, timeout=30).parse(pdf_path)
+        assert parser.parse(pdf_path) == expected
+
+        print("\n=== Test 2: Malformed file fails with a reason, not an internal error ===")
+        try:
+            parser.parse(broken_path)
+            assert False, "Broken PDF should fail"
+        except ParseFailure as e:
+            print(f"Rejected as expected ({e.reason}): {e}")
+            assert e.reason == "unreadable" and isinstance(e, ValueError)
+
+        print("\n=== Test 3: Process is recycled after max_tasks ===")
+        first = sandbox.run(_pid)
+        second = sandbox.run(_pid)
+        assert first == second and first != os.getpid()
+        assert sandbox.run(_pid) != first, "Third task should run in a fresh process"
+
+        print("\n=== Test 4: Memory cap ===")
+        try:
+            sandbox.run(_allocate_gigabytes)
+            assert False, "Allocation above the cap should fail"
+        except ParseMemoryExceeded as e:
+            print(f"Rejected as expected: {e}")
+
+        print("\n=== Test 5: Crash is reported and the sandbox recovers ===")
+        try:
+            sandbox.run(_crash)
+            assert False, "Crash should be reported"
+        except ParserCrashed as e:
+            print(f"Rejected as expected: {e}")
+        assert parser.parse(pdf_path) == expected
+
+        print("\n=== Test 6: Hung task is killed at the timeout ===")
+        sandbox.timeout = 2
+        start = time.perf_counter()
+        try:
+            sandbox.run(_hang)
+            assert False, "Hung task should time out"
+        except ParseTimeout as e:
+            print(f"Rejected as expected: {e}")
+        assert time.perf_counter() - start < 10
+        sandbox.timeout = 10
+        assert parser.parse(pdf_path) == expected
+        assert parser.parse_and_validate(pdf_path) == CVParser(pdf_workers=0, max_pages=30, max_chars=200000, timeout=30).parse_and_validate(pdf_path)
+        assert sandbox.failures == {"memory_limit": 1, "crashed": 1, "timeout": 1}, sandbox.failures
+
+        print("\n=== Test 7: PDF page workers run inside the sandbox and die with it ===")
+        pooled = CVParser(pdf_workers=2, max_pages=30, max_chars=200000, timeout=30, sandbox=ParserSandbox(memory_mb=512, timeout=20))
+        assert pooled.parse(pdf_path) == expected
+        assert pooled.parse_and_validate(pdf_path) == parser.parse_and_validate(pdf_path)
+        workers = pooled.sandbox.run(_page_worker_pids)
+        assert len(workers) == 2 and pooled.sandbox.run(_page_worker_pids) == workers, "Page workers should be reused"
+        assert pooled._pdf_pool is None, "No page workers in the calling process"
+        # One process group: a worker stuck on a page is killed with the sandbox too
+        sandbox_pid = pooled.sandbox.run(_pid)
+        assert all(os.getpgid(pid) == sandbox_pid for pid in workers)
+        pooled.close()
+        time.sleep(0.5)
+        assert not any(_running(pid) for pid in workers), "Page workers should be killed with the sandbox"
+    finally:
+        parser.close()
+        for path in (pdf_path, broken_path):
+            os.remove(path)
+        os.rmdir(work_dir)
+
+    print("\n[SUCCESS] Parser sandbox verified!")
+
+if __name__ == "__main__":
+    test_parser_sandbox()
@@ -0,0 +1,72 @@
+import sys
+import os
+import io
+import re
+import contextlib
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.sections import RESUME_MARKERS
+from app.cv_intelligence.validation import validate_resume, count_markers
+
+def legacy_score(text: str):
+    """The substring-scan scoring validate_resume replaced: (is_resume, score, markers found)."""
+    if not text or len(text.strip()) < 50:
+        return False, 0, set()
+    char_count = len(text.strip())
+    text_lower = text.lower()
+    found = {m for m in RESUME_MARKERS if m in text_lower}
+    score = 0
+    if re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text) or re.search(r'\+?\d{9,15}', text):
+        score += 20
+    if len(found) >= 2: score += 20
+    elif len(found) >= 1: score += 10
+    if re.search(r'\b(19|20)\d{2}\b', text): score += 10
+    if char_count > 3000 and len(found) < 3:
+        score -= 15
+    return score >= 20, score, found
+
+SCENARIOS = {
+    "simple CV": "Ivan Ivanov\nEmail: ivan@example.com\nExperience: 2 years in Python development.\nSkills: Python, Django, SQL.",
+    "phone and year": "John Doe. Phone: +998901234567. I am a developer with a long history. CV 2023.",
+    "russian CV": "Иван Иванов. Почта: ivan@mail.ru. Опыт работы: разработка в банке с 2018 года. Навыки: Python.",
+    "uzbek CV": "Aliyev Vali. Telefon: +998901112233. Ish tajribasi: 2019-2023. Ko'nikmalar: Java. Manzil: Toshkent.",
+    "fairy tale": "Once upon a time in a kingdom far away... " * 100,
+    "fairy tale with markers": ("Once upon a time in a career... " * 100) + " Education",
+    "junk": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed do eiusmod tempor incididunt ut labore.",
+    "too short": "Skills: Java",
+    "empty": "",
+}
+
+def test_resume_validation():
+    print("Testing resume validation...")
+
+    print("\n=== Test 1: Same decisions and scores as the substring scans ===")
+    for name, text in SCENARIOS.items():
+        validation = validate_resume(text)
+        is_resume, score, found = legacy_score(text)
+        print(f"{name}: score={validation.score} resume={validation.is_resume} markers={validation.markers}")
+        assert validation.is_resume == is_resume, name
+        assert validation.score == score, name
+        assert set(validation.markers) == found, name
+
+    print("\n=== Test 2: Structured result ===")
+    validation = validate_resume(SCENARIOS["uzbek CV"])
+    assert validation.has_phone and validation.has_years and not validation.has_email
+    assert validation.markers["ish tajribasi"] == 1 and validation.threshold == 20
+    assert "long document" in validate_resume(SCENARIOS["fairy tale"]).reason
+    assert validate_resume("").reason == "empty text"
+    assert count_markers("skills, skills and more skills") == {"skills": 3}
+
+    print("\n=== Test 3: Diagnostics are off by default ===")
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+        validate_resume(SCENARIOS["simple CV"])
+        validate_resume(SCENARIOS["junk"])
+    assert out.getvalue() == "", out.getvalue()
+
+    print("\n[SUCCESS] Resume validation verified!")
+
+if __name__ == "__main__":
+    test_resume_validation()
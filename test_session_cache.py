@@ -0,0 +1,97 @@
+import sys
+import os
+from datetime import datetime
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_cache import SessionCache
+from app.interview_flow.schemas import InterviewSession, SessionStatus, QuestionProgress
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def make_session(session_id: str, running: bool = False) -> InterviewSession:
+    current_question = None
+    if running:
+        current_question = QuestionProgress(
+            question_id=1, question_text="What is Python?", skill="python",
+            difficulty="easy", time_limit=300, started_at=datetime.now()
+        )
+    return InterviewSession(
+        session_id=session_id,
+        candidate_id="1",
+        candidate_name="Test Candidate",
+        start_time=datetime.now(),
+        status=SessionStatus.ACTIVE if running else SessionStatus.FINISHED,
+        total_questions=1,
+        current_question_index=0,
+        questions=[{"id": 1, "question": "What is Python?", "skill": "python", "difficulty": "easy"}],
+        current_question=current_question
+    )
+
+def test_session_cache():
+    print("Testing session cache...")
+    clock = FakeClock()
+    cache = SessionCache(max_size=3, ttl=60, abandoned_after=600, clock=clock)
+
+    print("\n=== Test 1: Hits and misses ===")
+    cache.put(make_session("s1"))
+    assert cache.get("s1").session_id == "s1"
+    assert cache.get("missing") is None
+    assert cache.hits == 1 and cache.misses == 1
+
+    print("\n=== Test 2: LRU eviction keeps the size bounded ===")
+    for session_id in ["s2", "s3"]:
+        cache.put(make_session(session_id))
+    cache.get("s1")  # s2 is now the least recently used
+    cache.put(make_session("s4"))
+    assert len(cache) == 3
+    assert "s2" not in cache and "s1" in cache
+    assert cache.evictions == 1
+
+    print("\n=== Test 3: Sessions with a running question are pinned ===")
+    cache = SessionCache(max_size=2, ttl=60, abandoned_after=600, clock=clock)
+    cache.put(make_session("active", running=True))
+    for i in range(5):
+        cache.put(make_session(f"done-{i}"))
+    assert "active" in cache
+    assert len(cache) == 2
+    stats = cache.stats()
+    print(f"Stats: {stats}")
+    assert stats.pinned == 1 and stats.evictions == 4
+
+    print("\n=== Test 4: TTL expiry; pinned sessions only expire once abandoned ===")
+    clock.now += 61
+    assert cache.get("done-4") is None
+    assert cache.get("active") is not None
+    clock.now += 601
+    assert cache.get("active") is None
+    stats = cache.stats()
+    assert stats.size == 0 and stats.expirations == 2
+
+    print("\n=== Test 5: Finishing unpins ===")
+    cache.put(make_session("s5", running=True))
+    cache.get("s5").current_question = None
+    clock.now += 61
+    assert cache.get("s5") is None
+
+    print("\n=== Test 6: Memory stays flat over many sessions ===")
+    cache = SessionCache(max_size=100, ttl=60, clock=clock)
+    for i in range(10000):
+        cache.put(make_session(f"h-{i}"))
+        cache.get(f"h-{i // 2}")
+        clock.now += 0.01
+    stats = cache.stats()
+    print(f"Stats: {stats}")
+    assert stats.size <= 100
+    assert stats.evictions + stats.expirations == 10000 - stats.size
+
+    print("\n[SUCCESS] Session cache verified!")
+
+if __name__ == "__main__":
+    test_session_cache()
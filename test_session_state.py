@@ -0,0 +1,182 @@
+import sys
+import os
+import time
+import sqlite3
+import tempfile
+import asyncio
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_state import InProcessSessionState, SQLiteSessionState, create_session_state_backend
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.schemas import QuestionState, SessionStatus
+from app.question_engine.schemas import Question, QuestionSet
+from app.database import engine
+from app import models
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def make_question_set() -> QuestionSet:
+    questions = [
+        Question(id=i, skill="python", difficulty="easy", type="theory", question=f"Python question {i}?")
+        for i in range(1, 4)
+    ]
+    return QuestionSet(candidate_name="State Test", candidate_level="Middle", questions=questions, total_questions=3)
+
+def check_backend(backend):
+    print(f"Backend: {backend.name} (shared: {backend.shared})")
+    state = QuestionState(session_id="s1", question_index=0, started_at=1000.0, deadline=1300.0)
+    backend.start(state)
+    assert backend.get("s1") == state
+    assert backend.get("missing") is None
+
+    next_state = QuestionState(session_id="s1", question_index=1, started_at=1100.0, deadline=1400.0)
+    assert backend.advance("s1", 0, next_state) == state
+    # A second submission for question 0 loses
+    assert backend.advance("s1", 0, next_state) is None
+    assert backend.get("s1").question_index == 1
+    assert backend.running() == 1
+
+    assert backend.advance("s1", 1, None).question_index == 1
+    assert backend.get("s1") is None
+    assert backend.running() == 0
+
+def test_session_state():
+    print("Testing session state backends...")
+    tmp_dir = tempfile.mkdtemp()
+    state_path = os.path.join(tmp_dir, "session_state.sqlite")
+
+    print("\n=== Test 1: In-process backend ===")
+    check_backend(create_session_state_backend("memory"))
+
+    print("\n=== Test 2: SQLite backend ===")
+    check_backend(create_session_state_backend("sqlite", state_path))
+    try:
+        create_session_state_backend("redis")
+        assert False, "Unknown backends should be rejected"
+    except ValueError as e:
+        print(f"Rejected: {e}")
+
+    print("\n=== Test 3: Two workers serve one interview through a shared backend ===")
+    worker_a = SessionManager(state=SQLiteSessionState(state_path))
+    worker_b = SessionManager(state=SQLiteSessionState(state_path))
+    session = asyncio.run(worker_a.create_session(
+        candidate_id="state_001",
+        candidate_name="State Test",
+        candidate_phone="+998901234567",
+        candidate_email="state.test@example.com",
+        question_set=make_question_set()
+    ))
+    session_id = session.session_id
+
+    # Worker B never saw the session
+    question = asyncio.run(worker_b.get_current_question(session_id))
+    assert question is not None and question.question_id == 1
+    assert 0 < question.time_remaining <= question.time_limit
+    asyncio.run(worker_b.submit_answer(session_id, "Lists are mutable, tuples are not."))
+
+    # Worker A has the session cached at question 0 and must catch up
+    question = asyncio.run(worker_a.get_current_question(session_id))
+    assert question.question_id == 2, question
+    asyncio.run(worker_a.submit_answer(session_id, "Decorators wrap functions."))
+
+    print("\n=== Test 4: Concurrent submissions for one question ===")
+    assert asyncio.run(worker_b.get_current_question(session_id)).question_id == 3
+    sync_session = worker_a._sync_session
+
+    async def racing_sync(session_id, state):
+        # Worker B submits while worker A is still handling its answer
+        session = await sync_session(session_id, state)
+        await worker_b.submit_answer(session_id, "Generators yield values lazily.")
+        return session
+
+    worker_a._sync_session = racing_sync
+    try:
+        asyncio.run(worker_a.submit_answer(session_id, "A duplicate submission."))
+        assert False, "Only one submission per question may win"
+    except ValueError as e:
+        print(f"Rejected: {e}")
+        assert "already been answered" in str(e)
+    worker_a._sync_session = sync_session
+
+    for worker in (worker_a, worker_b):
+        status = asyncio.run(worker.get_session_status(session_id))
+        assert status.status == SessionStatus.FINISHED
+        assert [a.question_id for a in status.answers] == [1, 2, 3]
+        assert asyncio.run(worker.get_current_question(session_id)) is None
+    print(f"Summary: {asyncio.run(worker_a.get_session_summary(session_id)).answered_questions} answers")
+
+    print("\n=== Test 5: The default in-process backend ===")
+    manager = SessionManager(state=InProcessSessionState())
+    session = asyncio.run(manager.create_session(
+        candidate_id="state_002",
+        candidate_name="State Test",
+        candidate_phone="+998901234567",
+        candidate_email="state.test@example.com",
+        question_set=make_question_set()
+    ))
+    for _ in range(3):
+        asyncio.run(manager.submit_answer(session.session_id, "An answer."))
+    assert asyncio.run(manager.get_session_summary(session.session_id)).answered_questions == 3
+
+    print("\n=== Test 6: A locked SQLite backend fails fast, off the event loop ===")
+    manager = SessionManager(state=SQLiteSessionState(state_path, busy_timeout_ms=300))
+    session = asyncio.run(manager.create_session(
+        candidate_id="state_003",
+        candidate_name="State Test",
+        candidate_phone="+998901234567",
+        candidate_email="state.test@example.com",
+        question_set=make_question_set()
+    ))
+    # Another worker holds the write lock
+    other_worker = sqlite3.connect(state_path, isolation_level=None)
+    other_worker.execute("BEGIN IMMEDIATE")
+
+    async def submit_while_locked():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        start = time.perf_counter()
+        try:
+            await manager.submit_answer(session.session_id, "An answer.")
+            assert False, "The write lock is held"
+        except sqlite3.OperationalError as e:
+            print(f"Rejected after {time.perf_counter() - start:.2f}s: {e}")
+        finally:
+            ticker.cancel()
+        return ticks, time.perf_counter() - start
+
+    ticks, elapsed = asyncio.run(submit_while_locked())
+    assert elapsed < 2, "Should give up after the busy timeout"
+    assert ticks >= 10, f"Event loop was blocked while waiting for the lock ({ticks} ticks)"
+    other_worker.execute("ROLLBACK")
+    other_worker.close()
+    asyncio.run(manager.submit_answer(session.session_id, "An answer."))
+    assert asyncio.run(manager.get_current_question(session.session_id)).question_id == 2
+
+    print("\n=== Test 7: Abandoned interviews do not stay in the in-process backend ===")
+    now = [1000.0]
+    backend = InProcessSessionState(abandoned_after=600, clock=lambda: now[0])
+    backend.start(QuestionState(session_id="left", question_index=0, started_at=1000.0, deadline=1300.0))
+    backend.start(QuestionState(session_id="slow", question_index=0, started_at=1000.0, deadline=1300.0))
+    now[0] = 1800.0  # Within the window: kept (a late answer is still accepted)
+    assert backend.get("slow") is not None and backend.running() == 2
+    backend.advance("slow", 0, QuestionState(session_id="slow", question_index=1, started_at=1800.0, deadline=2100.0))
+    now[0] = 2000.0
+    backend.start(QuestionState(session_id="new", question_index=0, started_at=2000.0, deadline=2300.0))
+    assert backend.running() == 2 and "left" not in backend._states, "Dropped once it starts another interview"
+    assert backend.get("left") is None and backend.advance("left", 0, None) is None
+    assert create_session_state_backend("memory", abandoned_after=600).abandoned_after == 600
+
+    print("\n[SUCCESS] Session state backends verified!")
+
+if __name__ == "__main__":
+    test_session_state()
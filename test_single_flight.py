@@ -0,0 +1,70 @@
+import sys
+import os
+import asyncio
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.utils.single_flight import SingleFlight
+
+async def _run_checks():
+    flight = SingleFlight()
+    runs = []
+
+    async def compute(value, delay=0.2):
+        runs.append(value)
+        await asyncio.sleep(delay)
+        if value == "bad":
+            raise ValueError("Session not found")
+        return {"value": value}
+
+    print("\n=== Test 1: Concurrent identical calls share one computation ===")
+    results = await asyncio.gather(*[flight.do(("integrity", "s1"), lambda: compute("s1")) for _ in range(5)])
+    assert runs == ["s1"], runs
+    assert all(r is results[0] for r in results)
+    assert flight.calls == 5 and flight.coalesced == 4 and flight.in_flight() == 0
+
+    print("\n=== Test 2: Different keys run separately, finished calls are not cached ===")
+    runs.clear()
+    await asyncio.gather(flight.do(("integrity", "s1"), lambda: compute("s1")), flight.do(("integrity", "s2"), lambda: compute("s2")))
+    assert sorted(runs) == ["s1", "s2"]
+    await flight.do(("integrity", "s1"), lambda: compute("s1"))
+    assert runs.count("s1") == 2
+
+    print("\n=== Test 3: Errors reach every waiter ===")
+    outcomes = await asyncio.gather(*[flight.do("bad", lambda: compute("bad")) for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(o, ValueError) for o in outcomes)
+
+    print("\n=== Test 4: A cancelled waiter leaves the computation to the others ===")
+    runs.clear()
+    first = asyncio.create_task(flight.do("cv", lambda: compute("cv", delay=0.5)))
+    second = asyncio.create_task(flight.do("cv", lambda: compute("cv", delay=0.5)))
+    await asyncio.sleep(0.1)
+    first.cancel()
+    assert (await second) == {"value": "cv"} and runs == ["cv"]
+
+    print("\n=== Test 5: The computation is cancelled with its last waiter ===")
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiters = [asyncio.create_task(flight.do("slow", slow)) for _ in range(2)]
+    await asyncio.sleep(0.1)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert flight.in_flight() == 0
+
+def test_single_flight():
+    print("Testing single-flight request coalescing...")
+    asyncio.run(_run_checks())
+    print("\n[SUCCESS] Single-flight coalescing verified!")
+
+if __name__ == "__main__":
+    test_single_flight()
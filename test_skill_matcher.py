@@ -0,0 +1,54 @@
+import sys
+import os
+import json
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.skill_matcher import SkillMatcher, build_trie_pattern
+
+def test_skill_matcher():
+    print("Testing Skill Matcher...")
+    matcher = SkillMatcher()
+
+    text = """
+    Опыт работы: Python (питон), Django и докер.
+    Frontend: React, Next.js, Node.js; также C++ и .NET.
+    Знаю k8s, ML и Spring Boot. Писал на JavaScript.
+    """
+    found = matcher.find(text)
+    print(f"Found: {sorted(found)}")
+
+    # Canonicalisation of RU spellings and abbreviations
+    for skill in ["python", "django", "docker", "kubernetes", "machine learning", "javascript"]:
+        assert skill in found, f"Should detect '{skill}'"
+    # Symbol skills match without word boundaries, and overlapping matches are kept ("node.js" + "js")
+    for skill in ["next.js", "node.js", "c++", ".net", "react", "spring boot"]:
+        assert skill in found, f"Should detect '{skill}'"
+    # Aliases never leak into the output
+    assert "питон" not in found and "k8s" not in found and "ml" not in found
+
+    # Word boundaries: "java" must not match inside "javascript", "go" not inside "good"
+    assert "java" not in found, "'java' should not match inside 'javascript'"
+    assert "go" not in matcher.find("good communication skills")
+    assert matcher.find("") == set()
+
+    print("\n=== Custom vocabulary file ===")
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+        json.dump({"version": 2, "skills": {"clickhouse": ["кликхаус"], "c++": []}}, f, ensure_ascii=False)
+        path = f.name
+    try:
+        custom = SkillMatcher(path)
+        assert custom.version == 2
+        assert custom.find("Работал с Кликхаус и C++") == {"clickhouse", "c++"}
+    finally:
+        os.remove(path)
+
+    # Trie pattern factors shared prefixes and prefers longer phrases
+    assert build_trie_pattern(["go", "golang"]) == "go(?:lang)?"
+
+    print("\n[SUCCESS] Skill Matcher verified!")
+
+if __name__ == "__main__":
+    test_skill_matcher()
@@ -0,0 +1,106 @@
+import sys
+import os
+import time
+import asyncio
+import tempfile
+import threading
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.config import settings
+from app.database import engine_options, apply_sqlite_profile, async_database_url, async_read_engine
+
+def make_engines(url: str):
+    writer = create_engine(url, **engine_options(url))
+    apply_sqlite_profile(writer)
+    read_url = async_database_url(url)
+    reader = create_async_engine(read_url, **engine_options(read_url, read_only=True))
+    apply_sqlite_profile(reader.sync_engine, read_only=True)
+    return writer, reader
+
+def pragma(conn, name: str):
+    return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+async def check_reader(reader, writer):
+    async with reader.connect() as conn:
+        assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+        assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+        try:
+            await conn.execute(text("INSERT INTO items (name) VALUES ('from the dashboard')"))
+            assert False, "The reporting engine must not write"
+        except OperationalError as e:
+            print(f"Rejected: {e.orig}")
+
+    # A candidate's write transaction is open; the dashboard still reads (the last committed rows)
+    with writer.connect() as conn:
+        conn.execute(text("INSERT INTO items (name) VALUES ('uncommitted')"))
+        start = time.perf_counter()
+        async with reader.connect() as read_conn:
+            count = (await read_conn.execute(text("SELECT COUNT(*) FROM items"))).scalar()
+        elapsed = time.perf_counter() - start
+        print(f"Read during a write: {count} rows in {elapsed * 1000:.1f}ms")
+        assert count == 1 and elapsed < 1
+        conn.commit()
+
+def test_sqlite_profile():
+    print("Testing SQLite profile...")
+    tmp_dir = tempfile.mkdtemp()
+    url = f"sqlite:///{os.path.join(tmp_dir, 'profile.db')}"
+    writer, reader = make_engines(url)
+
+    print("\n=== Test 1: Every connection gets the profile ===")
+    with writer.connect() as conn:
+        assert pragma(conn, "journal_mode") == "wal"
+        assert pragma(conn, "synchronous") == 1  # NORMAL
+        assert pragma(conn, "busy_timeout") == settings.SQLITE_BUSY_TIMEOUT_MS
+        assert pragma(conn, "mmap_size") == settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024
+        assert pragma(conn, "cache_size") == -settings.SQLITE_CACHE_SIZE_MB * 1024
+        assert pragma(conn, "query_only") == 0
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO items (name) VALUES ('committed')"))
+        conn.commit()
+    assert writer.pool.size() == settings.DB_POOL_SIZE
+    print(writer.pool.status())
+
+    print("\n=== Test 2: The read-only engine never blocks on or takes the write lock ===")
+    asyncio.run(check_reader(reader, writer))
+
+    print("\n=== Test 3: A second writer waits for the lock instead of failing ===")
+    release = threading.Event()
+
+    def hold_write_lock():
+        with writer.connect() as conn:
+            conn.execute(text("INSERT INTO items (name) VALUES ('slow writer')"))
+            release.wait()
+            conn.commit()
+
+    holder = threading.Thread(target=hold_write_lock)
+    holder.start()
+    time.sleep(0.2)
+    threading.Timer(0.5, release.set).start()
+    start = time.perf_counter()
+    with writer.connect() as conn:
+        conn.execute(text("INSERT INTO items (name) VALUES ('second writer')"))
+        conn.commit()
+    holder.join()
+    print(f"Second writer waited {time.perf_counter() - start:.2f}s")
+    with writer.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 4
+
+    print("\n=== Test 4: Engine options for Postgres ===")
+    options = engine_options("postgresql+asyncpg://hr@db/hr", read_only=True)
+    assert options["connect_args"] == {"server_settings": {"default_transaction_read_only": "on"}}
+    assert "connect_args" not in engine_options("postgresql://hr@db/hr")
+    assert options["pool_size"] == settings.DB_POOL_SIZE and options["max_overflow"] == settings.DB_MAX_OVERFLOW
+    print(f"App reporting engine: {async_read_engine.url}")
+
+    writer.dispose()
+    asyncio.run(reader.dispose())
+    print("\n[SUCCESS] SQLite profile verified!")
+
+if __name__ == "__main__":
+    test_sqlite_profile()
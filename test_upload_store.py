@@ -0,0 +1,49 @@
+import sys
+import os
+import io
+import shutil
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.upload_store import UploadStore
+from app.cv_intelligence.analysis_store import CVAnalysisStore
+from app.cv_intelligence.batch_import import FileTooLarge
+
+def test_upload_store():
+    print("Testing Content-Addressed Upload Store...")
+    work_dir = tempfile.mkdtemp()
+    try:
+        store = UploadStore(work_dir)
+        content = b"%PDF-1.4 resume bytes " * 1000
+
+        print("\n=== Test 1: Identical uploads are stored once ===")
+        cv_path_1, hash_1 = store.save(io.BytesIO(content), ".pdf")
+        cv_path_2, hash_2 = store.save(io.BytesIO(content), ".pdf")
+        assert cv_path_1 == cv_path_2 == f"uploads/{hash_1}.pdf"
+        assert os.listdir(work_dir) == [f"{hash_1}.pdf"], f"Got {os.listdir(work_dir)}"
+
+        print("\n=== Test 2: Streamed hash is the analysis store key ===")
+        assert hash_1 == CVAnalysisStore.hash_file(store.abs_path(cv_path_1))
+        assert store.content_hash(cv_path_1) == hash_1
+
+        print("\n=== Test 3: Legacy uuid-named uploads are hashed on demand ===")
+        with open(os.path.join(work_dir, "0760df48-b638-40d4-a87b-115e4bf9fa1a.pdf"), "wb") as f:
+            f.write(content)
+        assert store.content_hash("uploads/0760df48-b638-40d4-a87b-115e4bf9fa1a.pdf") == hash_1
+
+        print("\n=== Test 4: Oversized upload leaves nothing behind ===")
+        try:
+            store.save(io.BytesIO(b"x" * 2048), ".pdf", max_bytes=1024)
+            assert False, "Oversized upload should be rejected"
+        except FileTooLarge:
+            pass
+        assert not [n for n in os.listdir(work_dir) if n.startswith(".upload-")]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print("\n[SUCCESS] Content-Addressed Upload Store verified!")
+
+if __name__ == "__main__":
+    test_upload_store()
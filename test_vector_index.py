@@ -0,0 +1,47 @@
+import sys
+import os
+import numpy as np
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.cv_intelligence.vector_index import FlatIndex
+
+def test_vector_index():
+    print("Testing Flat Vector Index...")
+    rng = np.random.default_rng(42)
+    keys = rng.normal(size=(2000, 32)).astype(np.float32)
+    queries = np.vstack([
+        keys[[5, 1500, 42]] + 0.05 * rng.normal(size=(3, 32)),  # Near known keys
+        rng.normal(size=(2, 32))                                # Unrelated phrases
+    ]).astype(np.float32)
+    index = FlatIndex(keys)
+
+    print("\n=== Test 1: Best match equals a brute-force argmax ===")
+    normalized = keys / np.linalg.norm(keys, axis=1, keepdims=True)
+    expected = np.argmax((queries / np.linalg.norm(queries, axis=1, keepdims=True)) @ normalized.T, axis=1)
+    indices, scores = index.search(queries, k=1)
+    assert (indices[:, 0] == expected).all()
+    assert list(indices[:3, 0]) == [5, 1500, 42]
+
+    print("\n=== Test 2: Threshold drops weak matches ===")
+    indices, scores = index.search(queries, k=1, threshold=0.9)
+    assert list(indices[:, 0]) == [5, 1500, 42, -1, -1], f"Got {indices[:, 0]}"
+    assert np.isinf(scores[3:, 0]).all()
+
+    print("\n=== Test 3: Top-k ordered by descending score ===")
+    indices, scores = index.search(queries, k=4)
+    assert indices.shape == (5, 4)
+    assert (indices[:, 0] == expected).all()
+    assert (np.diff(scores, axis=1) <= 1e-6).all()
+
+    print("\n=== Test 4: Empty index and k larger than the index ===")
+    empty_indices, _ = FlatIndex(np.zeros((0, 0), dtype=np.float32), normalized=True).search(queries, k=3)
+    assert (empty_indices == -1).all()
+    small_indices, _ = FlatIndex(keys[:2]).search(queries, k=10)
+    assert small_indices.shape == (5, 2)
+
+    print("\n[SUCCESS] Flat Vector Index verified!")
+
+if __name__ == "__main__":
+    test_vector_index()
@@ -1,8 +1,6 @@
-from app.cv_intelligence.cv_analyzer import CVAnalyzer
+from app.cv_intelligence.validation import validate_resume
 
 def test_diagnostics():
-    analyzer = CVAnalyzer()
-    
     scenarios = {
         "Minimal Real CV": "John Doe. Email: doe@test.com. Experience: python dev.",
         "Short CV with Phone": "Jane Doe. +998901112233. Skills: Java, SQL.",
@@ -14,8 +12,10 @@ def test_diagnostics():
 
     for name, text in scenarios.items():
         print(f"\n>>> TESTING SCENARIO: {name}")
-        result = analyzer._validate_resume(text)
-        print(f"RESULT: {'PASS' if result else 'FAIL'}")
+        result = validate_resume(text)
+        print(f"Score: {result.score} (Needed: {result.threshold}), Markers: {result.markers}")
+        print(f"Has Email: {result.has_email}, Has Phone: {result.has_phone}, Has Years: {result.has_years}, Reason: {result.reason}")
+        print(f"RESULT: {'PASS' if result.is_resume else 'FAIL'}")
 
 if __name__ == "__main__":
     test_diagnostics()
@@ -0,0 +1,58 @@
+import sys
+import os
+import json
+import argparse
+import numpy as np
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.config import settings
+from app.cv_intelligence.embedding_backends import create_embedding_backend, parity_report, PARITY_PHRASES
+from app.cv_intelligence.ontology import DEFAULT_ONTOLOGY_PATH
+from app.cv_intelligence.vector_index import FlatIndex
+from app.cv_intelligence.skill_mapper import THRESHOLD
+
+def verify_parity(model_name: str, backend: str, min_cosine: float) -> bool:
+    """
+    Compares a backend against the fp32 torch backend on the fixed parity phrases:
+    per-phrase cosine, and whether each phrase maps to the same ontology concept.
+    """
+    with open(settings.ONTOLOGY_PATH or DEFAULT_ONTOLOGY_PATH, "r", encoding="utf-8") as f:
+        ontology_keys = [k.lower() for k in json.load(f)["concepts"]]
+
+    reference = create_embedding_backend("torch", model_name)
+    candidate = create_embedding_backend(
+        backend, model_name,
+        export_dir=settings.EMBEDDING_ONNX_DIR,
+        min_parity_cosine=min_cosine
+    )
+
+    report = parity_report(reference.encode(PARITY_PHRASES), candidate.encode(PARITY_PHRASES))
+    print(f"Cosine vs fp32 on {report['phrases']} phrases: min={report['min_cosine']} mean={report['mean_cosine']}")
+
+    # Same mapping decision (best concept above the SkillMapper threshold, or none)?
+    decisions = []
+    for encoder in (reference, candidate):
+        indices, _ = FlatIndex(encoder.encode(ontology_keys)).search(encoder.encode(PARITY_PHRASES), k=1, threshold=THRESHOLD)
+        decisions.append(indices[:, 0])
+    agreement = float(np.mean(decisions[0] == decisions[1]))
+    print(f"Ontology mapping agreement: {agreement:.1%}")
+    for phrase, ref_idx, cand_idx in zip(PARITY_PHRASES, decisions[0], decisions[1]):
+        if ref_idx != cand_idx:
+            ref_key = ontology_keys[ref_idx] if ref_idx >= 0 else None
+            cand_key = ontology_keys[cand_idx] if cand_idx >= 0 else None
+            print(f"  DIFF '{phrase}': fp32={ref_key} {backend}={cand_key}")
+
+    return report["min_cosine"] >= min_cosine
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Accuracy parity of an embedding backend vs fp32 torch")
+    parser.add_argument("--model", default=settings.TRANSFORMER_MODEL)
+    parser.add_argument("--backend", default="onnx-int8")
+    parser.add_argument("--min-cosine", type=float, default=settings.EMBEDDING_PARITY_MIN_COSINE)
+    args = parser.parse_args()
+
+    ok = verify_parity(args.model, args.backend, args.min_cosine)
+    print("[SUCCESS] Parity verified!" if ok else "[FAIL] Backend diverges from fp32")
+    sys.exit(0 if ok else 1)